@@ -0,0 +1,149 @@
+# Hamming SEC-DED Toplu Kodlama (NumPy)
+# Çok sayıda kelimeyi üreteç (G) ve parity-kontrol (H) matrisleriyle mod-2 matris çarpımı olarak kodlar ve çözer
+# Bit yerleşimi HammingSEC_DED.encode ile aynıdır: sütun 0 = P0, sütun i = i. pozisyon
+
+from time import perf_counter_ns
+
+import numpy as np
+
+from hamming_core import NO_ERROR, P0_CORRECTED, SINGLE_CORRECTED, DOUBLE_DETECTED
+
+# Büyük girdilerde bellek kullanımını sınırlamak için satırlar bu boyutta parçalar halinde işlenir
+CHUNK_ROWS = 1 << 16
+
+# G matrisi d x (n+1) float32 olarak yoğun tutulur (d = 65528 için ~16 GB); daha büyük kelimeler
+# toplu yol yerine encode_int/decode_int (hamming_codegen) ile işlenmelidir
+MAX_DATA_BITS = 4096
+
+# Her veri boyutu için matrisler bir kez oluşturulur
+_matrix_cache = {}
+
+# hamming_metrics etkinleştirildiğinde ayarlanan gözlemci; None iken çağrı başına tek bir karşılaştırma maliyeti vardır
+_observer = None
+
+
+def _matrices(codec):
+    # (G, H, veri sütunları) üçlüsünü döndürür
+    # G: d x (n+1) üreteç matrisi, H: (n+1) x (p+1) parity-kontrol matrisi
+    # H'nin ilk p sütunu sendrom bitlerini, son sütunu genel parity (P0) kontrolünü verir
+    cached = _matrix_cache.get(codec.d_bits)
+    if cached is not None:
+        return cached
+
+    n = codec.total_bits
+    p = codec.p_bits
+    data_cols = np.array(codec.data_positions, dtype=np.intp)
+
+    generator = np.zeros((codec.d_bits, n + 1), dtype=np.float32)
+    for row, pos in enumerate(codec.data_positions):
+        generator[row, pos] = 1
+        for k in range(p):
+            if pos & (1 << k):
+                generator[row, 1 << k] = 1
+        # P0, satırdaki diğer 1'lerin paritesidir
+        generator[row, 0] = generator[row, 1:].sum() % 2
+
+    check = np.zeros((n + 1, p + 1), dtype=np.float32)
+    positions = np.arange(n + 1)
+    for k in range(p):
+        check[1:, k] = (positions[1:] >> k) & 1
+    check[:, p] = 1
+
+    cached = (generator, check, data_cols)
+    _matrix_cache[codec.d_bits] = cached
+    return cached
+
+
+def generator_matrix(codec):
+    # Üreteç matrisini 0/1 uint8 dizisi olarak döndürür
+    return _matrices(codec)[0].astype(np.uint8)
+
+
+def parity_check_matrix(codec):
+    # Parity-kontrol matrisini 0/1 uint8 dizisi olarak döndürür
+    return _matrices(codec)[1].astype(np.uint8)
+
+
+def _as_bits(array, width, packed, name):
+    # Girdiyi (satır sayısı x width) boyutunda 0/1 uint8 dizisine dönüştürür
+    array = np.asarray(array, dtype=np.uint8)
+    if array.ndim != 2:
+        raise ValueError(f"{name} iki boyutlu bir dizi olmalıdır.")
+    if packed:
+        if array.shape[1] != (width + 7) // 8:
+            raise ValueError(f"Paketlenmiş {name} satır başına {(width + 7) // 8} bayt olmalıdır.")
+        return np.unpackbits(array, axis=1, count=width)
+    if array.shape[1] != width:
+        raise ValueError(f"{name} satır başına {width} bit olmalıdır.")
+    if array.size and array.max() > 1:
+        raise ValueError(f"{name} sadece 0 ve 1 içermelidir.")
+    return array
+
+
+def _mod2_product(bits, matrix):
+    # Mod-2 matris çarpımı; float32 BLAS çarpımı 2^24'e kadar tam sonuç verir
+    return (bits.astype(np.float32) @ matrix).astype(np.uint32) & 1
+
+
+def encode_batch(codec, data, packed=False):
+    # data: her satırı bir veri kelimesi olan 2 boyutlu dizi (bitler veya packed=True ise np.packbits baytları)
+    # Dönüş: her satırı bir kod kelimesi olan dizi (aynı biçimde)
+    observer = _observer
+    start_ns = perf_counter_ns() if observer is not None else 0
+    generator, _, _ = _matrices(codec)
+    data = _as_bits(data, codec.d_bits, packed, "Veri")
+
+    codewords = np.empty((data.shape[0], codec.total_bits + 1), dtype=np.uint8)
+    for start in range(0, data.shape[0], CHUNK_ROWS):
+        chunk = data[start:start + CHUNK_ROWS]
+        codewords[start:start + CHUNK_ROWS] = _mod2_product(chunk, generator)
+    if observer is not None:
+        observer.observe_batch("encode_batch", codec.d_bits, perf_counter_ns() - start_ns, data.shape[0])
+    return np.packbits(codewords, axis=1) if packed else codewords
+
+
+def decode_batch(codec, codewords, packed=False):
+    # codewords: her satırı bir kod kelimesi olan 2 boyutlu dizi
+    # Dönüş: sendrom, durum kodu, hata pozisyonu (check_and_correct ile aynı anlamda),
+    # düzeltilmiş veri ve düzeltilmiş kod kelimesi (P0 dahil)
+    observer = _observer
+    start_ns = perf_counter_ns() if observer is not None else 0
+    _, check, data_cols = _matrices(codec)
+    n = codec.total_bits
+    p = codec.p_bits
+    codewords = _as_bits(codewords, n + 1, packed, "Kod")
+    rows = codewords.shape[0]
+    weights = (1 << np.arange(p)).astype(np.int64)
+
+    syndrome = np.empty(rows, dtype=np.int64)
+    status = np.empty(rows, dtype=np.uint8)
+    error_pos = np.empty(rows, dtype=np.int64)
+    corrected = codewords.copy()
+
+    for start in range(0, rows, CHUNK_ROWS):
+        stop = min(start + CHUNK_ROWS, rows)
+        checks = _mod2_product(codewords[start:stop], check)
+        s = checks[:, :p].astype(np.int64) @ weights
+        mismatch = checks[:, p].astype(bool)
+        syndrome[start:stop] = s
+
+        # Durum tablosu: sendrom 0 ve P0 uyumlu -> hata yok, sendrom 0 ve uyumsuz -> P0 hatası,
+        # sendrom != 0 ve uyumsuz -> tek hata, sendrom != 0 ve uyumlu -> çift hata
+        zero = s == 0
+        status[start:stop] = np.where(zero, np.where(mismatch, P0_CORRECTED, NO_ERROR),
+                                      np.where(mismatch, SINGLE_CORRECTED, DOUBLE_DETECTED))
+        error_pos[start:stop] = np.where(zero, np.where(mismatch, -1, 0), np.where(mismatch, s, -2))
+
+        # Hatalı biti düzelt (P0 hatasında sendrom 0 olduğundan sütun 0 çevrilir)
+        # Kod uzunluğunu aşan sendromlar için düzeltme yapılmaz (skaler kod ile aynı)
+        fix = np.nonzero(mismatch & (s <= n))[0]
+        corrected[start + fix, s[fix]] ^= 1
+
+    corrected_data = corrected[:, data_cols]
+    if packed:
+        corrected_data = np.packbits(corrected_data, axis=1)
+        corrected = np.packbits(corrected, axis=1)
+    if observer is not None:
+        observer.observe_batch("decode_batch", codec.d_bits, perf_counter_ns() - start_ns, rows, status, syndrome)
+    return {"syndrome": syndrome, "status": status, "error_pos": error_pos,
+            "corrected_data": corrected_data, "corrected_codeword": corrected}
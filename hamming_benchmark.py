@@ -0,0 +1,186 @@
+# Hamming SEC-DED Performans Ölçümü
+# HammingSEC_DED kodlama ve hata düzeltme hızını farklı veri boyutları ve hata durumları için ölçer
+# Sonuçlar JSON olarak yazılır; --compare ile kayıtlı bir temel ölçüme göre yavaşlamalar işaretlenir
+# --code hsiao ile aynı ölçümler Hsiao kodu için yapılır (anahtarlar "hsiao." ile başlar)
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from hamming_core import HammingSEC_DED
+from hamming_hsiao import HsiaoSEC_DED
+
+DEFAULT_SIZES = [8, 16, 32, 64, 128, 256, 1024]
+OUTCOMES = ["none", "p0", "single", "double"]
+ENGINES = ["str", "int", "batch", "slice"]
+CODES = {"hamming": HammingSEC_DED, "hsiao": HsiaoSEC_DED}
+
+# Her ölçümde kullanılan farklı kelime sayısı ve toplu işlemde bir çağrıdaki kelime sayısı
+SAMPLE_WORDS = 256
+BATCH_WORDS = 4096
+
+
+def _percentile(sorted_values, q):
+    # Sıralı listeden en yakın sıra yöntemiyle yüzdelik değer
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def _measure(func, inputs, words_per_call, min_time):
+    # func'ı girdiler üzerinde döngüyle en az min_time saniye çağırır, çağrı başına gecikmeleri toplar
+    latencies = []
+    clock = time.perf_counter_ns
+    deadline = clock() + int(min_time * 1e9)
+    while clock() < deadline or not latencies:
+        for item in inputs:
+            start = clock()
+            func(item)
+            latencies.append(clock() - start)
+    latencies.sort()
+    total_s = sum(latencies) / 1e9
+    return {
+        "calls": len(latencies),
+        "words_per_s": len(latencies) * words_per_call / total_s,
+        "p50_ns": _percentile(latencies, 50),
+        "p90_ns": _percentile(latencies, 90),
+        "p99_ns": _percentile(latencies, 99),
+    }
+
+
+def _corrupt(codeword, outcome, total_bits, rng):
+    # Kod kelimesi string'ine istenen hata durumunu uygular
+    if outcome == "none":
+        return codeword
+    if outcome == "p0":
+        flips = [0]
+    elif outcome == "single":
+        flips = [rng.randrange(1, total_bits + 1)]
+    else:
+        flips = rng.sample(range(total_bits + 1), 2)
+    bits = list(codeword)
+    for i in flips:
+        bits[i] = "1" if bits[i] == "0" else "0"
+    return "".join(bits)
+
+
+def _batch_arrays(codec, words, outcome, rng):
+    # Toplu işlem ölçümü için veri ve kod kelimesi dizileri oluşturur
+    import numpy as np
+    data = np.array([[int(c) for c in w] for w in words], dtype=np.uint8)
+    data = np.resize(data, (BATCH_WORDS, codec.d_bits))
+    codewords = codec.encode_batch(data)
+    corrupted = np.array([[int(c) for c in _corrupt("".join(map(str, row)), outcome, codec.total_bits, rng)]
+                          for row in codewords[:SAMPLE_WORDS]], dtype=np.uint8)
+    return data, np.resize(corrupted, codewords.shape)
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, engines=ENGINES, min_time=0.2, seed=0, log=None, code="hamming"):
+    # Ölçümleri çalıştırır; anahtar "motor.işlem.d_bits.durum" biçimindedir
+    # Hsiao kodunda P0 olmadığı için "p0" durumu ilk veri bitindeki tek hatadır
+    results = {}
+    if "batch" in engines or "slice" in engines:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            engines = [e for e in engines if e not in ("batch", "slice")]
+    if code != "hamming":
+        # Bit dilimli motor sadece klasik Hamming yerleşimini destekler
+        engines = [e for e in engines if e != "slice"]
+    for d_bits in sizes:
+        codec = CODES[code](d_bits)
+        rng = random.Random(seed + d_bits)
+        words = ["".join(rng.choice("01") for _ in range(d_bits)) for _ in range(SAMPLE_WORDS)]
+        encoded = [codec.encode(w) for w in words]
+        cases = []
+        for engine in engines:
+            if engine == "str":
+                cases.append(("str.encode", None, codec.encode, words, 1))
+                for outcome in OUTCOMES:
+                    received = [_corrupt(c, outcome, codec.total_bits, rng) for c in encoded]
+                    cases.append(("str.check_and_correct", outcome, codec.check_and_correct, received, 1))
+            elif engine == "int":
+                cases.append(("int.encode_int", None, codec.encode_int, [int(w, 2) for w in words], 1))
+                for outcome in OUTCOMES:
+                    received = [int(_corrupt(c, outcome, codec.total_bits, rng), 2) for c in encoded]
+                    cases.append(("int.decode_int", outcome, codec.decode_int, received, 1))
+            elif engine == "batch":
+                for outcome in OUTCOMES:
+                    data, received = _batch_arrays(codec, words, outcome, rng)
+                    if outcome == "none":
+                        cases.append(("batch.encode_batch", None, codec.encode_batch, [data], BATCH_WORDS))
+                    cases.append(("batch.decode_batch", outcome, codec.decode_batch, [received], BATCH_WORDS))
+            elif engine == "slice":
+                from hamming_bitslice import encode_sliced, decode_sliced
+                for outcome in OUTCOMES:
+                    data, received = _batch_arrays(codec, words, outcome, rng)
+                    if outcome == "none":
+                        cases.append(("slice.encode_sliced", None, lambda x, c=codec: encode_sliced(c, x), [data],
+                                      BATCH_WORDS))
+                    cases.append(("slice.decode_sliced", outcome, lambda x, c=codec: decode_sliced(c, x), [received],
+                                  BATCH_WORDS))
+        for name, outcome, func, inputs, words_per_call in cases:
+            key = ("" if code == "hamming" else f"{code}.") + f"{name}.{d_bits}" + (f".{outcome}" if outcome else "")
+            stats = _measure(func, inputs, words_per_call, min_time)
+            stats["bits_per_s"] = stats["words_per_s"] * d_bits
+            results[key] = stats
+            if log:
+                log(key, stats)
+    return {
+        "meta": {"python": sys.version.split()[0], "platform": platform.platform(),
+                 "time": time.strftime("%Y-%m-%dT%H:%M:%S"), "min_time": min_time, "code": code},
+        "results": results,
+    }
+
+
+def compare(current, baseline, threshold=0.10):
+    # Her ölçüm için hız oranını hesaplar; hız threshold oranından fazla düştüyse gerileme olarak işaretler
+    rows = []
+    for key, stats in current["results"].items():
+        base = baseline["results"].get(key)
+        if base is None:
+            continue
+        ratio = stats["words_per_s"] / base["words_per_s"]
+        rows.append((key, base["words_per_s"], stats["words_per_s"], ratio, ratio < 1 - threshold))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hamming SEC-DED performans ölçümü")
+    parser.add_argument("-s", "--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("-e", "--engines", choices=ENGINES, nargs="+", default=ENGINES)
+    parser.add_argument("--code", choices=list(CODES), default="hamming", help="Ölçülecek kod türü")
+    parser.add_argument("-t", "--min-time", type=float, default=0.2, help="Ölçüm başına en az süre (saniye)")
+    parser.add_argument("-o", "--output", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("-c", "--compare", help="Karşılaştırılacak temel JSON dosyası")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Gerileme eşiği (varsayılan %%10)")
+    args = parser.parse_args(argv)
+
+    def log(key, stats):
+        print(f"{key:<40} {stats['words_per_s']:>14,.0f} kelime/s {stats['bits_per_s']:>16,.0f} bit/s "
+              f"p50={stats['p50_ns']}ns p99={stats['p99_ns']}ns", flush=True)
+
+    current = run_benchmarks(args.sizes, args.engines, args.min_time, log=log, code=args.code)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = 0
+        print()
+        for key, base, now, ratio, regressed in compare(current, baseline, args.threshold):
+            mark = "GERİLEME" if regressed else ""
+            regressions += regressed
+            print(f"{key:<40} {base:>14,.0f} -> {now:>14,.0f} kelime/s  x{ratio:.2f} {mark}")
+        if regressions:
+            print(f"\n{regressions} ölçümde gerileme var.")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
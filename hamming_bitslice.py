@@ -0,0 +1,143 @@
+# Hamming SEC-DED Bit Dilimli (Bit-Sliced) Kodlayıcı (NumPy)
+# 64 kelimelik bloklar bit düzlemlerine çevrilir: düzlem k'nın her uint64 elemanı, bir bloktaki 64 kelimenin
+# k. bitini tutar (kelime j -> bit j). Her parity ve sendrom biti düzlemler üzerinde birkaç XOR ile hesaplanır,
+# yani tek bir işlem 64 kelimeyi birden işler; küçük kelimelerde (8/16/32 bit) kelime başına maliyet azalır
+# Tek hata düzeltmesi sendrom düzlemlerinden ikili bir kod çözücü ağacıyla elde edilen tekil (one-hot) düzlemlerle yapılır
+# Girdi/çıktı biçimi ve dönüş değerleri hamming_batch.encode_batch / decode_batch ile aynıdır
+
+from time import perf_counter_ns
+
+import numpy as np
+
+import hamming_batch
+from hamming_batch import _as_bits
+from hamming_core import P0_CORRECTED, SINGLE_CORRECTED, DOUBLE_DETECTED
+
+LANE = 64
+# Bir parçada tutulacak en fazla düzlem elemanı (uint64); büyük kelimelerde parça başına blok sayısı küçülür
+# Maliyetin çoğu satır <-> düzlem dönüşümündedir; parçanın önbellekte kalması bu dönüşümü belirgin hızlandırır
+CHUNK_ELEMENTS = 1 << 16
+
+# Durum kodu -> hata pozisyonu (tek hata dışındaki durumlar için)
+_STATUS_ERROR_POS = np.zeros(4, dtype=np.int64)
+_STATUS_ERROR_POS[P0_CORRECTED] = -1
+_STATUS_ERROR_POS[DOUBLE_DETECTED] = -2
+
+# Her veri boyutu için düzlem indeksleri bir kez hesaplanır
+_plan_cache = {}
+
+
+def _plan(codec):
+    # (veri pozisyonları, her parity bitinin kapsadığı veri pozisyonları, her sendrom bitinin kapsadığı pozisyonlar)
+    cached = _plan_cache.get(codec.d_bits)
+    if cached is not None:
+        return cached
+    n = codec.total_bits
+    data_cols = np.array(codec.data_positions, dtype=np.intp)
+    parity_inputs = [data_cols[(data_cols >> k) & 1 == 1] for k in range(codec.p_bits)]
+    positions = np.arange(1, n + 1)
+    syndrome_inputs = [positions[(positions >> k) & 1 == 1] for k in range(codec.p_bits)]
+    cached = (data_cols, parity_inputs, syndrome_inputs)
+    _plan_cache[codec.d_bits] = cached
+    return cached
+
+
+def to_planes(bits):
+    # (satır x w) 0/1 dizisini (w x blok) uint64 düzlemlerine çevirir; satır sayısı 64'ün katına 0 ile tamamlanır
+    # Önce sütunlar satıra çevrilir, böylece paketleme bitişik bellek üzerinde yapılır
+    rows, width = bits.shape
+    blocks = -(-rows // LANE)
+    columns = np.zeros((width, blocks * LANE), dtype=np.uint8)
+    columns[:, :rows] = bits.T
+    return np.packbits(columns, axis=1, bitorder="little").view("<u8")
+
+
+def from_planes(planes, rows):
+    # to_planes'in tersi: (w x blok) düzlemlerinden ilk rows satırı (satır x w) 0/1 dizisi olarak döndürür
+    columns = np.unpackbits(np.ascontiguousarray(planes).view(np.uint8), axis=1, count=rows, bitorder="little")
+    return columns.T
+
+
+def _xor_planes(planes, index):
+    return np.bitwise_xor.reduce(planes[index], axis=0)
+
+
+def _chunk_rows(planes_per_row):
+    # Parça başına satır sayısı (64'ün katı)
+    return max(1, CHUNK_ELEMENTS // planes_per_row) * LANE
+
+
+def encode_sliced(codec, data, packed=False):
+    # data: her satırı bir veri kelimesi olan 2 boyutlu dizi; dönüş hamming_batch.encode_batch ile aynı
+    observer = hamming_batch._observer
+    start_ns = perf_counter_ns() if observer is not None else 0
+    data_cols, parity_inputs, _ = _plan(codec)
+    data = _as_bits(data, codec.d_bits, packed, "Veri")
+    rows = data.shape[0]
+    n = codec.total_bits
+
+    codewords = np.empty((rows, n + 1), dtype=np.uint8)
+    step = _chunk_rows(n + 1)
+    for start in range(0, rows, step):
+        chunk = data[start:start + step]
+        planes = np.zeros((n + 1, -(-len(chunk) // LANE)), dtype=np.uint64)
+        planes[data_cols] = to_planes(chunk)
+        for k, index in enumerate(parity_inputs):
+            planes[1 << k] = _xor_planes(planes, index)
+        planes[0] = np.bitwise_xor.reduce(planes[1:], axis=0)
+        codewords[start:start + step] = from_planes(planes, len(chunk))
+    if observer is not None:
+        observer.observe_batch("encode_sliced", codec.d_bits, perf_counter_ns() - start_ns, rows)
+    return np.packbits(codewords, axis=1) if packed else codewords
+
+
+def decode_sliced(codec, codewords, packed=False):
+    # codewords: her satırı bir kod kelimesi olan 2 boyutlu dizi; dönüş hamming_batch.decode_batch ile aynı
+    observer = hamming_batch._observer
+    start_ns = perf_counter_ns() if observer is not None else 0
+    data_cols, _, syndrome_inputs = _plan(codec)
+    n = codec.total_bits
+    p = codec.p_bits
+    codewords = _as_bits(codewords, n + 1, packed, "Kod")
+    rows = codewords.shape[0]
+    weights = (1 << np.arange(p)).astype(np.int64)
+
+    syndrome = np.empty(rows, dtype=np.int64)
+    status = np.empty(rows, dtype=np.uint8)
+    corrected = np.empty_like(codewords)
+    # Kod çözücü ağacı 2^p tekil düzlem üretir
+    step = _chunk_rows(n + 1 + (1 << p))
+    for start in range(0, rows, step):
+        stop = min(start + step, rows)
+        planes = to_planes(codewords[start:stop])
+        s = [_xor_planes(planes, index) for index in syndrome_inputs]
+        mismatch = np.bitwise_xor.reduce(planes, axis=0)
+
+        # one_hot[v]: sendromu v olan kelimelerin düzlemi
+        one_hot = [np.full_like(mismatch, np.uint64(0xFFFFFFFFFFFFFFFF))]
+        for plane in s:
+            inverse = ~plane
+            one_hot = [x & inverse for x in one_hot] + [x & plane for x in one_hot]
+        # Uyuşmazlık varsa sendromun gösterdiği biti çevir (sendrom 0 -> P0); n'yi aşan sendromlar düzeltilmez
+        for pos in range(n + 1):
+            planes[pos] ^= one_hot[pos] & mismatch
+
+        # Durum kodu iki düzlemde: bit 1 = sendrom sıfırdan farklı, bit 0 = uyuşmazlık XOR bit 1
+        # (00 hata yok, 01 P0, 10 tek hata, 11 çift hata); sendrom ve durum tek seferde satırlara çevrilir
+        nonzero = ~one_hot[0]
+        bits = from_planes(np.stack(s + [mismatch ^ nonzero, nonzero]), stop - start).astype(np.int64)
+        syndrome[start:stop] = bits[:, :p] @ weights
+        status[start:stop] = bits[:, p] + 2 * bits[:, p + 1]
+        corrected[start:stop] = from_planes(planes, stop - start)
+
+    # Tek hatada hata pozisyonu sendromdur, diğer durumlar sabittir
+    error_pos = np.where(status == SINGLE_CORRECTED, syndrome, _STATUS_ERROR_POS[status])
+    corrected_data = corrected[:, data_cols]
+    if packed:
+        corrected_data = np.packbits(corrected_data, axis=1)
+        corrected = np.packbits(corrected, axis=1)
+    if observer is not None:
+        observer.observe_batch("decode_sliced", codec.d_bits, perf_counter_ns() - start_ns, rows,
+                               status, syndrome)
+    return {"syndrome": syndrome, "status": status, "error_pos": error_pos,
+            "corrected_data": corrected_data, "corrected_codeword": corrected}
@@ -0,0 +1,128 @@
+# Hamming SEC-DED Boyuta Özel Kod Üretimi
+# Her d_bits için encode/sendrom/çözme fonksiyonlarının düz (döngüsüz) Python kaynağını üretir ve derler
+# Maskeler, kaydırma miktarları ve veri blokları sabit olarak koda gömülür: her parity biti sabit bir maskenin
+# paritesi, sendrom da sabit bit çıkarımlarının birleşimidir; çalışma anında pozisyonlar üzerinde döngü yoktur
+# HammingSEC_DED bu fonksiyonları kendiliğinden kullanır; üretilen modüller boyut başına bir kez oluşturulur
+# HAMMING_CODEGEN_CACHE ortam değişkeni (veya cache_dir) bir dizin gösterirse kaynak oraya yazılır ve sonraki
+# açılışlarda normal bir modül gibi (derlenmiş .pyc önbelleğiyle) yüklenir
+
+import os
+import types
+
+# Üretilen kaynağın biçimi değiştiğinde artırılır; farklı sürümle yazılmış dosyalar yeniden üretilir
+CODEGEN_VERSION = 1
+CACHE_DIR = os.environ.get("HAMMING_CODEGEN_CACHE")
+
+# d_bits -> üretilmiş modül
+_kernels = {}
+
+
+def _parity_terms(var, masks):
+    # Her (maske, kaydırma) için "(((var & maske).bit_count() & 1) << kaydırma)" terimi
+    terms = []
+    for mask, shift in masks:
+        term = f"(({var} & {mask:#x}).bit_count() & 1)"
+        terms.append(f"({term} << {shift})" if shift else term)
+    return "\n            | ".join(terms)
+
+
+def _field_terms(var, fields):
+    # Her (kaynak kaydırma, uzunluk, hedef kaydırma) için bir bit bloğu taşıma terimi
+    terms = []
+    for src, length, dst in fields:
+        term = f"(({var} >> {src}) & {(1 << length) - 1:#x})" if src else f"({var} & {(1 << length) - 1:#x})"
+        terms.append(f"({term} << {dst})" if dst else term)
+    return "\n            | ".join(terms)
+
+
+def generate_source(codec):
+    # codec: HammingSEC_DED örneği (tabloları oluşturulmuş)
+    d = codec.d_bits
+    n = codec.total_bits
+    segments = codec._data_segments
+    # Parity biti 2^k: kodlamada pozisyonuna yazılır, sendromda k. bite yazılır
+    encode_masks = [(mask, codec._bit_shift(p_pos)) for p_pos, mask in codec.parity_masks]
+    syndrome_masks = [(mask, p_pos.bit_length() - 1) for p_pos, mask in codec.parity_masks]
+    extract = [(code_shift, length, data_shift) for data_shift, length, code_shift in segments]
+    return f'''# Otomatik üretildi (hamming_codegen), elle düzenlemeyin
+# d_bits = {d}, toplam bit = {n + 1}
+
+CODEGEN_VERSION = {CODEGEN_VERSION}
+D_BITS = {d}
+# Sendrom tablosu (HammingSEC_DED._syndrome_actions); yükleyici tarafından atanır
+ACTIONS = None
+
+
+def encode_int(data):
+    if data < 0 or data >> {d}:
+        raise ValueError("Veri 0 ile 2^{d} - 1 arasında olmalıdır.")
+    code = ({_field_terms("data", segments)})
+    # Parity maskeleri diğer parity pozisyonlarını içermediği için tüm parity bitleri aynı anda hesaplanır
+    code |= ({_parity_terms("code", encode_masks)})
+    return code | ((code.bit_count() & 1) << {n})
+
+
+def extract_data(codeword):
+    return ({_field_terms("codeword", extract)})
+
+
+def syndrome(code):
+    return ({_parity_terms("code", syndrome_masks)})
+
+
+def lookup(received):
+    code = received & {codec._body_mask:#x}
+    s = ({_parity_terms("code", syndrome_masks)})
+    return s, ACTIONS[(s << 1) | ((received >> {n}) ^ (code.bit_count() & 1))]
+'''
+
+
+def _compile(codec, source):
+    module = types.ModuleType(f"hamming_codegen_{codec.d_bits}")
+    exec(compile(source, f"<hamming_codegen d_bits={codec.d_bits}>", "exec"), module.__dict__)
+    return module
+
+
+def _import(codec, path):
+    # Dosyadan normal modül olarak yükler (.pyc önbelleği Python tarafından tutulur); geçersizse None
+    # importlib.util sadece önbellek dizini kullanıldığında yüklenir (içe aktarma maliyeti)
+    import importlib.util
+    try:
+        spec = importlib.util.spec_from_file_location(f"hamming_codegen_{codec.d_bits}", path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    except (OSError, SyntaxError, ImportError):
+        return None
+    if getattr(module, "CODEGEN_VERSION", None) != CODEGEN_VERSION or getattr(module, "D_BITS", None) != codec.d_bits:
+        return None
+    return module
+
+
+def _load(codec, cache_dir):
+    # Önbellekteki modülü yükler; yoksa veya sürümü farklıysa üretip yazar
+    # Dizine yazılamıyorsa bellekte derlenmiş modül döndürülür (kalıcılık isteğe bağlıdır)
+    path = os.path.join(cache_dir, f"hamming_codegen_{codec.d_bits}.py")
+    module = _import(codec, path) if os.path.exists(path) else None
+    if module is not None:
+        return module
+    source = generate_source(codec)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        temp = f"{path}.{os.getpid()}.tmp"
+        with open(temp, "w", encoding="utf-8") as f:
+            f.write(source)
+        os.replace(temp, path)
+    except OSError:
+        return _compile(codec, source)
+    return _import(codec, path) or _compile(codec, source)
+
+
+def kernels(codec, cache_dir=None):
+    # codec boyutu için üretilmiş modülü döndürür (encode_int, extract_data, syndrome, lookup)
+    module = _kernels.get(codec.d_bits)
+    if module is None:
+        cache_dir = cache_dir or CACHE_DIR
+        module = _load(codec, cache_dir) if cache_dir else _compile(codec, generate_source(codec))
+        module.ACTIONS = codec._syndrome_actions
+        _kernels[codec.d_bits] = module
+    return module
@@ -0,0 +1,266 @@
+# Hamming SEC-DED Rastgele Erişimli Kapsayıcı Dosya
+# Kodlanmış veriyi sabit boyutlu bloklar halinde saklar; okuyucu dosyayı mmap ile açar ve istenen bayt aralığını
+# sadece onu kapsayan kod kelimelerini çözerek döndürür (tüm dosya okunmaz, kod kelimeleri kopyalanmadan çözülür)
+# verify komutu tüm blokları çözüp blok indeksindeki CRC ile karşılaştırır, scrub komutu ayrıca düzeltilen
+# blokları dosyada yerinde yeniden yazar
+#
+# Dosya biçimi:
+#   başlık (HEADER_SIZE bayt): CONTAINER_MAGIC | kod türü (1) | boş (1) | d_bits (2) | blok başına kelime (4) |
+#                              veri uzunluğu (8) | blok sayısı (8) | indeks konumu (8)
+#   bloklar: her biri blok başına kelime x kod kelimesi baytı; son blok sıfır veriyle tamamlanır
+#   blok indeksi: her blok için çözülmüş verinin CRC32 değeri (4 bayt)
+# Kod kelimeleri hamming_stream ile aynı biçimdedir (ceil((n+1)/8) bayt, np.packbits yerleşimi)
+
+import argparse
+import mmap
+import struct
+import sys
+import zlib
+
+from hamming_core import HammingSEC_DED, P0_CORRECTED, SINGLE_CORRECTED, DOUBLE_DETECTED, status_code
+from hamming_hsiao import HsiaoSEC_DED
+from hamming_stream import STREAM_CHUNK_SIZE, _batch_module, _stream_layout, _encode_block, _decode_block, read_chunks
+
+CONTAINER_MAGIC = b"HSC\x01"
+HEADER = struct.Struct(">4sBxHIQQQ")
+HEADER_SIZE = 64
+# Kod türleri; başlıkta listedeki indeks saklanır
+CODE_TYPES = {"hamming": HammingSEC_DED, "hsiao": HsiaoSEC_DED}
+DEFAULT_BLOCK_WORDS = 4096
+
+
+def write_container(path, chunks, d_bits=64, code="hamming", block_words=DEFAULT_BLOCK_WORDS):
+    # Veri parçalarını kodlayıp kapsayıcı dosyaya yazar; bellek kullanımı blok boyutuyla sınırlıdır
+    if code not in CODE_TYPES:
+        raise ValueError(f"Bilinmeyen kod türü: {code}")
+    if block_words <= 0:
+        raise ValueError("Blok başına kelime sayısı pozitif olmalıdır.")
+    if d_bits <= 0 or d_bits >= 1 << 16:
+        raise ValueError("Veri biti sayısı 8'in katı ve 65536'dan küçük olmalıdır.")
+    codec = CODE_TYPES[code](d_bits)
+    word_bytes, _, _ = _stream_layout(codec)
+    block_bytes = block_words * word_bytes
+    batch = _batch_module(codec)
+    crcs = []
+    length = 0
+
+    with open(path, "wb") as f:
+        f.write(bytes(HEADER_SIZE))
+        buffer = bytearray()
+        for chunk in chunks:
+            buffer += chunk
+            length += len(chunk)
+            full = len(buffer) - len(buffer) % block_bytes
+            for start in range(0, full, block_bytes):
+                block = buffer[start:start + block_bytes]
+                crcs.append(zlib.crc32(block))
+                f.write(_encode_block(codec, block, batch))
+            del buffer[:full]
+        if buffer:
+            buffer += bytes(block_bytes - len(buffer))
+            crcs.append(zlib.crc32(buffer))
+            f.write(_encode_block(codec, buffer, batch))
+        index_offset = f.tell()
+        f.write(b"".join(crc.to_bytes(4, "big") for crc in crcs))
+        f.seek(0)
+        f.write(HEADER.pack(CONTAINER_MAGIC, list(CODE_TYPES).index(code), d_bits, block_words, length, len(crcs),
+                            index_offset))
+    return {"blocks": len(crcs), "bytes": length}
+
+
+class ContainerReader:
+    # writable=True ise dosya yazılabilir mmap ile açılır (scrub için gerekir)
+    def __init__(self, path, writable=False):
+        self._file = open(path, "r+b" if writable else "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("Geçersiz kapsayıcı dosyası.")
+        self.writable = writable
+        try:
+            self._parse_header()
+        except ValueError:
+            self.close()
+            raise
+
+    def _parse_header(self):
+        if len(self._mmap) < HEADER_SIZE:
+            raise ValueError("Geçersiz kapsayıcı dosyası.")
+        magic, code, d_bits, block_words, length, blocks, index_offset = HEADER.unpack_from(self._mmap)
+        if magic != CONTAINER_MAGIC or code >= len(CODE_TYPES) or not d_bits or not block_words:
+            raise ValueError("Geçersiz kapsayıcı dosyası başlığı.")
+        self.code = list(CODE_TYPES)[code]
+        self.codec = CODE_TYPES[self.code](d_bits)
+        self.word_bytes, self.code_bytes, _ = _stream_layout(self.codec)
+        self.block_words = block_words
+        self.block_size = block_words * self.code_bytes
+        self.data_length = length
+        self.block_count = blocks
+        if (blocks * block_words * self.word_bytes < length or index_offset != HEADER_SIZE + blocks * self.block_size
+                or len(self._mmap) < index_offset + 4 * blocks):
+            raise ValueError("Kapsayıcı dosyası eksik veya bozuk.")
+        # Blok indeksi küçüktür; kopyası tutulur
+        self._index = self._mmap[index_offset:index_offset + 4 * blocks]
+        self._batch = _batch_module(self.codec)
+
+    def close(self):
+        # read ile dönen veriler kopyadır; codewords ile alınan görünümler kapatmadan önce bırakılmalıdır
+        self._mmap.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return self.data_length
+
+    def block_crc(self, index):
+        return int.from_bytes(self._index[4 * index:4 * index + 4], "big")
+
+    def codewords(self, first_word, count):
+        # Kod kelimelerinin dosyadaki baytlarına kopyasız görünüm (memoryview)
+        start = HEADER_SIZE + first_word * self.code_bytes
+        return memoryview(self._mmap)[start:start + count * self.code_bytes]
+
+    def read(self, start=0, stop=None, stats=None):
+        # [start, stop) aralığındaki veriyi döndürür; sadece aralığı kapsayan kod kelimeleri çözülür
+        # stats verilirse "words", "corrected" ve "uncorrectable" sayaçları güncellenir
+        stop = self.data_length if stop is None else min(stop, self.data_length)
+        start = max(0, start)
+        if start >= stop:
+            return b""
+        if stats is None:
+            stats = {}
+        for key in ("words", "corrected", "uncorrectable"):
+            stats.setdefault(key, 0)
+        first = start // self.word_bytes
+        last = -(-stop // self.word_bytes)
+        view = self.codewords(first, last - first)
+        try:
+            data = _decode_block(self.codec, view, self._batch, stats)
+        finally:
+            view.release()
+        offset = start - first * self.word_bytes
+        return data[offset:offset + stop - start]
+
+    def _check_block(self, view):
+        # Bir bloğu çözer; (veri, düzeltilmiş kod kelimesi baytları veya düzeltme yoksa None, durum sayıları)
+        if self._batch is not None:
+            import numpy as np
+            words = np.frombuffer(view, dtype=np.uint8).reshape(-1, self.code_bytes)
+            result = self.codec.decode_batch(words, packed=True)
+            statuses = [int(c) for c in np.bincount(result["status"], minlength=4)]
+            fixed = result["corrected_codeword"].tobytes()
+            data = result["corrected_data"].tobytes()
+        else:
+            _, code_bytes, pad_bits = _stream_layout(self.codec)
+            statuses = [0, 0, 0, 0]
+            data_parts = []
+            code_parts = []
+            for i in range(0, len(view), code_bytes):
+                result = self.codec.decode_int(int.from_bytes(view[i:i + code_bytes], "big") >> pad_bits)
+                statuses[status_code(result["error_pos"])] += 1
+                data_parts.append(result["corrected_data"].to_bytes(self.word_bytes, "big"))
+                code_parts.append((result["corrected_codeword"] << pad_bits).to_bytes(code_bytes, "big"))
+            fixed = b"".join(code_parts)
+            data = b"".join(data_parts)
+        if not statuses[P0_CORRECTED] + statuses[SINGLE_CORRECTED]:
+            fixed = None
+        return data, fixed, statuses
+
+    def verify(self, scrub=False):
+        # Tüm blokları çözer ve CRC ile karşılaştırır; scrub=True ise düzeltilen blokları yerinde yeniden yazar
+        # Çift hatalı kelimeler değiştirilmez (düzeltilmiş kod kelimesi alınanla aynıdır)
+        if scrub and not self.writable:
+            raise ValueError("Tarama için kapsayıcı yazılabilir açılmalıdır.")
+        report = {"blocks": self.block_count, "words": 0, "corrected": 0, "uncorrectable": 0,
+                  "rewritten_blocks": 0, "crc_errors": []}
+        for index in range(self.block_count):
+            view = self.codewords(index * self.block_words, self.block_words)
+            try:
+                data, fixed, statuses = self._check_block(view)
+            finally:
+                view.release()
+            report["words"] += sum(statuses)
+            report["corrected"] += statuses[P0_CORRECTED] + statuses[SINGLE_CORRECTED]
+            report["uncorrectable"] += statuses[DOUBLE_DETECTED]
+            if zlib.crc32(data) != self.block_crc(index):
+                report["crc_errors"].append(index)
+            if scrub and fixed is not None:
+                start = HEADER_SIZE + index * self.block_size
+                self._mmap[start:start + self.block_size] = fixed
+                report["rewritten_blocks"] += 1
+        if scrub and report["rewritten_blocks"]:
+            self._mmap.flush()
+        return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hamming SEC-DED rastgele erişimli kapsayıcı dosyası")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    pack_parser = subparsers.add_parser("pack", help="Veriyi kapsayıcıya kodla")
+    pack_parser.add_argument("-i", "--input", default="-", help="Girdi dosyası (varsayılan: stdin)")
+    pack_parser.add_argument("container")
+    pack_parser.add_argument("-d", "--data-bits", type=int, default=64)
+    pack_parser.add_argument("--code", choices=list(CODE_TYPES), default="hamming")
+    pack_parser.add_argument("-b", "--block-words", type=int, default=DEFAULT_BLOCK_WORDS)
+    unpack_parser = subparsers.add_parser("unpack", help="Veriyi (veya bir aralığını) çöz")
+    unpack_parser.add_argument("container")
+    unpack_parser.add_argument("-o", "--output", default="-", help="Çıktı dosyası (varsayılan: stdout)")
+    unpack_parser.add_argument("--offset", type=int, default=0)
+    unpack_parser.add_argument("--length", type=int, help="Okunacak bayt sayısı (varsayılan: sonuna kadar)")
+    for name, help_text in (("verify", "Tüm blokları doğrula"), ("scrub", "Doğrula ve düzeltilen blokları yeniden yaz"),
+                            ("info", "Başlık bilgisini göster")):
+        subparsers.add_parser(name, help=help_text).add_argument("container")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "pack":
+            source = sys.stdin.buffer if args.input == "-" else open(args.input, "rb")
+            try:
+                result = write_container(args.container, read_chunks(source, STREAM_CHUNK_SIZE), args.data_bits,
+                                         args.code, args.block_words)
+            finally:
+                if source is not sys.stdin.buffer:
+                    source.close()
+            print(f"Blok: {result['blocks']}, bayt: {result['bytes']}", file=sys.stderr)
+            return 0
+
+        with ContainerReader(args.container, writable=args.command == "scrub") as reader:
+            if args.command == "info":
+                print(f"Kod: {reader.code} ({reader.codec.total_bits + 1},{reader.codec.d_bits}), "
+                      f"blok: {reader.block_count} x {reader.block_words} kelime, veri: {reader.data_length} bayt")
+            elif args.command == "unpack":
+                stats = {}
+                stop = None if args.length is None else args.offset + args.length
+                target = sys.stdout.buffer if args.output == "-" else open(args.output, "wb")
+                try:
+                    # Büyük aralıklar parça parça çözülür
+                    step = STREAM_CHUNK_SIZE // reader.word_bytes * reader.word_bytes
+                    end = reader.data_length if stop is None else min(stop, reader.data_length)
+                    for start in range(args.offset, end, step):
+                        target.write(reader.read(start, min(start + step, end), stats))
+                finally:
+                    target.flush()
+                    if target is not sys.stdout.buffer:
+                        target.close()
+                print(f"Kelime: {stats.get('words', 0)}, Düzeltilen: {stats.get('corrected', 0)}, "
+                      f"Düzeltilemeyen: {stats.get('uncorrectable', 0)}", file=sys.stderr)
+            else:
+                report = reader.verify(scrub=args.command == "scrub")
+                print(f"Blok: {report['blocks']}, kelime: {report['words']}, düzeltilen: {report['corrected']}, "
+                      f"düzeltilemeyen: {report['uncorrectable']}, yeniden yazılan blok: {report['rewritten_blocks']}, "
+                      f"CRC hatalı blok: {len(report['crc_errors'])}")
+                return 1 if report["crc_errors"] else 0
+    except (OSError, ValueError) as e:
+        print(f"Hata: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
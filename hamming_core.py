@@ -0,0 +1,259 @@
+# Hamming SEC-DED Çekirdek Mantığı
+# Arayüz bağımlılığı olmayan kodlayıcı: komut satırı, simülasyon ve işçi süreçleri sadece bu modülü yükler
+# tkinter yüklenmediği için ekransız veya Tk kurulu olmayan sunucularda da çalışır
+
+from hamming_codegen import kernels
+
+# Durum kodları (toplu ve tamsayı tabanlı işlemlerde metin yerine kullanılır)
+# error_pos değerleriyle eşleşme: 0 -> NO_ERROR, -1 -> P0_CORRECTED, >0 -> SINGLE_CORRECTED, -2 -> DOUBLE_DETECTED
+NO_ERROR = 0
+P0_CORRECTED = 1
+SINGLE_CORRECTED = 2
+DOUBLE_DETECTED = 3
+# Dışa aktarılan ölçümlerde ve raporlarda kullanılan durum adları (indeks = durum kodu)
+STATUS_NAMES = ("no_error", "p0_corrected", "single_corrected", "double_detected")
+
+
+def status_code(error_pos):
+    # check_and_correct / decode_int hata pozisyonunu durum koduna çevirir
+    if error_pos > 0:
+        return SINGLE_CORRECTED
+    return NO_ERROR if error_pos == 0 else P0_CORRECTED if error_pos == -1 else DOUBLE_DETECTED
+
+# --- 1. Çekirdek Mantık Sınıfı ---
+# Bu sınıf Hamming kodlamasının temel mantığını içerir
+# Veri bitlerini kodlar ve hataları düzeltir
+class HammingSEC_DED:
+    # Aynı veri boyutu için tablolar bir kez hesaplanır ve tüm örnekler tarafından paylaşılır
+    _table_cache = {}
+    # Boyuta özel üretilmiş düz kod kullanılsın mı (bkz. hamming_codegen); False ise genel döngülü uygulama çalışır
+    use_codegen = True
+
+    def __init__(self, d_bits):
+        # d_bits: veri biti sayısı
+        self.d_bits = d_bits
+        # Gerekli parity bit sayısını hesapla
+        self.p_bits = self._calculate_p_bits(d_bits)
+        # Toplam bit sayısı = veri bitleri + parity bitleri
+        self.total_bits = self.d_bits + self.p_bits
+
+        # Maskeleri, pozisyon haritasını ve sendrom tablosunu önbellekten al (yoksa oluştur)
+        tables = self._table_cache.get(d_bits)
+        if tables is None:
+            tables = self._build_tables()
+            self._table_cache[d_bits] = tables
+        (self.data_positions, self._data_segments, self.parity_masks,
+         self._body_mask, self._syndrome_actions) = tables
+
+        # Sıcak yol fonksiyonları: üretilmiş modülden veya genel uygulamadan
+        if self.use_codegen:
+            generated = kernels(self)
+            self._encode_kernel = generated.encode_int
+            self._extract_kernel = generated.extract_data
+            self._syndrome_kernel = generated.syndrome
+            self._lookup_kernel = generated.lookup
+        else:
+            self._encode_kernel = self._encode_int_generic
+            self._extract_kernel = self._extract_data_generic
+            self._syndrome_kernel = self._syndrome_generic
+            self._lookup_kernel = self._lookup_generic
+
+    def _calculate_p_bits(self, d):
+        # Parity bit sayısını hesaplayan yardımcı fonksiyon
+        # 2^p >= d + p + 1 eşitsizliğini sağlayan en küçük p değerini bulur
+        p = 0
+        while (2 ** p) < (d + p + 1):
+            p += 1
+        return p
+
+    def _bit_shift(self, pos):
+        # Kod kelimesi tamsayı olarak tutulur: string'in ilk karakteri (P0) en anlamlı bittir
+        # Pozisyon i (1..n) için bit kaydırma miktarı n - i, P0 için n'dir
+        return self.total_bits - pos
+
+    def _build_tables(self):
+        # Her kod boyutu için bir kez çalışır; encode ve check_and_correct bu tabloları kullanır
+        n = self.total_bits
+
+        # Veri bitlerinin kod kelimesindeki pozisyonları (2'nin kuvveti olmayan pozisyonlar)
+        data_positions = [i for i in range(1, n + 1) if (i & (i - 1)) != 0]
+
+        # Veri bitleri parity pozisyonları arasında ardışık bloklar halinde yerleşir
+        # Her blok: (veri başlangıç indeksi, blok uzunluğu, kod kelimesindeki kaydırma miktarı)
+        data_segments = []
+        start = 0
+        while start < self.d_bits:
+            end = start
+            while end + 1 < self.d_bits and data_positions[end + 1] == data_positions[end] + 1:
+                end += 1
+            length = end - start + 1
+            data_segments.append((self.d_bits - start - length, length, self._bit_shift(data_positions[end])))
+            start = end + 1
+
+        # Her parity biti için kontrol ettiği pozisyonların maskesi (parity pozisyonunun kendisi dahil)
+        parity_masks = []
+        for p in range(self.p_bits):
+            p_pos = 2 ** p
+            mask = 0
+            for i in range(1, n + 1):
+                if i & p_pos:
+                    mask |= 1 << self._bit_shift(i)
+            parity_masks.append((p_pos, mask))
+
+        # P0 hariç tüm pozisyonların maskesi
+        body_mask = (1 << n) - 1
+
+        # Sendrom -> sonuç tablosu; indeks (sendrom << 1) | P0 uyuşmazlığı
+        # Her giriş: (durum metni, hata pozisyonu, düzeltme için XOR maskesi)
+        # P0 hatasında maske P0 bitini de içerir; check_and_correct P0'ı döndürmediği için onu maskeler
+        syndrome_actions = []
+        for syndrome in range(2 ** self.p_bits):
+            if syndrome == 0:
+                syndrome_actions.append(("Hata Yok", 0, 0))
+                syndrome_actions.append(("P0 Düzeltildi", -1, 1 << n))
+            else:
+                syndrome_actions.append(("Çift Hata Tespit Edildi (Düzeltilemez)", -2, 0))
+                flip_mask = 1 << self._bit_shift(syndrome) if syndrome <= n else 0
+                syndrome_actions.append((f"Tek Hata Düzeltildi (Bit {syndrome})", syndrome, flip_mask))
+
+        return data_positions, data_segments, parity_masks, body_mask, syndrome_actions
+
+    def _syndrome(self, code):
+        return self._syndrome_kernel(code)
+
+    def _lookup(self, received):
+        # Alınan kod kelimesinin (tamsayı) sendromunu ve tablodaki sonucunu döndürür
+        return self._lookup_kernel(received)
+
+    def encode_int(self, data):
+        # Veriyi tamsayı olarak kodlar ve kod kelimesini tamsayı olarak döndürür
+        # Bit sırası string API ile aynıdır: int(encode(s), 2) == encode_int(int(s, 2))
+        return self._encode_kernel(data)
+
+    def extract_data(self, codeword):
+        # Kod kelimesindeki (tamsayı) veri bitlerini toplayıp veri tamsayısını döndürür
+        return self._extract_kernel(codeword)
+
+    # --- Genel uygulama ---
+    # Tablolar üzerinde döngüyle çalışır; üretilmiş kodla aynı sonucu verir
+
+    def _syndrome_generic(self, code):
+        # Sendrom, 1 olan bitlerin pozisyonlarının XOR'udur
+        # Sendromun k. biti, 2^k pozisyonunu içeren pozisyonlardaki 1'lerin paritesine eşittir
+        syndrome = 0
+        for p_pos, mask in self.parity_masks:
+            if (code & mask).bit_count() & 1:
+                syndrome |= p_pos
+        return syndrome
+
+    def _lookup_generic(self, received):
+        code = received & self._body_mask
+        syndrome = self._syndrome_generic(code)
+        # Gerçek P0 değerini alınan P0 ile karşılaştır
+        p0_mismatch = (received >> self.total_bits) ^ (code.bit_count() & 1)
+        return syndrome, self._syndrome_actions[(syndrome << 1) | p0_mismatch]
+
+    def _encode_int_generic(self, data):
+        if data < 0 or data >> self.d_bits:
+            raise ValueError(f"Veri 0 ile 2^{self.d_bits} - 1 arasında olmalıdır.")
+
+        # Veri bitlerini blok blok yerleştir
+        code = 0
+        for data_shift, length, code_shift in self._data_segments:
+            code |= ((data >> data_shift) & ((1 << length) - 1)) << code_shift
+
+        # Parity bitlerini hesapla (parity pozisyonları henüz 0 olduğu için maskeye dahil olmaları sorun değil)
+        for p_pos, mask in self.parity_masks:
+            if (code & mask).bit_count() & 1:
+                code |= 1 << self._bit_shift(p_pos)
+
+        # Genel parity bitini hesapla (P0)
+        if code.bit_count() & 1:
+            code |= 1 << self.total_bits
+        return code
+
+    def _extract_data_generic(self, codeword):
+        data = 0
+        for data_shift, length, code_shift in self._data_segments:
+            data |= ((codeword >> code_shift) & ((1 << length) - 1)) << data_shift
+        return data
+
+    def decode_int(self, codeword):
+        # Tamsayı kod kelimesini kontrol eder ve düzeltir
+        # Dönüş: durum, hata pozisyonu, sendrom, düzeltilmiş veri ve düzeltilmiş kod kelimesi (P0 dahil)
+        if codeword < 0 or codeword >> (self.total_bits + 1):
+            raise ValueError(f"Kod 0 ile 2^{self.total_bits + 1} - 1 arasında olmalıdır.")
+        syndrome, (status, error_pos, flip_mask) = self._lookup(codeword)
+        corrected = codeword ^ flip_mask
+        return {"status": status, "error_pos": error_pos, "syndrome": syndrome,
+                "corrected_data": self.extract_data(corrected), "corrected_codeword": corrected}
+
+    def encode_batch(self, data, packed=False):
+        # NumPy ile çok sayıda kelimeyi tek seferde kodlar (bkz. hamming_batch)
+        from hamming_batch import encode_batch
+        return encode_batch(self, data, packed)
+
+    def decode_batch(self, codewords, packed=False):
+        # NumPy ile çok sayıda kod kelimesini tek seferde kontrol eder ve düzeltir (bkz. hamming_batch)
+        from hamming_batch import decode_batch
+        return decode_batch(self, codewords, packed)
+
+    def encode(self, data_str):
+        # Veriyi Hamming koduna dönüştürür
+        # data_str: kodlanacak veri bitleri (0 ve 1'lerden oluşan string)
+        if len(data_str) != self.d_bits or not all(c in '01' for c in data_str):
+            raise ValueError(f"Veri {self.d_bits} bit uzunluğunda ve sadece '0' ve '1' içermelidir.")
+        return format(self.encode_int(int(data_str, 2)), f"0{self.total_bits + 1}b")
+
+    def check_and_correct(self, received_code_str):
+        # Alınan kodu kontrol eder ve hataları düzeltir
+        # received_code_str: alınan kod (0 ve 1'lerden oluşan string)
+        if len(received_code_str) != self.total_bits + 1 or not all(c in '01' for c in received_code_str):
+            raise ValueError(f"Kod {self.total_bits + 1} bit uzunluğunda ve sadece '0' ve '1' içermelidir.")
+
+        # Hata durumunu tablodan bul ve gerekirse hatalı biti düzelt
+        received = int(received_code_str, 2)
+        _, (status, error_pos, flip_mask) = self._lookup(received)
+        return {"status": status, "error_pos": error_pos,
+                "corrected_code": format((received ^ flip_mask) & self._body_mask, f"0{self.total_bits}b")}
+
+# --- Artımlı Sendrom Takibi ---
+# Bir kod kelimesini sendromu ve genel paritesiyle birlikte tutar
+# Bit çevirmek sendroma pozisyonu XOR'lar ve pariteyi ters çevirir; durum ve düzeltme sabit zamanda tablodan okunur
+# Arayüz ve hata enjeksiyonu betikleri uzun çevirme dizilerinde her adımda tüm kelimeyi yeniden kontrol etmez
+class TrackedCodeword:
+    __slots__ = ("codec", "codeword", "syndrome", "parity")
+
+    def __init__(self, codec, codeword):
+        # codeword: encode/encode_int çıktısı (string veya tamsayı); başlangıç sendromu bir kez hesaplanır
+        if isinstance(codeword, str):
+            codeword = int(codeword, 2)
+        self.codec = codec
+        self.codeword = codeword
+        self.syndrome = codec._syndrome(codeword & codec._body_mask)
+        # P0 dahil tüm kelimenin paritesi; 1 ise alınan P0 ile hesaplanan P0 uyuşmuyor demektir
+        self.parity = codeword.bit_count() & 1
+
+    def flip(self, index):
+        # index: string'deki bit indeksi (0 = P0, i = i. pozisyon)
+        if not 0 <= index <= self.codec.total_bits:
+            raise ValueError(f"Bit indeksi 0 ile {self.codec.total_bits} arasında olmalıdır.")
+        self.codeword ^= 1 << (self.codec.total_bits - index)
+        self.syndrome ^= index
+        self.parity ^= 1
+
+    def flip_many(self, indices):
+        for index in indices:
+            self.flip(index)
+
+    def check(self):
+        # check_and_correct ile aynı durum metni ve hata pozisyonu, ayrıca sendrom
+        status, error_pos, _ = self.codec._syndrome_actions[(self.syndrome << 1) | self.parity]
+        return {"status": status, "error_pos": error_pos, "syndrome": self.syndrome}
+
+    def corrected_codeword(self):
+        # Düzeltilmiş kod kelimesi (tamsayı, P0 dahil); çift hatada kelime değiştirilmez
+        return self.codeword ^ self.codec._syndrome_actions[(self.syndrome << 1) | self.parity][2]
+
+    def __str__(self):
+        return format(self.codeword, f"0{self.codec.total_bits + 1}b")
@@ -0,0 +1,906 @@
+# Hamming SEC-DED Simülatörü Arayüzü
+# Tkinter arayüzü (SimulatorApp, BitCanvasView, SimulationPanel, HammingGuideWindow)
+# Sadece arayüz başlatıldığında yüklenir; kodlayıcıyı kullanan betikler tkinter'a bağımlı değildir
+
+import math
+import queue
+import random
+import threading
+import tkinter as tk
+from tkinter import messagebox, font, ttk
+import tkinter.font as tkfont
+
+from hamming_core import HammingSEC_DED, TrackedCodeword
+
+# --- 2. Klasik Görsel Arayüz Sınıfı ---
+# Arayüzde seçilebilen veri boyutları
+DATA_SIZES = ["8", "16", "32", "64", "128", "256", "512", "1024", "4096", "16384", "65536"]
+# Bu sayıdan fazla bit içeren kodlar etiketler yerine kaydırılabilir canvas görünümünde gösterilir
+LABEL_VIEW_MAX_BITS = 48
+
+# Bu sınıf programın kullanıcı arayüzünü oluşturur
+class SimulatorApp:
+    def __init__(self, root):
+        # Ana pencere ayarları
+        self.root = root
+        self.root.title("Hamming SEC-DED Simülatörü")
+        self.root.geometry("1200x900")
+        self.root.configure(bg="#f0f0f0")
+
+        # Değişkenler
+        self.hamming_logic = None
+        self.original_encoded_code = ""
+        self.corrupted_code = []
+        self.bit_labels = []
+        self.corrected_bit_labels = []
+        self.error_indices = set()  # Hatalı bitlerin indeksleri
+        self.tracked_code = None  # Hatalı kodun sendrom takibi (TrackedCodeword)
+
+        # Stil ayarları
+        self.style = ttk.Style()
+        self.style.configure("TButton", padding=6, relief="flat")
+        self.style.configure("TLabel", background="#f0f0f0")
+        self.style.configure("TFrame", background="#f0f0f0")
+        self.style.configure("Error.TFrame", background="#ffeeee")
+        self.style.configure("Corrected.TFrame", background="#eeffee")
+        self.create_widgets()
+
+    def create_widgets(self):
+        # Arayüz bileşenlerini oluşturur
+        # Fontlar
+        title_font = tkfont.Font(family="Helvetica", size=18, weight="bold")
+        subtitle_font = tkfont.Font(family="Helvetica", size=14, weight="bold")
+        default_font = tkfont.Font(family="Helvetica", size=12)
+        # Bit panellerinde kullanılan fontlar bir kez oluşturulur ve tüm etiketlerde paylaşılır
+        self.bit_font = tkfont.Font(family="Consolas", size=14, weight="bold")
+        self.bit_num_font = tkfont.Font(family="Helvetica", size=8)
+
+        # Ana container
+        main_container = ttk.Frame(self.root, padding="20")
+        main_container.pack(fill="both", expand=True)
+
+        # Başlık
+        title_label = ttk.Label(main_container, 
+                              text="Hamming SEC-DED Simülatörü", 
+                              font=title_font)
+        title_label.pack(pady=(0, 20))
+
+        # --- Üst Kontrol Çerçevesi ---
+        control_frame = ttk.Frame(main_container)
+        control_frame.pack(fill="x", pady=(0, 20))
+
+        # Veri girişi bölümü
+        input_frame = ttk.LabelFrame(control_frame, text="1. Veri Girişi", padding="10")
+        input_frame.pack(fill="x", padx=5, pady=5)
+
+        # Veri girişi alanları
+        ttk.Label(input_frame, text="Veri:", font=default_font).pack(side="left", padx=5)
+        self.data_entry = ttk.Entry(input_frame, width=35, font=default_font)
+        self.data_entry.pack(side="left", padx=5)
+        ttk.Label(input_frame, text="Bit Sayısı:", font=default_font).pack(side="left", padx=5)
+        self.data_size_var = tk.StringVar(value="8")
+        size_combo = ttk.Combobox(input_frame, 
+                                 textvariable=self.data_size_var,
+                                 values=DATA_SIZES,
+                                 state="readonly",
+                                 width=5)
+        size_combo.pack(side="left", padx=5)
+        
+        # Kodlama butonu
+        self.encode_button = ttk.Button(input_frame, 
+                                      text="KODLA",
+                                      command=self.encode_data)
+        self.encode_button.pack(side="left", padx=10)
+
+        # Örnek veri butonları
+        example_frame = ttk.Frame(input_frame)
+        example_frame.pack(side="left", padx=20)
+        ttk.Button(example_frame, text="8-bit örnek", 
+                  command=lambda: self.set_example("10110010", "8")).pack(side="left", padx=2)
+        ttk.Button(example_frame, text="16-bit örnek", 
+                  command=lambda: self.set_example("1100110011001100", "16")).pack(side="left", padx=2)
+        ttk.Button(example_frame, text="32-bit örnek", 
+                  command=lambda: self.set_example("10101010110011001100110010101010", "32")).pack(side="left", padx=2)
+        # Geniş kelimeler için seçili boyutta rastgele veri
+        ttk.Button(example_frame, text="Rastgele",
+                  command=self.set_random_example).pack(side="left", padx=2)
+        
+        # Hamming rehberi butonu
+        guide_btn = ttk.Button(example_frame, text="Hamming Code Nasıl Oluşur?", command=self.open_hamming_guide)
+        guide_btn.pack(side="left", padx=10)
+
+        # --- Sonuç Çerçeveleri ---
+        results_frame = ttk.Frame(main_container)
+        results_frame.pack(fill="both", expand=True)
+
+        # Kodlanmış Veri gösterimi
+        encoded_frame = ttk.LabelFrame(results_frame, 
+                                     text="2. Kodlanmış Veri (Hata oluşturmak için bit'e tıklayın)", 
+                                     padding="10")
+        encoded_frame.pack(fill="x", pady=10)
+        self.encoded_frame = ttk.Frame(encoded_frame)
+        self.encoded_frame.pack(fill="x", padx=5, pady=5)
+
+        # Hata Durumu gösterimi
+        status_frame = ttk.LabelFrame(results_frame, 
+                                    text="3. Hata Durum Analizi", 
+                                    padding="10")
+        status_frame.pack(fill="x", pady=10)
+        self.status_label = ttk.Label(status_frame, 
+                                    text="Durum: Bekleniyor...", 
+                                    font=default_font,
+                                    foreground="blue")
+        self.status_label.pack(anchor="w", padx=5)
+        self.syndrome_label = ttk.Label(status_frame, 
+                                      text="Sendrom: -", 
+                                      font=default_font)
+        self.syndrome_label.pack(anchor="w", padx=5)
+
+        # Düzeltilmiş Veri gösterimi
+        corrected_frame = ttk.LabelFrame(results_frame, 
+                                       text="4. Hata Düzeltildikten Sonraki Kod", 
+                                       padding="10")
+        corrected_frame.pack(fill="x", pady=10)
+        self.corrected_frame = ttk.Frame(corrected_frame)
+        self.corrected_frame.pack(fill="x", padx=5, pady=5)
+
+        # Arka plan hata oranı simülasyonu
+        self.simulation_panel = SimulationPanel(results_frame, self)
+
+        # Bilgi paneli
+        info_frame = ttk.LabelFrame(main_container, 
+                                  text="Renk Kodlaması ve Bilgiler", 
+                                  padding="10")
+        info_frame.pack(fill="x", pady=10)
+        info_text = """• P0 (Genel Parity): Kırmızı\n• Kontrol Bitleri (P1, P2, P4, P8...): Mavi  \n• Veri Bitleri: Siyah\n• Hatalı Bit: Turuncu arka plan\n• Düzeltilen Bit: Yeşil arka plan\n\nNot: Herhangi bir bite tıklayarak hata oluşturabilirsiniz. Tek hatalar düzeltilir, çift hatalar tespit edilir."""
+        info_label = ttk.Label(info_frame, 
+                             text=info_text, 
+                             font=default_font,
+                             justify="left")
+        info_label.pack(anchor="w", padx=5)
+
+    def set_example(self, data, size):
+        # Örnek veri setlerini yükler
+        self.data_size_var.set(size)
+        self.data_entry.delete(0, tk.END)
+        self.data_entry.insert(0, data)
+
+    def set_random_example(self):
+        # Seçili bit sayısında rastgele veri yükler
+        size = self.data_size_var.get()
+        self.set_example(format(random.getrandbits(int(size)), f"0{size}b"), size)
+
+    def encode_data(self):
+        # Veriyi kodlar ve arayüzde gösterir
+        try:
+            data_size = int(self.data_size_var.get())
+            data_str = self.data_entry.get().strip()
+            
+            # Veri kontrolü
+            if len(data_str) != data_size:
+                messagebox.showerror("Hata", f"Lütfen {data_size} bit uzunluğunda veri girin.")
+                return
+            if not all(c in '01' for c in data_str):
+                messagebox.showerror("Hata", "Veri sadece '0' ve '1' içermelidir.")
+                return
+            
+            # Hamming kodlaması
+            self.hamming_logic = HammingSEC_DED(data_size)
+            self.original_encoded_code = self.hamming_logic.encode(data_str)
+            self.corrupted_code = list(self.original_encoded_code)
+            self.tracked_code = TrackedCodeword(self.hamming_logic, self.original_encoded_code)
+            
+            # Arayüzü güncelle
+            self.display_bits(self.encoded_frame, self.corrupted_code, self.bit_labels, self.flip_bit)
+            self.reset_status()
+        except ValueError as e:
+            messagebox.showerror("Giriş Hatası", str(e))
+        except Exception as e:
+            messagebox.showerror("Beklenmedik Hata", str(e))
+
+    def clear_bits(self, frame, label_list):
+        # Bit panelindeki tüm etiketleri (veya canvas görünümünü) kaldırır
+        for widget in frame.winfo_children():
+            widget.destroy()
+        label_list.clear()
+        frame.bit_view = None
+
+    def build_bits(self, frame, count, label_list, click_handler):
+        # Bit paneli için count adet bit etiketi oluşturur (sadece bit sayısı değiştiğinde çağrılır)
+        self.clear_bits(frame, label_list)
+        bit_container = tk.Frame(frame, bg="#f0f0f0")
+        bit_container.pack(fill="x", pady=5)
+
+        for i in range(count):
+            # Bit tipine göre renk belirle
+            is_p0 = (i == 0)
+            is_parity = (i > 0) and ((i & (i - 1)) == 0)
+            color = "red" if is_p0 else ("#007FFF" if is_parity else "black")
+
+            # Bit frame'i oluştur
+            bit_frame = tk.Frame(bit_container, bg="#f0f0f0")
+            bit_frame.pack(side="left", padx=2)
+
+            # Bit numarası etiketi
+            num_text = "P0" if i == 0 else str(i)
+            num_label = tk.Label(bit_frame,
+                                 text=num_text,
+                                 font=self.bit_num_font,
+                                 fg="gray", bg="#f0f0f0")
+            num_label.pack()
+
+            # Bit değeri etiketi; değer ve arka plan display_bits tarafından atanır
+            label = tk.Label(bit_frame,
+                             text="",
+                             font=self.bit_font,
+                             fg=color,
+                             bg="#fff",
+                             padx=8, pady=8,
+                             cursor="hand2")
+            label.pack()
+            # Etikete en son uygulanan (değer, arka plan) ikilisi; değişmeyen etiketler yeniden yapılandırılmaz
+            label.bit_state = None
+
+            # Tıklama olayını ekle
+            if click_handler:
+                label.bind("<Button-1>", lambda e, index=i: click_handler(index))
+            label_list.append(label)
+
+    def display_bits(self, frame, code_list, label_list, click_handler, highlight_index=None, highlight_color=None, error_indices=None):
+        # Bitleri görsel olarak gösterir
+        # Geniş kodlar, sadece görünen bitleri çizen canvas görünümüne aktarılır
+        if len(code_list) > LABEL_VIEW_MAX_BITS:
+            view = getattr(frame, "bit_view", None)
+            if view is None:
+                self.clear_bits(frame, label_list)
+                view = frame.bit_view = BitCanvasView(frame, click_handler)
+            view.show(code_list, highlight_index, highlight_color, error_indices)
+            return
+
+        # Etiketler bit sayısı değişmedikçe yeniden kullanılır, sadece değeri veya rengi değişenler güncellenir
+        if getattr(frame, "bit_view", None) is not None or len(label_list) != len(code_list):
+            self.build_bits(frame, len(code_list), label_list, click_handler)
+
+        for i, (bit, label) in enumerate(zip(code_list, label_list)):
+            # Bit değeri etiketi arka planı
+            bg = "#fff"
+            if error_indices and i in error_indices:
+                bg = "#ffe0b2"
+            if highlight_index is not None and i == highlight_index:
+                bg = highlight_color
+
+            state = (bit, bg)
+            if label.bit_state != state:
+                label.config(text=bit, bg=bg)
+                label.bit_state = state
+
+    def flip_bit(self, index):
+        # Bit değerini değiştirir ve hata kontrolü yapar
+        if not self.corrupted_code:
+            return
+            
+        # Bit değerini değiştir
+        current_val = self.corrupted_code[index]
+        self.corrupted_code[index] = '0' if current_val == '1' else '1'
+        self.tracked_code.flip(index)
+        
+        # Hata indekslerini güncelle
+        if index in self.error_indices:
+            self.error_indices.remove(index)
+        else:
+            self.error_indices.add(index)
+            
+        # Arayüzü güncelle
+        self.display_bits(self.encoded_frame, self.corrupted_code, self.bit_labels, self.flip_bit, error_indices=self.error_indices)
+        self.check_for_errors()
+
+    def check_for_errors(self):
+        # Hataları kontrol eder ve düzeltir
+        # Sendrom her bit çevrildiğinde güncellendiği için durum tüm kod yeniden taranmadan okunur
+        result = self.tracked_code.check()
+        status_text = result['status']
+
+        # Çift hata
+        if result['error_pos'] == -2:
+            status_text = "❌ Çift Hata Tespit Edildi (Düzeltilemez)"
+            status_color = "#d32f2f"  # kırmızı
+            syndrome_text = "Sendrom: Çift hata tespit edildi"
+            self.status_label.config(text=f"Durum: {status_text}", foreground=status_color)
+            self.syndrome_label.config(text=syndrome_text)
+            corrected_list = list(self.corrupted_code)
+            self.display_bits(self.corrected_frame, corrected_list, self.corrected_bit_labels, None)
+            return
+
+        # Durum rengini belirle
+        if status_text.startswith("✅ Tek Hata Düzeltildi"):
+            status_color = "#388e3c"  # yeşil
+        elif status_text.startswith("❌"):
+            status_color = "#d32f2f"  # kırmızı
+        elif status_text.startswith("✅"):
+            status_color = "#388e3c"  # yeşil
+        else:
+            status_color = "#1976d2"  # mavi
+            
+        # Arayüzü güncelle
+        self.status_label.config(text=f"Durum: {status_text}", foreground=status_color)
+        
+        # Sendrom bilgisini güncelle
+        if result['error_pos'] > 0:
+            syndrome_text = f"Sendrom (Hata Pozisyonu): {result['error_pos']}"
+        elif result['error_pos'] == -1:
+            syndrome_text = "Sendrom: P0'da hata"
+        else:
+            syndrome_text = "Sendrom: Hata yok"
+        self.syndrome_label.config(text=syndrome_text)
+        
+        # Düzeltilmiş kodu göster: hatalı kodun kopyasında sadece düzeltilen bit çevrilir
+        corrected_list = list(self.corrupted_code)
+        highlight_index = None
+        if result['error_pos'] > 0:
+            highlight_index = result['error_pos']
+        elif result['error_pos'] == -1:
+            highlight_index = 0
+        if highlight_index is not None and highlight_index < len(corrected_list):
+            corrected_list[highlight_index] = '0' if corrected_list[highlight_index] == '1' else '1'
+        self.display_bits(self.corrected_frame, corrected_list, self.corrected_bit_labels, None, highlight_index=highlight_index, highlight_color="#b9f6ca")
+
+    def reset_status(self):
+        # Durum bilgilerini sıfırlar
+        self.status_label.config(text="Durum: Kodlandı. Hata oluşturmak için bir bite tıklayın.",
+                               foreground="#1976d2")
+        self.syndrome_label.config(text="Sendrom: -")
+        self.clear_bits(self.corrected_frame, self.corrected_bit_labels)
+        self.error_indices = set()
+
+    def open_hamming_guide(self):
+        # Hamming kodlama rehberini açar
+        HammingGuideWindow(self)
+
+# --- Geniş Kodlar İçin Kaydırılabilir Bit Görünümü ---
+# Bitleri satırlara sararak tek bir canvas üzerinde gösterir
+# Sadece görünen satırlardaki bitler çizilir; kaydırıldıkça aynı canvas öğeleri yeni bitlere atanır
+class BitCanvasView:
+    CELL_W = 40
+    CELL_H = 44
+    HEIGHT = 264
+
+    def __init__(self, parent, click_handler=None):
+        self.click_handler = click_handler
+        self.code_list = []
+        self.highlight_index = None
+        self.highlight_color = None
+        self.error_indices = set()
+        self.columns = 1
+        # Her slot bir bit için (arka plan, bit metni, bit numarası) öğelerini ve son durumunu tutar
+        self.slots = []
+
+        container = tk.Frame(parent, bg="#f0f0f0")
+        container.pack(fill="x", pady=5)
+        self.canvas = tk.Canvas(container, height=self.HEIGHT, bg="#f0f0f0", highlightthickness=0)
+        scrollbar = ttk.Scrollbar(container, orient="vertical", command=self.yview)
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="x", expand=True)
+
+        self.canvas.bind("<Configure>", self.on_resize)
+        self.canvas.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1))
+        self.canvas.bind("<Button-4>", lambda e: self.scroll(-1))
+        self.canvas.bind("<Button-5>", lambda e: self.scroll(1))
+        if click_handler:
+            self.canvas.bind("<Button-1>", self.on_click)
+
+    def show(self, code_list, highlight_index=None, highlight_color=None, error_indices=None):
+        # Gösterilecek bitleri ve vurguları ayarlar, sadece görünen kısmı yeniden çizer
+        resized = len(code_list) != len(self.code_list)
+        self.code_list = code_list
+        self.highlight_index = highlight_index
+        self.highlight_color = highlight_color
+        self.error_indices = error_indices or set()
+        if resized:
+            self.layout()
+        self.redraw()
+
+    def layout(self):
+        # Sütun sayısını canvas genişliğine göre hesaplar ve kaydırma alanını ayarlar
+        width = max(self.canvas.winfo_width(), self.CELL_W)
+        self.columns = max(1, width // self.CELL_W)
+        # Sütun sayısı değiştiyse slotların konumları geçersizdir
+        for slot in self.slots:
+            if slot[3] is not None:
+                slot[3] = (-1,)
+        rows = (len(self.code_list) + self.columns - 1) // self.columns
+        self.canvas.configure(scrollregion=(0, 0, self.columns * self.CELL_W, rows * self.CELL_H))
+
+    def on_resize(self, event):
+        if max(1, event.width // self.CELL_W) != self.columns:
+            self.layout()
+        self.redraw()
+
+    def yview(self, *args):
+        self.canvas.yview(*args)
+        self.redraw()
+
+    def scroll(self, units):
+        self.canvas.yview_scroll(units, "units")
+        self.redraw()
+
+    def on_click(self, event):
+        # Tıklanan hücreden bit indeksini bulur
+        col = int(self.canvas.canvasx(event.x)) // self.CELL_W
+        row = int(self.canvas.canvasy(event.y)) // self.CELL_H
+        index = row * self.columns + col
+        if col < self.columns and 0 <= index < len(self.code_list):
+            self.click_handler(index)
+
+    def _slot(self, k):
+        # k. slotu döndürür, yoksa yeni canvas öğeleri oluşturur
+        while len(self.slots) <= k:
+            rect = self.canvas.create_rectangle(0, 0, 0, 0, outline="#ddd", fill="#fff")
+            num = self.canvas.create_text(0, 0, font=("Helvetica", 7), fill="gray")
+            bit = self.canvas.create_text(0, 0, font=("Consolas", 12, "bold"))
+            self.slots.append([rect, num, bit, None])
+        return self.slots[k]
+
+    def redraw(self):
+        # Görünen satırlardaki bitleri slotlara atar; durumu değişmeyen slotlara dokunulmaz
+        top = self.canvas.canvasy(0)
+        first_row = max(0, int(top) // self.CELL_H)
+        last_row = int(top + max(self.canvas.winfo_height(), self.HEIGHT)) // self.CELL_H
+        first = first_row * self.columns
+        last = min(len(self.code_list), (last_row + 1) * self.columns)
+
+        k = 0
+        for i in range(first, last):
+            slot = self._slot(k)
+            k += 1
+            bg = "#fff"
+            if i in self.error_indices:
+                bg = "#ffe0b2"
+            if i == self.highlight_index:
+                bg = self.highlight_color
+            state = (i, self.code_list[i], bg)
+            if slot[3] == state:
+                continue
+            if slot[3] is None or slot[3][0] != i:
+                # Slot yeni bir bite atanıyor: konum, numara ve renk güncellenir
+                x = (i % self.columns) * self.CELL_W
+                y = (i // self.columns) * self.CELL_H
+                self.canvas.coords(slot[0], x + 2, y + 14, x + self.CELL_W - 2, y + self.CELL_H - 2)
+                self.canvas.coords(slot[1], x + self.CELL_W // 2, y + 7)
+                self.canvas.coords(slot[2], x + self.CELL_W // 2, y + 14 + (self.CELL_H - 16) // 2)
+                is_parity = i > 0 and (i & (i - 1)) == 0
+                color = "red" if i == 0 else ("#007FFF" if is_parity else "black")
+                self.canvas.itemconfig(slot[1], text="P0" if i == 0 else str(i), state="normal")
+                self.canvas.itemconfig(slot[2], fill=color)
+            self.canvas.itemconfig(slot[0], fill=bg, state="normal")
+            self.canvas.itemconfig(slot[2], text=self.code_list[i], state="normal")
+            slot[3] = state
+
+        # Kullanılmayan slotlar gizlenir
+        for slot in self.slots[k:]:
+            if slot[3] is not None:
+                for item in slot[:3]:
+                    self.canvas.itemconfig(item, state="hidden")
+                slot[3] = None
+
+
+# --- Arka Plan Simülasyon Paneli ---
+# Seçili veri boyutunda çok sayıda rastgele hata desenini (hamming_montecarlo) ayrı bir iş parçacığında çalıştırır
+# İş parçacığı her parçadan sonra birikmiş sayaçları kuyruğa koyar; arayüz kuyruğu after() ile yoklar,
+# böylece simülasyon sürerken pencere donmaz. İptal, parçalar arasında kontrol edilen bir Event ile yapılır
+# NumPy isteğe bağlıdır; yüklü değilse sadece bu panel kullanılamaz
+class SimulationPanel:
+    POLL_MS = 100
+    # Bir ilerleme adımında kanaldan geçirilen en fazla bit (kelime sayısı x kelime genişliği)
+    PROGRESS_BITS = 1 << 22
+    # Toplu kodlayıcının üreteç matrisi d x n boyutundadır; daha geniş kelimelerde bellek yetmez
+    MAX_DATA_BITS = 4096
+    CHART_W = 560
+    CHART_H = 150
+    # Grafiğin dikey ekseni logaritmiktir: 10^-CHART_DECADES .. 1
+    CHART_DECADES = 6
+    # Grafikte gösterilen oranlar: (sayaç, etiket, renk)
+    SERIES = (("corrected", "Düzeltilen", "#2e7d32"),
+              ("detected", "Tespit edilen (çift)", "#1976d2"),
+              ("miscorrected", "Yanlış düzeltilen", "#d32f2f"),
+              ("frame_errors", "FER", "#f57c00"))
+    CHANNELS = {"bsc": "Bit hata olasılığı (p)", "fixed": "Kelime başına hata sayısı", "burst": "Ardışık hata uzunluğu"}
+
+    def __init__(self, parent, app):
+        self.app = app
+        self.root = app.root
+        self.messages = queue.Queue()
+        self.worker = None
+        self.cancel_event = None
+        self.trials = 0
+        # Grafik noktaları: (işlenen kelime, sayaçlar)
+        self.history = []
+
+        frame = ttk.LabelFrame(parent, text="5. Hata Oranı Simülasyonu (arka planda çalışır)", padding="10")
+        frame.pack(fill="x", pady=10)
+        controls = ttk.Frame(frame)
+        controls.pack(fill="x")
+        ttk.Label(controls, text="Kanal:").pack(side="left", padx=5)
+        self.channel_var = tk.StringVar(value="bsc")
+        channel_combo = ttk.Combobox(controls, textvariable=self.channel_var, values=list(self.CHANNELS),
+                                     state="readonly", width=6)
+        channel_combo.pack(side="left", padx=5)
+        channel_combo.bind("<<ComboboxSelected>>", self.on_channel)
+        self.value_label = ttk.Label(controls, text=self.CHANNELS["bsc"] + ":")
+        self.value_label.pack(side="left", padx=5)
+        self.value_var = tk.StringVar(value="1e-3")
+        ttk.Entry(controls, textvariable=self.value_var, width=8).pack(side="left", padx=5)
+        ttk.Label(controls, text="Deneme:").pack(side="left", padx=5)
+        self.trials_var = tk.StringVar(value="1000000")
+        ttk.Entry(controls, textvariable=self.trials_var, width=10).pack(side="left", padx=5)
+        self.start_button = ttk.Button(controls, text="Başlat", command=self.start)
+        self.start_button.pack(side="left", padx=5)
+        self.cancel_button = ttk.Button(controls, text="İptal", command=self.cancel, state="disabled")
+        self.cancel_button.pack(side="left", padx=5)
+        self.progress = ttk.Progressbar(controls, orient="horizontal", length=200, mode="determinate")
+        self.progress.pack(side="left", padx=10)
+
+        body = ttk.Frame(frame)
+        body.pack(fill="x", pady=(5, 0))
+        self.canvas = tk.Canvas(body, width=self.CHART_W, height=self.CHART_H, bg="white", highlightthickness=0)
+        self.canvas.pack(side="left")
+        self.stats_label = ttk.Label(body, text="Simülasyon başlatılmadı.", justify="left")
+        self.stats_label.pack(side="left", anchor="n", padx=15)
+        self.build_chart()
+
+    def build_chart(self):
+        # Eksenler, ızgara ve çizgiler bir kez oluşturulur; güncellemelerde sadece çizgi koordinatları değişir
+        left, bottom = 40, self.CHART_H - 15
+        for k in range(self.CHART_DECADES + 1):
+            y = 8 + (bottom - 8) * k / self.CHART_DECADES
+            self.canvas.create_line(left, y, self.CHART_W - 110, y, fill="#e0e0e0")
+            self.canvas.create_text(left - 4, y, text=f"1e-{k}" if k else "1", anchor="e",
+                                    font=("Helvetica", 7), fill="gray")
+        self.canvas.create_line(left, bottom, self.CHART_W - 110, bottom, fill="gray")
+        self.canvas.create_line(left, 8, left, bottom, fill="gray")
+        self.axis_label = self.canvas.create_text(self.CHART_W - 110, bottom + 8, text="0 kelime", anchor="e",
+                                                  font=("Helvetica", 7), fill="gray")
+        self.lines = {}
+        for k, (key, label, color) in enumerate(self.SERIES):
+            self.lines[key] = self.canvas.create_line(0, 0, 0, 0, fill=color, width=2, state="hidden")
+            self.canvas.create_text(self.CHART_W - 100, 14 + 16 * k, text=label, anchor="w", fill=color,
+                                    font=("Helvetica", 8))
+
+    def _point(self, words, rate):
+        # (işlenen kelime, oran) -> canvas koordinatı; sıfır oranlar alt sınıra çizilir
+        left, right, top, bottom = 40, self.CHART_W - 110, 8, self.CHART_H - 15
+        x = left + (right - left) * words / max(self.trials, 1)
+        decades = min(self.CHART_DECADES, -math.log10(rate)) if rate > 0 else self.CHART_DECADES
+        return x, top + (bottom - top) * decades / self.CHART_DECADES
+
+    def update_chart(self):
+        for key, _, _ in self.SERIES:
+            points = []
+            for words, counts in self.history:
+                points.extend(self._point(words, counts[key] / words))
+            if len(points) >= 4:
+                self.canvas.coords(self.lines[key], *points)
+                self.canvas.itemconfig(self.lines[key], state="normal")
+            else:
+                self.canvas.itemconfig(self.lines[key], state="hidden")
+        words = self.history[-1][0] if self.history else 0
+        self.canvas.itemconfig(self.axis_label, text=f"{words:,} kelime")
+
+    def on_channel(self, event=None):
+        self.value_label.config(text=self.CHANNELS[self.channel_var.get()] + ":")
+        self.value_var.set({"bsc": "1e-3", "fixed": "2", "burst": "3"}[self.channel_var.get()])
+
+    def start(self):
+        # Girdileri kontrol eder ve iş parçacığını başlatır
+        if self.worker is not None:
+            return
+        try:
+            import numpy
+            from hamming_montecarlo import make_channel
+        except ImportError:
+            messagebox.showerror("Hata", "Simülasyon için NumPy gereklidir.")
+            return
+        try:
+            d_bits = int(self.app.data_size_var.get())
+            trials = int(self.trials_var.get())
+            if d_bits > self.MAX_DATA_BITS:
+                raise ValueError(f"Simülasyon en fazla {self.MAX_DATA_BITS} bit veri için çalıştırılabilir.")
+            if trials <= 0:
+                raise ValueError("Deneme sayısı pozitif olmalıdır.")
+            channel = make_channel(self.channel_var.get(), self.value_var.get())
+        except ValueError as e:
+            messagebox.showerror("Giriş Hatası", str(e))
+            return
+
+        self.trials = trials
+        self.history = []
+        self.update_chart()
+        self.progress.config(maximum=trials, value=0)
+        self.stats_label.config(text=f"{d_bits} bit veri için simülasyon başladı...")
+        self.start_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.cancel_event = threading.Event()
+        self.worker = threading.Thread(target=self.run, daemon=True,
+                                       args=(d_bits, channel, trials, random.getrandbits(64), self.cancel_event))
+        self.worker.start()
+        self.root.after(self.POLL_MS, self.poll)
+
+    def run(self, d_bits, channel, trials, seed, cancel_event):
+        # İş parçacığında çalışır: arayüz bileşenlerine dokunmaz, sadece kuyruğa yazar
+        # Her parça kendi tohumunu SeedSequence'tan alır (hamming_montecarlo.run_simulation ile aynı düzen)
+        import numpy as np
+        from hamming_montecarlo import _empty_counts, run_trials
+        try:
+            step = max(1, self.PROGRESS_BITS // (HammingSEC_DED(d_bits).total_bits + 1))
+            sizes = [min(step, trials - start) for start in range(0, trials, step)]
+            totals = _empty_counts()
+            for size, chunk_seed in zip(sizes, np.random.SeedSequence(seed).spawn(len(sizes))):
+                if cancel_event.is_set():
+                    self.messages.put(("cancelled", dict(totals)))
+                    return
+                counts = run_trials(d_bits, channel, size, chunk_seed)
+                for key, value in counts.items():
+                    totals[key] += value
+                self.messages.put(("progress", dict(totals)))
+            self.messages.put(("done", dict(totals)))
+        except Exception as e:
+            self.messages.put(("error", str(e)))
+
+    def poll(self):
+        # Kuyruktaki tüm mesajları işler; simülasyon sürüyorsa tekrar zamanlanır
+        finished = None
+        latest = None
+        while True:
+            try:
+                kind, payload = self.messages.get_nowait()
+            except queue.Empty:
+                break
+            if kind == "progress":
+                self.history.append((payload["words"], payload))
+                latest = payload
+            else:
+                finished = (kind, payload)
+        if latest is not None:
+            self.show_stats(latest)
+            self.update_chart()
+        if finished is None:
+            self.root.after(self.POLL_MS, self.poll)
+            return
+
+        kind, payload = finished
+        self.worker = None
+        self.start_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+        if kind == "error":
+            self.stats_label.config(text=f"Simülasyon hatası: {payload}")
+        else:
+            self.show_stats(payload, "Tamamlandı" if kind == "done" else "İptal edildi")
+
+    def show_stats(self, counts, state="Çalışıyor"):
+        from hamming_montecarlo import summarize
+        report = summarize(counts)
+        self.progress.config(value=counts["words"])
+        lines = [f"Durum: {state} ({counts['words']:,} / {self.trials:,} kelime)"]
+        for name, label in (("raw_ber", "Ham BER"), ("post_ber", "Çözme sonrası BER"), ("fer", "FER"),
+                            ("miscorrection_rate", "Yanlış düzeltme"), ("detection_rate", "Çift hata tespiti")):
+            low, high = report[name + "_ci"]
+            lines.append(f"{label}: {report[name]:.3e} (%95 GA: {low:.2e} - {high:.2e})")
+        lines.append(f"Düzeltilen kelime oranı: {counts['corrected'] / max(counts['words'], 1):.3e}")
+        self.stats_label.config(text="\n".join(lines))
+
+    def cancel(self):
+        # İş parçacığı mevcut parçayı bitirip durur; sonuç poll() ile gösterilir
+        if self.cancel_event is not None:
+            self.cancel_event.set()
+            self.cancel_button.config(state="disabled")
+
+
+# --- Hamming Code Nasıl Oluşur? Penceresi ---
+# Bu sınıf Hamming kodlamasının nasıl oluştuğunu adım adım gösterir
+# Kullanıcının girdiği veri ve boyut kullanılır (geçerli veri yoksa 8 bitlik örnek)
+# Kutular satırlara sarılır ve kaydırılabilir canvas'a bir kez çizilir; adımlar arasında sadece rengi veya
+# değeri değişen öğeler itemconfig ile güncellenir
+class HammingGuideWindow:
+    BOX_W = 55
+    BOX_H = 55
+    GAP = 10
+    MARGIN = 40
+    # Izgaranın başladığı yükseklik (başlık ve açıklama metninin altı)
+    GRID_TOP = 100
+    MAX_COLUMNS = 16
+    # Bu boyuttan büyük verilerde rehber örnek veriyle açılır (kutu sayısı canvas için fazla olur)
+    MAX_DATA_BITS = 4096
+    EXAMPLE_DATA = "10110010"
+    # Formülde gösterilen en fazla bit sayısı
+    FORMULA_TERMS = 12
+    PARITY_COLOR = "#b3e5fc"
+    DATA_COLOR = "#c8e6c9"
+    COVERED_COLOR = "#ffe082"
+    P0_COLOR = "#ffccbc"
+
+    def __init__(self, app):
+        # Rehber penceresi ayarları
+        self.app = app
+        self.step = 0
+        self.prepare_data()
+        columns = min(self.MAX_COLUMNS, self.total + 1)
+        width = 2 * self.MARGIN + columns * self.BOX_W
+        self.window = tk.Toplevel(app.root)
+        self.window.title("Hamming Code Nasıl Oluşur?")
+        self.window.geometry(f"{max(880, width + 20)}x560")
+        self.window.grab_set()
+        
+        # Kaydırılabilir canvas ve bilgi etiketi
+        canvas_frame = tk.Frame(self.window, bg="#f4f6fb")
+        canvas_frame.pack(fill="both", expand=True)
+        self.canvas = tk.Canvas(canvas_frame, bg="#f4f6fb", highlightthickness=0)
+        scrollbar = ttk.Scrollbar(canvas_frame, orient="vertical", command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side="right", fill="y")
+        self.canvas.pack(side="left", fill="both", expand=True)
+        self.canvas.bind("<MouseWheel>", lambda e: self.canvas.yview_scroll(-1 if e.delta > 0 else 1, "units"))
+        self.canvas.bind("<Button-4>", lambda e: self.canvas.yview_scroll(-1, "units"))
+        self.canvas.bind("<Button-5>", lambda e: self.canvas.yview_scroll(1, "units"))
+        self.info_label = tk.Label(self.window, text="", font=("Helvetica", 11), bg="#f4f6fb", anchor="w", justify="left")
+        self.info_label.pack(fill="x", padx=20, pady=(0,10))
+        
+        # Kontrol butonları
+        btn_frame = tk.Frame(self.window, bg="#f4f6fb")
+        btn_frame.pack(pady=10)
+        self.prev_btn = ttk.Button(btn_frame, text="Geri", command=self.prev_step)
+        self.prev_btn.pack(side="left", padx=5)
+        self.next_btn = ttk.Button(btn_frame, text="İleri", command=self.next_step)
+        self.next_btn.pack(side="left", padx=5)
+        self.restart_btn = ttk.Button(btn_frame, text="Baştan Başlat", command=self.restart)
+        self.restart_btn.pack(side="left", padx=5)
+        
+        # Rehberi başlat
+        self.build_layout(columns, width)
+        self.build_steps()
+        self.draw_hamming_guide()
+
+    def prepare_data(self):
+        # Ana penceredeki veriyi ve boyutu alır; geçersizse örnek veriye döner
+        data = self.app.data_entry.get().strip()
+        try:
+            size = int(self.app.data_size_var.get())
+        except ValueError:
+            size = 0
+        self.note = ""
+        if len(data) != size or not all(c in '01' for c in data) or size > self.MAX_DATA_BITS:
+            if size > self.MAX_DATA_BITS:
+                self.note = f" ({self.MAX_DATA_BITS} bitten büyük veriler için örnek gösteriliyor)"
+            data = self.EXAMPLE_DATA
+        self.data = data
+        self.codec = HammingSEC_DED(len(data))
+        self.code = self.codec.encode(data)
+        self.total = self.codec.total_bits
+        self.p = self.codec.p_bits
+
+    def build_layout(self, columns, width):
+        # Tüm kutuları bir kez oluşturur: pozisyon 1..n sırayla, en sonda P0
+        # boxes[k] = (dikdörtgen, etiket metni, değer metni); k = pozisyon - 1, P0 için k = total
+        self.title_item = self.canvas.create_text(width // 2, 30, text="", font=("Helvetica", 18, "bold"), fill="#1976d2")
+        self.reason_item = self.canvas.create_text(width // 2, 65, text="", font=("Helvetica", 12), fill="#333",
+                                                   width=width - 2 * self.MARGIN)
+        data_index = 0
+        self.boxes = []
+        for k in range(self.total + 1):
+            pos = k + 1
+            if k == self.total:
+                label = "P0"
+            elif pos & (pos - 1) == 0:
+                label = f"P{pos}"
+            else:
+                data_index += 1
+                label = f"D{data_index}"
+            x = self.MARGIN + (k % columns) * self.BOX_W
+            y = self.GRID_TOP + (k // columns) * (self.BOX_H + self.GAP)
+            outline = "#d84315" if k == self.total else "#0288d1"
+            rect = self.canvas.create_rectangle(x, y, x + self.BOX_W, y + self.BOX_H, fill=self.DATA_COLOR,
+                                                outline=outline, width=3)
+            name = self.canvas.create_text(x + self.BOX_W // 2, y + 13, text=label, font=("Consolas", 10, "bold"))
+            value = self.canvas.create_text(x + self.BOX_W // 2, y + 35, text="", font=("Consolas", 16, "bold"))
+            self.boxes.append((rect, name, value))
+        rows = (self.total + columns) // columns
+        self.canvas.configure(scrollregion=(0, 0, width, self.GRID_TOP + rows * (self.BOX_H + self.GAP) + 20))
+        # Her kutunun mevcut (renk, değer, görünürlük) durumu; sadece değişenler güncellenir
+        self.box_states = [None] * len(self.boxes)
+
+    def build_steps(self):
+        # Her adım için kutu durumları ve metinler bir kez hesaplanır
+        n = self.total
+        parity = [pos - 1 for pos in range(1, n + 1) if pos & (pos - 1) == 0]
+        base = [self.PARITY_COLOR if pos & (pos - 1) == 0 else self.DATA_COLOR for pos in range(1, n + 1)]
+        values = [self.code[k + 1] for k in range(n)] + [self.code[0]]
+        revealed = [pos & (pos - 1) != 0 for pos in range(1, n + 1)]
+
+        def states(colors, shown, p0_state):
+            return [(colors[k], values[k] if shown[k] else "?", "normal") for k in range(n)] + [p0_state]
+
+        hidden_p0 = (self.P0_COLOR, "", "hidden")
+        self.steps = [("Bitlerin Yerleşimi",
+                       f"Adım 1: Parity ve veri bitlerinin yerleşimi{self.note}.\n"
+                       f"Mavi kutular parity bitlerini ({self.p} adet), yeşil kutular {self.codec.d_bits} veri bitini gösterir.",
+                       "Neden? Parity bitleri (P1, P2, ...) 2'nin kuvveti olan pozisyonlara yerleştirilir. "
+                       "Diğer pozisyonlara veri bitleri konur.",
+                       states(base, revealed, hidden_p0))]
+        for pi in range(self.p):
+            bit = 1 << pi
+            colors = list(base)
+            covered = [pos for pos in range(1, n + 1) if pos & bit and pos != bit]
+            for pos in covered:
+                colors[pos - 1] = self.COVERED_COLOR
+            revealed = list(revealed)
+            revealed[parity[pi]] = True
+            terms = [f"Bit {pos}" for pos in covered[:self.FORMULA_TERMS]]
+            if len(covered) > self.FORMULA_TERMS:
+                terms.append(f"... ({len(covered)} bit)")
+            formula = f"P{bit} = " + " ⊕ ".join(terms) + f" = {values[parity[pi]]}"
+            self.steps.append(("Parity Bitlerinin Kontrolü",
+                               f"Adım {pi + 2}: P{bit} parity biti hesaplanıyor.\n"
+                               f"Sarı kutular P{bit}'nin kontrol ettiği bitleri gösterir.\nFormül: {formula}",
+                               f"Neden? P{bit} parity biti, pozisyonunda {bit} değerli bit 1 olan tüm bitleri kontrol eder.",
+                               states(colors, revealed, hidden_p0)))
+        ones = self.code[1:].count("1")
+        self.steps.append(("Genel Parity (P0) Hesabı",
+                           f"Adım {self.p + 2}: Genel parity (P0) hesaplanıyor.\n"
+                           f"Diğer {n} bitte {ones} adet 1 var; sayı çiftse P0 = 0, tekse P0 = 1 olur (P0 = {self.code[0]}).",
+                           "Neden? P0, tüm kodun çift/tek olup olmadığını kontrol eder.",
+                           states(base, revealed, (self.P0_COLOR, values[n], "normal"))))
+        self.steps.append(("Hamming Kodunun Son Hali",
+                           f"Adım {self.p + 3}: Hamming kodunun tamamı oluştu!\n"
+                           "Kullanıcı verisi ve parity bitleriyle birlikte kod hazır.",
+                           "Artık bu kod bellek veya iletim için hazır!",
+                           states(base, revealed, (self.P0_COLOR, values[n], "normal"))))
+
+    def draw_hamming_guide(self):
+        # Mevcut adımı gösterir; sadece durumu değişen kutular güncellenir
+        title, info, reason, states = self.steps[self.step]
+        self.canvas.itemconfig(self.title_item, text=title)
+        self.canvas.itemconfig(self.reason_item, text=reason)
+        self.info_label.config(text=info)
+        for k, state in enumerate(states):
+            old = self.box_states[k]
+            if old == state:
+                continue
+            rect, name, value = self.boxes[k]
+            fill, text, visible = state
+            if old is None or old[2] != visible:
+                self.canvas.itemconfig(rect, fill=fill, state=visible)
+                self.canvas.itemconfig(name, state=visible)
+                self.canvas.itemconfig(value, text=text, state=visible)
+            else:
+                if old[0] != fill:
+                    self.canvas.itemconfig(rect, fill=fill)
+                if old[1] != text:
+                    self.canvas.itemconfig(value, text=text)
+            self.box_states[k] = state
+            
+        # Buton durumlarını güncelle
+        self.prev_btn.config(state="normal" if self.step > 0 else "disabled")
+        self.next_btn.config(state="normal" if self.step < len(self.steps) - 1 else "disabled")
+
+    def next_step(self):
+        # Sonraki adıma geç
+        if self.step < len(self.steps) - 1:
+            self.step += 1
+            self.draw_hamming_guide()
+
+    def prev_step(self):
+        # Önceki adıma dön
+        if self.step > 0:
+            self.step -= 1
+            self.draw_hamming_guide()
+
+    def restart(self):
+        # Rehberi baştan başlat
+        self.step = 0
+        self.draw_hamming_guide()
+
+def run_gui():
+    # Programı başlat
+    main_window = tk.Tk()
+    main_window.state('zoomed')  # Otomatik tam ekran başlat
+    app = SimulatorApp(main_window)
+    main_window.mainloop()
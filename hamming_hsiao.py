@@ -0,0 +1,204 @@
+# Hsiao SEC-DED Kodlayıcı
+# Klasik genişletilmiş Hamming yerleşimine alternatif: parity-kontrol matrisinin tüm sütunları tek ağırlıklıdır
+# ve toplam ağırlık en küçük olacak şekilde seçilir (önce ağırlık 3, gerekirse 5, ...), satırlar dengelenir
+# Tek hata sendromu her zaman tek ağırlıklı, çift hata sendromu çift ağırlıklı olduğu için çift hata ayrı bir
+# genel parity (P0) geçişi olmadan tespit edilir; bellek denetleyicilerinde kullanılan (22,16), (39,32), (72,64)
+# ve (137,128) kodları bu yapıdadır
+#
+# Arayüz HammingSEC_DED ile aynıdır (encode, check_and_correct, encode_int, decode_int, encode_batch, decode_batch)
+# Kod kelimesi sistematiktir: önce veri bitleri, sonra r kontrol biti (string'in son karakteri c0)
+# HammingSEC_DED ile uyum için kod kelimesi uzunluğu total_bits + 1, kontrol biti sayısı p_bits + 1'dir
+# Hata pozisyonu string'deki 1 tabanlı pozisyondur (P0 olmadığı için -1 hiç dönmez); check_and_correct
+# düzeltilmiş kod kelimesinin tamamını döndürür
+
+from itertools import combinations
+from time import perf_counter_ns
+
+
+class HsiaoSEC_DED:
+    # Aynı veri boyutu için sütunlar ve tablolar bir kez hesaplanır
+    _table_cache = {}
+
+    def __init__(self, d_bits):
+        if d_bits <= 0:
+            raise ValueError("Veri biti sayısı pozitif olmalıdır.")
+        self.d_bits = d_bits
+        # Kontrol biti sayısı r: en az 3 ağırlıklı tek ağırlıklı r-bit vektör sayısı (2^(r-1) - r) d'ye yetmeli
+        r = 4
+        while 2 ** (r - 1) - r < d_bits:
+            r += 1
+        self.check_bits = r
+        self.p_bits = r - 1
+        self.total_bits = d_bits + self.p_bits
+
+        tables = self._table_cache.get(d_bits)
+        if tables is None:
+            tables = self._build_tables()
+            self._table_cache[d_bits] = tables
+        self.columns, self.parity_masks, self._syndrome_actions = tables
+
+    def _select_columns(self):
+        # Veri sütunlarını en düşük tek ağırlıktan başlayarak seçer
+        # Her adımda, eklendiğinde en yüklü satırın ağırlığını (eşitlikte karelerin toplamını) en az artıran sütun alınır
+        r = self.check_bits
+        row_weights = [0] * r
+        columns = []
+        weight = 3
+        while len(columns) < self.d_bits:
+            candidates = [sum(1 << b for b in bits) for bits in combinations(range(r), weight)]
+            while candidates and len(columns) < self.d_bits:
+                def cost(column):
+                    rows = [row_weights[j] + ((column >> j) & 1) for j in range(r)]
+                    return max(rows), sum(w * w for w in rows)
+                best = min(candidates, key=cost)
+                candidates.remove(best)
+                columns.append(best)
+                for j in range(r):
+                    row_weights[j] += (best >> j) & 1
+            weight += 2
+        return columns
+
+    def _build_tables(self):
+        r = self.check_bits
+        n = self.total_bits + 1
+        # columns[i]: string indeksi i'deki bitin sendrom sütunu; veri bitleri seçilen sütunları,
+        # kontrol bitleri birim vektörleri kullanır (son karakter c0)
+        columns = self._select_columns() + [1 << (r - 1 - k) for k in range(r)]
+
+        # Sendromun j. biti: sütununda j. bit olan pozisyonlardaki 1'lerin paritesi
+        # Kod kelimesi tamsayısında string indeksi i, n - 1 - i. bittir
+        parity_masks = []
+        for j in range(r):
+            mask = 0
+            for i, column in enumerate(columns):
+                if column >> j & 1:
+                    mask |= 1 << (n - 1 - i)
+            parity_masks.append(mask)
+
+        # Sendrom -> (durum metni, hata pozisyonu, düzeltme maskesi)
+        # Sıfır: hata yok; bir sütuna eşit: tek hata; çift ağırlık: çift hata; eşleşmeyen tek ağırlık: çoklu hata
+        position = {column: i for i, column in enumerate(columns)}
+        syndrome_actions = []
+        for syndrome in range(2 ** r):
+            if syndrome == 0:
+                syndrome_actions.append(("Hata Yok", 0, 0))
+            elif syndrome in position:
+                i = position[syndrome]
+                syndrome_actions.append((f"Tek Hata Düzeltildi (Bit {i + 1})", i + 1, 1 << (n - 1 - i)))
+            elif syndrome.bit_count() % 2 == 0:
+                syndrome_actions.append(("Çift Hata Tespit Edildi (Düzeltilemez)", -2, 0))
+            else:
+                syndrome_actions.append(("Çoklu Hata Tespit Edildi (Düzeltilemez)", -2, 0))
+        return columns, parity_masks, syndrome_actions
+
+    def _syndrome(self, code):
+        syndrome = 0
+        for j, mask in enumerate(self.parity_masks):
+            if (code & mask).bit_count() & 1:
+                syndrome |= 1 << j
+        return syndrome
+
+    def encode_int(self, data):
+        # Veriyi tamsayı olarak kodlar; kontrol bitleri veri bitlerinin sendromudur
+        if data < 0 or data >> self.d_bits:
+            raise ValueError(f"Veri 0 ile 2^{self.d_bits} - 1 arasında olmalıdır.")
+        code = data << self.check_bits
+        return code | self._syndrome(code)
+
+    def extract_data(self, codeword):
+        return codeword >> self.check_bits
+
+    def decode_int(self, codeword):
+        # Dönüş HammingSEC_DED.decode_int ile aynı anahtarları içerir
+        if codeword < 0 or codeword >> (self.total_bits + 1):
+            raise ValueError(f"Kod 0 ile 2^{self.total_bits + 1} - 1 arasında olmalıdır.")
+        syndrome = self._syndrome(codeword)
+        status, error_pos, flip_mask = self._syndrome_actions[syndrome]
+        corrected = codeword ^ flip_mask
+        return {"status": status, "error_pos": error_pos, "syndrome": syndrome,
+                "corrected_data": corrected >> self.check_bits, "corrected_codeword": corrected}
+
+    def encode(self, data_str):
+        if len(data_str) != self.d_bits or not all(c in '01' for c in data_str):
+            raise ValueError(f"Veri {self.d_bits} bit uzunluğunda ve sadece '0' ve '1' içermelidir.")
+        return format(self.encode_int(int(data_str, 2)), f"0{self.total_bits + 1}b")
+
+    def check_and_correct(self, received_code_str):
+        if len(received_code_str) != self.total_bits + 1 or not all(c in '01' for c in received_code_str):
+            raise ValueError(f"Kod {self.total_bits + 1} bit uzunluğunda ve sadece '0' ve '1' içermelidir.")
+        received = int(received_code_str, 2)
+        status, error_pos, flip_mask = self._syndrome_actions[self._syndrome(received)]
+        return {"status": status, "error_pos": error_pos,
+                "corrected_code": format(received ^ flip_mask, f"0{self.total_bits + 1}b")}
+
+    # --- Toplu işlem (NumPy) ---
+    # Bit sütunları string indeksleriyle aynıdır; dönüş biçimi hamming_batch ile aynıdır
+
+    def _matrices(self):
+        import numpy as np
+        cached = self._table_cache.get(("batch", self.d_bits))
+        if cached is not None:
+            return cached
+        r = self.check_bits
+        columns = np.array(self.columns, dtype=np.int64)
+        # H: (n x r), H[i, j] = sütun i'nin j. biti; ilk d satırı kodlamada kontrol bitlerini üretir
+        check = ((columns[:, None] >> np.arange(r)) & 1).astype(np.float32)
+        flips = np.full(2 ** r, -1, dtype=np.int64)
+        error_pos = np.empty(2 ** r, dtype=np.int64)
+        for syndrome, (_, pos, _) in enumerate(self._syndrome_actions):
+            error_pos[syndrome] = pos
+            if pos > 0:
+                flips[syndrome] = pos - 1
+        cached = (check, flips, error_pos)
+        self._table_cache[("batch", self.d_bits)] = cached
+        return cached
+
+    def encode_batch(self, data, packed=False):
+        import numpy as np
+        import hamming_batch
+        from hamming_batch import CHUNK_ROWS, _as_bits, _mod2_product
+        observer = hamming_batch._observer
+        start_ns = perf_counter_ns() if observer is not None else 0
+        check, _, _ = self._matrices()
+        data = _as_bits(data, self.d_bits, packed, "Veri")
+        codewords = np.empty((data.shape[0], self.total_bits + 1), dtype=np.uint8)
+        codewords[:, :self.d_bits] = data
+        for start in range(0, data.shape[0], CHUNK_ROWS):
+            chunk = data[start:start + CHUNK_ROWS]
+            # Sendromun j. biti c_j'dir; c_j string'in sondan j. karakterine yazılır
+            codewords[start:start + CHUNK_ROWS, self.d_bits:] = _mod2_product(chunk, check[:self.d_bits])[:, ::-1]
+        if observer is not None:
+            observer.observe_batch("encode_hsiao", self.d_bits, perf_counter_ns() - start_ns, data.shape[0])
+        return np.packbits(codewords, axis=1) if packed else codewords
+
+    def decode_batch(self, codewords, packed=False):
+        import numpy as np
+        import hamming_batch
+        from hamming_batch import CHUNK_ROWS, _as_bits, _mod2_product
+        from hamming_core import NO_ERROR, SINGLE_CORRECTED, DOUBLE_DETECTED
+        observer = hamming_batch._observer
+        start_ns = perf_counter_ns() if observer is not None else 0
+        check, flips, error_pos_table = self._matrices()
+        r = self.check_bits
+        codewords = _as_bits(codewords, self.total_bits + 1, packed, "Kod")
+        rows = codewords.shape[0]
+        weights = (1 << np.arange(r)).astype(np.int64)
+        syndrome = np.empty(rows, dtype=np.int64)
+        corrected = codewords.copy()
+        for start in range(0, rows, CHUNK_ROWS):
+            stop = min(start + CHUNK_ROWS, rows)
+            s = _mod2_product(codewords[start:stop], check).astype(np.int64) @ weights
+            syndrome[start:stop] = s
+            fix = np.nonzero(flips[s] >= 0)[0]
+            corrected[start + fix, flips[s[fix]]] ^= 1
+        error_pos = error_pos_table[syndrome]
+        status = np.where(error_pos == 0, NO_ERROR,
+                          np.where(error_pos > 0, SINGLE_CORRECTED, DOUBLE_DETECTED)).astype(np.uint8)
+        corrected_data = corrected[:, :self.d_bits]
+        if packed:
+            corrected_data = np.packbits(corrected_data, axis=1)
+            corrected = np.packbits(corrected, axis=1)
+        if observer is not None:
+            observer.observe_batch("decode_hsiao", self.d_bits, perf_counter_ns() - start_ns, rows, status, syndrome)
+        return {"syndrome": syndrome, "status": status, "error_pos": error_pos,
+                "corrected_data": corrected_data, "corrected_codeword": corrected}
@@ -0,0 +1,152 @@
+# Hamming SEC-DED Blok Serpiştirici (Interleaver) (NumPy)
+# depth ardışık kod kelimesi bir çerçeve oluşturur; kanala önce tüm kelimelerin 0. biti, sonra 1. biti, ... gönderilir
+# Böylece en fazla depth bitlik bir patlama hatası her kelimede en fazla bir biti bozar ve SEC-DED ile düzeltilir
+# Çerçeve (depth x w) bit matrisidir; serpiştirme bu matrisin devriğidir ve tüm çerçeveler için tek bir NumPy
+# devrik işlemiyle yapılır (bit başına Python döngüsü yoktur)
+# Satır sayısı depth'in katı değilse son eksik çerçeve kendi satır sayısı kadar derinlikle serpiştirilir
+# Paketlenmiş dizilerde (packed=True) kelimenin dolgu bitleri de serpiştirilir; dizinin biçimi değişmez
+
+import argparse
+import time
+
+import numpy as np
+
+from hamming_core import HammingSEC_DED
+from hamming_batch import encode_batch, decode_batch
+
+# Önbellekte kalması için tek seferde dönüştürülen en fazla bit (çerçeve sayısı x depth x w)
+CHUNK_BITS = 1 << 20
+
+DEFAULT_DEPTHS = [1, 2, 4, 8, 16, 32]
+DEFAULT_BURSTS = [1, 2, 3, 4, 8, 16, 32]
+
+
+def _transpose(bits, depth, inverse):
+    # (satır x w) 0/1 dizisinin her depth satırlık çerçevesini devirir
+    rows, width = bits.shape
+    out = np.empty_like(bits)
+    full = rows - rows % depth
+    step = max(1, CHUNK_BITS // (depth * width)) * depth
+    for start in range(0, full, step):
+        stop = min(start + step, full)
+        if inverse:
+            # Saklanan çerçeve (w x depth) kanal sırasıdır; devriği asıl kelimeleri verir
+            frames = bits[start:stop].reshape(-1, width, depth)
+        else:
+            frames = bits[start:stop].reshape(-1, depth, width)
+        out[start:stop] = frames.transpose(0, 2, 1).reshape(stop - start, width)
+    tail = rows - full
+    if tail:
+        shape = (width, tail) if inverse else (tail, width)
+        out[full:] = bits[full:].reshape(shape).T.reshape(tail, width)
+    return out
+
+
+def _apply(codewords, depth, packed, inverse):
+    if depth < 1:
+        raise ValueError("Serpiştirme derinliği en az 1 olmalıdır.")
+    codewords = np.asarray(codewords, dtype=np.uint8)
+    if codewords.ndim != 2:
+        raise ValueError("Kod kelimeleri 2 boyutlu bir dizi olmalıdır.")
+    if depth == 1:
+        return codewords
+    if not packed:
+        return _transpose(codewords, depth, inverse)
+    # Paketli dizi parçalar halinde açılıp devrilir ve yeniden paketlenir
+    rows, code_bytes = codewords.shape
+    out = np.empty_like(codewords)
+    step = max(1, CHUNK_BITS // (depth * code_bytes * 8)) * depth
+    for start in range(0, rows, step):
+        stop = min(start + step, rows)
+        bits = np.unpackbits(codewords[start:stop], axis=1)
+        out[start:stop] = np.packbits(_transpose(bits, depth, inverse), axis=1)
+    return out
+
+
+def interleave(codewords, depth, packed=False):
+    # codewords: her satırı bir kod kelimesi olan 2 boyutlu dizi; dönüş aynı biçimde, kanal sırasına dizilmiş bitler
+    return _apply(codewords, depth, packed, inverse=False)
+
+
+def deinterleave(received, depth, packed=False):
+    # interleave'in tersi: kanal sırasındaki bitlerden kod kelimelerini geri oluşturur
+    return _apply(received, depth, packed, inverse=True)
+
+
+# --- Rapor ---
+
+def corrected_word_rate(counts):
+    # Hatadan etkilenen kelimelerden doğru düzeltilenlerin oranı
+    hit = counts["corrected"] + counts["frame_errors"]
+    return counts["corrected"] / hit if hit else 1.0
+
+
+def depth_report(d_bits, depths, bursts, frames, seed=0):
+    # Her (patlama uzunluğu, derinlik) için çerçeve başına bir patlama uygulanır
+    # Dönüş: {(patlama, derinlik): run_trials sayaçları}
+    from hamming_montecarlo import BurstChannel, run_trials
+    results = {}
+    for burst in bursts:
+        for depth in depths:
+            results[(burst, depth)] = run_trials(d_bits, BurstChannel(burst), frames * depth, seed, depth=depth)
+    return results
+
+
+def format_depth_report(d_bits, depths, bursts, results):
+    # Satırlar patlama uzunluğu, sütunlar derinlik; hücreler düzeltilen kelime oranı
+    lines = [f"d_bits = {d_bits}: hatadan etkilenen kelimelerde düzeltilen kelime oranı",
+             "Patlama " + "".join(f"{f'D={depth}':>10}" for depth in depths)]
+    for burst in bursts:
+        cells = "".join(f"{corrected_word_rate(results[(burst, depth)]):>10.4f}" for depth in depths)
+        lines.append(f"{burst:>7} {cells}")
+    return "\n".join(lines)
+
+
+def _rate(func, rows, row_bytes, min_time=0.3):
+    # func'ı en az min_time saniye çağırır, MB/s döndürür
+    calls = 0
+    start = time.perf_counter()
+    while calls == 0 or time.perf_counter() - start < min_time:
+        func()
+        calls += 1
+    return calls * rows * row_bytes / (time.perf_counter() - start) / 1e6
+
+
+def throughput(d_bits, depth, words=1 << 16, seed=0):
+    # Paketli kod kelimeleri üzerinde kodlama, serpiştirme ve çözme hızları (kod kelimesi MB/s)
+    codec = HammingSEC_DED(d_bits)
+    rng = np.random.default_rng(seed)
+    data = np.packbits(rng.integers(0, 2, (words, d_bits), dtype=np.uint8), axis=1)
+    packed = encode_batch(codec, data, packed=True)
+    code_bytes = packed.shape[1]
+    mixed = interleave(packed, depth, packed=True)
+    return {"encode_batch": _rate(lambda: encode_batch(codec, data, packed=True), words, code_bytes),
+            "decode_batch": _rate(lambda: decode_batch(codec, packed, packed=True), words, code_bytes),
+            "interleave": _rate(lambda: interleave(packed, depth, packed=True), words, code_bytes),
+            "deinterleave": _rate(lambda: deinterleave(mixed, depth, packed=True), words, code_bytes)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hamming SEC-DED blok serpiştirici: derinlik / patlama raporu")
+    parser.add_argument("-d", "--data-bits", type=int, default=64)
+    parser.add_argument("--depths", type=int, nargs="+", default=DEFAULT_DEPTHS)
+    parser.add_argument("-b", "--bursts", type=int, nargs="+", default=DEFAULT_BURSTS, help="Patlama uzunlukları (bit)")
+    parser.add_argument("-n", "--frames", type=int, default=20000, help="Her nokta için çerçeve sayısı")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("--throughput", action="store_true", help="Serpiştirme ve kodlayıcı hızlarını da ölç")
+    args = parser.parse_args(argv)
+    if min(args.depths) < 1 or min(args.bursts) < 1:
+        parser.error("Derinlik ve patlama uzunluğu en az 1 olmalıdır.")
+
+    results = depth_report(args.data_bits, args.depths, args.bursts, args.frames, args.seed)
+    print(format_depth_report(args.data_bits, args.depths, args.bursts, results))
+    if args.throughput:
+        print("\nHız (kod kelimesi MB/s)")
+        for depth in args.depths:
+            rates = throughput(args.data_bits, depth, seed=args.seed)
+            print(f"D={depth:<4} " + "  ".join(f"{name}: {rate:8.1f}" for name, rate in rates.items()))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
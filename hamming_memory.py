@@ -0,0 +1,168 @@
+# Hamming SEC-DED Korumalı Bellek Simülatörü
+# Milyonlarca kelimelik bir belleği HammingSEC_DED kod kelimeleri olarak sıkışık bir NumPy (veya mmap) dizisinde tutar
+# Simüle edilen zaman boyunca belirli bir oranda yumuşak hata (bit çevrilmesi) oluşturur ve belirli aralıklarla
+# belleği tarayan (scrub) bir düzeltici çalıştırır; düzeltilen, düzeltilemeyen ve sessizce yanlış düzeltilen
+# olayları tarama aralığına göre raporlar
+
+import argparse
+
+import numpy as np
+
+from hamming_core import HammingSEC_DED, NO_ERROR, DOUBLE_DETECTED
+from hamming_batch import encode_batch, decode_batch
+
+# Bellek başlangıçta bu kadar kelimelik parçalar halinde kodlanır
+INIT_CHUNK_WORDS = 1 << 16
+
+
+class ECCMemory:
+    # words: kelime sayısı, d_bits: kelime başına veri biti
+    # path verilirse kod kelimeleri ve doğrulama için tutulan asıl veri disk üzerinde mmap dizilerinde saklanır
+    def __init__(self, words, d_bits=64, path=None, seed=0):
+        self.codec = HammingSEC_DED(d_bits)
+        self.words = words
+        self.width = self.codec.total_bits + 1
+        self.code_bytes = (self.width + 7) // 8
+        self.data_bytes = (d_bits + 7) // 8
+        self.rng = np.random.default_rng(seed)
+
+        if path:
+            self.storage = np.memmap(path, dtype=np.uint8, mode="w+", shape=(words, self.code_bytes))
+            self.golden = np.memmap(path + ".golden", dtype=np.uint8, mode="w+", shape=(words, self.data_bytes))
+        else:
+            self.storage = np.empty((words, self.code_bytes), dtype=np.uint8)
+            self.golden = np.empty((words, self.data_bytes), dtype=np.uint8)
+
+        # Son bayttaki kullanılmayan veri bitleri 0 olmalı (np.packbits ile aynı)
+        pad_mask = (0xFF << (self.data_bytes * 8 - d_bits)) & 0xFF
+        for start in range(0, words, INIT_CHUNK_WORDS):
+            stop = min(start + INIT_CHUNK_WORDS, words)
+            data = self.rng.integers(0, 256, (stop - start, self.data_bytes), dtype=np.uint8)
+            data[:, -1] &= pad_mask
+            self.golden[start:stop] = data
+            self.storage[start:stop] = encode_batch(self.codec, data, packed=True)
+
+        self.time = 0.0
+        self.stats = {"upsets": 0, "scrubs": 0, "corrected": 0, "uncorrectable": 0, "miscorrected": 0}
+        # Son taramadan bu yana inject() ile hata alan kelimelerin indeksleri (sadece scrub(dirty_only=True) için)
+        self._dirty = []
+
+    @property
+    def total_bits(self):
+        return self.words * self.width
+
+    def inject(self, count):
+        # Bellekte rastgele count adet bit çevirir (aynı bit birden fazla kez çevrilebilir)
+        if count == 0:
+            return
+        word = self.rng.integers(0, self.words, count)
+        bit = self.rng.integers(0, self.width, count)
+        np.bitwise_xor.at(self.storage, (word, bit >> 3), (0x80 >> (bit & 7)).astype(np.uint8))
+        self.stats["upsets"] += count
+        self._dirty.append(word)
+
+    def advance(self, duration, error_rate):
+        # Zamanı duration kadar ilerletir; error_rate: bit başına birim zamandaki yumuşak hata oranı
+        self.inject(int(self.rng.poisson(error_rate * self.total_bits * duration)))
+        self.time += duration
+
+    def scrub(self, dirty_only=False):
+        # Belleği tarar: kelimeleri çözer, olayları sayar ve düzeltilen kelimeleri düzeltilmiş kod kelimesiyle yazar
+        # Varsayılan olarak tüm bellek parçalar halinde taranır (gerçek bir tarayıcı gibi, hatanın kaynağından bağımsız)
+        # dirty_only=True hız seçeneğidir: sadece inject() ile hata eklenen kelimeler çözülür; bu yalnızca tüm
+        # hatalar inject() üzerinden geldiğinde tam taramayla aynı sonucu verir
+        self.stats["scrubs"] += 1
+        dirty, self._dirty = self._dirty, []
+        if dirty_only:
+            if dirty:
+                index = np.unique(np.concatenate(dirty))
+                for start in range(0, len(index), INIT_CHUNK_WORDS):
+                    self._scrub_words(index[start:start + INIT_CHUNK_WORDS])
+            return
+        for start in range(0, self.words, INIT_CHUNK_WORDS):
+            self._scrub_words(slice(start, min(start + INIT_CHUNK_WORDS, self.words)))
+
+    def _scrub_words(self, index):
+        # index: kelime dilimi veya indeks dizisi
+        result = decode_batch(self.codec, self.storage[index], packed=True)
+        status = result["status"]
+        if not status.any():
+            # Hata görülmeyen parçada sadece önceden yanlış düzeltilmiş kelimeler veri hatası taşıyabilir; sayılmaz
+            return
+        golden = self.golden[index]
+        # Asıl veri (golden) sadece olayları sınıflandırmak için kullanılır; tarayıcı onu bilemez
+        wrong = (result["corrected_data"] != golden).any(axis=1)
+        detected = status == DOUBLE_DETECTED
+        fixed = (status != NO_ERROR) & ~detected
+        self.stats["uncorrectable"] += int(detected.sum())
+        # Kod çözücü düzelttiğini söylediği halde veri yanlışsa sessiz yanlış düzeltmedir
+        self.stats["miscorrected"] += int((wrong & fixed).sum())
+        self.stats["corrected"] += int((~wrong & fixed).sum())
+
+        rows = np.arange(index.start, index.stop) if isinstance(index, slice) else index
+        # Düzeltilen (ve farkında olmadan yanlış düzeltilen) kelimeler kod çözücünün ürettiği kod kelimesiyle yazılır
+        # Sendrom kod uzunluğunu aşıyorsa hiçbir bit çevrilmez; bu kelimeler yazma yolundaki gibi düzeltilmiş veriden
+        # yeniden kodlanır, aksi halde her taramada tekrar hatalı görünürler
+        rewrite = result["corrected_codeword"]
+        invalid = fixed & (result["error_pos"] > self.codec.total_bits)
+        if invalid.any():
+            rewrite[invalid] = encode_batch(self.codec, result["corrected_data"][invalid], packed=True)
+        self.storage[rows[fixed]] = rewrite[fixed]
+        # Düzeltilemeyen kelimeler tespit edildiği için üst katmandan (ör. sayfanın yeniden yüklenmesi) kurtarılır
+        if detected.any():
+            self.storage[rows[detected]] = encode_batch(self.codec, golden[detected], packed=True)
+
+    def verify(self):
+        # Tüm belleği parçalar halinde çözer ve asıl veriden farklı kelime sayısını döndürür
+        mismatches = 0
+        for start in range(0, self.words, INIT_CHUNK_WORDS):
+            stop = min(start + INIT_CHUNK_WORDS, self.words)
+            result = decode_batch(self.codec, self.storage[start:stop], packed=True)
+            mismatches += int((result["corrected_data"] != self.golden[start:stop]).any(axis=1).sum())
+        return mismatches
+
+
+def simulate_scrubbing(words, d_bits, error_rate, scrub_interval, duration, seed=0, path=None, dirty_only=False):
+    # duration süresince her scrub_interval'da bir tarama yapar ve olay sayılarını döndürür
+    memory = ECCMemory(words, d_bits, path=path, seed=seed)
+    while memory.time < duration:
+        memory.advance(min(scrub_interval, duration - memory.time), error_rate)
+        memory.scrub(dirty_only)
+    report = dict(memory.stats)
+    report.update({"words": words, "d_bits": d_bits, "error_rate": error_rate,
+                   "scrub_interval": scrub_interval, "duration": duration})
+    for name in ("corrected", "uncorrectable", "miscorrected"):
+        report[name + "_per_time"] = report[name] / duration
+    return report
+
+
+def scrub_interval_sweep(words, d_bits, error_rate, intervals, duration, seed=0, path=None, dirty_only=False):
+    # Aynı bellek ve hata oranı için farklı tarama aralıklarını karşılaştırır
+    return [simulate_scrubbing(words, d_bits, error_rate, interval, duration, seed=seed, path=path,
+                               dirty_only=dirty_only)
+            for interval in intervals]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hamming SEC-DED korumalı bellek ve tarama (scrub) simülasyonu")
+    parser.add_argument("-n", "--words", type=int, default=1 << 20, help="Bellekteki kelime sayısı")
+    parser.add_argument("-d", "--data-bits", type=int, default=64)
+    parser.add_argument("-r", "--rate", type=float, default=1e-7, help="Bit başına birim zamandaki hata oranı")
+    parser.add_argument("-i", "--intervals", type=float, nargs="+", default=[1, 10, 100], help="Tarama aralıkları")
+    parser.add_argument("-t", "--duration", type=float, default=1000, help="Simüle edilen toplam süre")
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("--mmap", help="Belleği bu dosyada mmap ile tut")
+    parser.add_argument("--dirty-only", action="store_true",
+                        help="Tam tarama yerine sadece hata eklenen kelimeleri çöz (hızlı, sonuçlar aynı)")
+    args = parser.parse_args(argv)
+
+    print(f"{'aralık':>10} {'hata':>10} {'düzeltilen':>12} {'düzeltilemeyen':>15} {'yanlış düzeltilen':>18}")
+    for report in scrub_interval_sweep(args.words, args.data_bits, args.rate, args.intervals, args.duration,
+                                       seed=args.seed, path=args.mmap, dirty_only=args.dirty_only):
+        print(f"{report['scrub_interval']:>10g} {report['upsets']:>10} {report['corrected']:>12} "
+              f"{report['uncorrectable']:>15} {report['miscorrected']:>18}", flush=True)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,257 @@
+# Hamming SEC-DED Ölçüm (Enstrümantasyon) Katmanı
+# HammingSEC_DED ve toplu kodlayıcı için durum sayaçları, sendrom histogramı ve gecikme dağılımları toplar
+# Sonuçlar JSON veya Prometheus metin biçiminde dışa aktarılır
+#
+# Varsayılan olarak kapalıdır ve kapalıyken sıcak yolda hiçbir maliyeti yoktur: enable() sınıfın yöntemlerini
+# ölçüm yapan sarmalayıcılarla değiştirir, disable() asıl yöntemleri geri koyar
+# Toplu yolda hamming_batch._observer ayarlanır; toplu çağrı başına tek bir karşılaştırma yapılır
+# Durum ve sendrom, check_and_correct ve decode_int'in ortak kullandığı _lookup üzerinden sayılır;
+# TrackedCodeword ve tabloyu doğrudan okuyan doğrulayıcı ölçülmez
+
+import argparse
+import json
+import random
+import threading
+from collections import defaultdict
+from functools import wraps
+from time import perf_counter_ns
+
+from hamming_core import HammingSEC_DED, STATUS_NAMES, status_code
+
+# Gecikme histogramı kovaları: kova k, bit_length'i k olan nanosaniye değerlerini (2^(k-1) .. 2^k - 1) tutar
+LATENCY_BUCKETS = 40
+# Zamanlanan skaler yöntemler ve dışa aktarımdaki işlem adları
+TIMED_METHODS = ("encode", "check_and_correct", "encode_int", "decode_int")
+
+
+class CodecMetrics:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            # (d_bits, durum kodu) -> kelime sayısı
+            self.status_counts = defaultdict(int)
+            # (d_bits, sendrom) -> kelime sayısı (sadece sendromu 0 olmayan kelimeler)
+            self.syndrome_counts = defaultdict(int)
+            # d_bits -> kodlanan kelime sayısı
+            self.encoded_words = defaultdict(int)
+            # işlem -> [kova sayıları, toplam süre (ns), çağrı sayısı]
+            self.latency = {}
+
+    def observe_latency(self, op, elapsed_ns):
+        with self._lock:
+            entry = self.latency.get(op)
+            if entry is None:
+                entry = self.latency[op] = [[0] * (LATENCY_BUCKETS + 1), 0, 0]
+            entry[0][min(elapsed_ns.bit_length(), LATENCY_BUCKETS)] += 1
+            entry[1] += elapsed_ns
+            entry[2] += 1
+
+    def observe_encode(self, d_bits, words=1):
+        with self._lock:
+            self.encoded_words[d_bits] += words
+
+    def observe_decode(self, d_bits, error_pos, syndrome):
+        with self._lock:
+            self.status_counts[(d_bits, status_code(error_pos))] += 1
+            if syndrome:
+                self.syndrome_counts[(d_bits, syndrome)] += 1
+
+    def observe_batch(self, op, d_bits, elapsed_ns, words, status=None, syndrome=None):
+        # Toplu çağrılar: gecikme çağrı başına, sayaçlar kelime başına tutulur
+        self.observe_latency(op, elapsed_ns)
+        if status is None:
+            self.observe_encode(d_bits, words)
+            return
+        import numpy as np
+        counts = np.bincount(status, minlength=len(STATUS_NAMES))
+        values, hits = np.unique(syndrome[syndrome != 0], return_counts=True)
+        with self._lock:
+            for code, count in enumerate(counts.tolist()):
+                if count:
+                    self.status_counts[(d_bits, code)] += count
+            for value, count in zip(values.tolist(), hits.tolist()):
+                self.syndrome_counts[(d_bits, value)] += count
+
+    def _latency_summary(self, buckets, total_ns, calls):
+        # Yüzdelikler kova üst sınırıyla (2^k ns) tahmin edilir
+        summary = {"calls": calls, "mean_ns": total_ns / calls if calls else 0.0}
+        for q in (50, 90, 99):
+            target = calls * q / 100
+            seen = 0
+            for k, count in enumerate(buckets):
+                seen += count
+                if count and seen >= target:
+                    summary[f"p{q}_ns"] = 1 << k
+                    break
+        summary["buckets"] = {str(1 << k): count for k, count in enumerate(buckets) if count}
+        return summary
+
+    def snapshot(self):
+        # Ölçümlerin JSON'a çevrilebilir bir kopyasını döndürür
+        with self._lock:
+            status_counts = dict(self.status_counts)
+            syndrome_counts = dict(self.syndrome_counts)
+            encoded_words = dict(self.encoded_words)
+            latency = {op: (list(b), total, calls) for op, (b, total, calls) in self.latency.items()}
+        sizes = sorted({d for d, _ in status_counts} | {d for d, _ in syndrome_counts} | set(encoded_words))
+        codecs = {}
+        for d_bits in sizes:
+            codecs[str(d_bits)] = {
+                "encoded_words": encoded_words.get(d_bits, 0),
+                "decoded_words": {name: status_counts.get((d_bits, code), 0) for code, name in enumerate(STATUS_NAMES)},
+                "syndromes": {str(s): count for (d, s), count in sorted(syndrome_counts.items()) if d == d_bits},
+            }
+        return {"codecs": codecs,
+                "latency": {op: self._latency_summary(*entry) for op, entry in sorted(latency.items())}}
+
+    def to_json(self, indent=None):
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self, prefix="hamming"):
+        # Prometheus metin biçimi (sayaçlar ve saniye cinsinden gecikme histogramı)
+        with self._lock:
+            status_counts = sorted(self.status_counts.items())
+            syndrome_counts = sorted(self.syndrome_counts.items())
+            encoded_words = sorted(self.encoded_words.items())
+            latency = sorted((op, (list(b), total, calls)) for op, (b, total, calls) in self.latency.items())
+        lines = [f"# HELP {prefix}_encoded_words_total Kodlanan kelime sayısı",
+                 f"# TYPE {prefix}_encoded_words_total counter"]
+        lines += [f'{prefix}_encoded_words_total{{d_bits="{d}"}} {count}' for d, count in encoded_words]
+        lines += [f"# HELP {prefix}_decoded_words_total Durumlara göre çözülen kelime sayısı",
+                  f"# TYPE {prefix}_decoded_words_total counter"]
+        lines += [f'{prefix}_decoded_words_total{{d_bits="{d}",status="{STATUS_NAMES[code]}"}} {count}'
+                  for (d, code), count in status_counts]
+        lines += [f"# HELP {prefix}_syndrome_total Sıfırdan farklı sendrom değerlerinin sayısı",
+                  f"# TYPE {prefix}_syndrome_total counter"]
+        lines += [f'{prefix}_syndrome_total{{d_bits="{d}",syndrome="{s}"}} {count}'
+                  for (d, s), count in syndrome_counts]
+        lines += [f"# HELP {prefix}_call_duration_seconds İşlem başına çağrı süresi",
+                  f"# TYPE {prefix}_call_duration_seconds histogram"]
+        for op, (buckets, total_ns, calls) in latency:
+            cumulative = 0
+            last = max((k for k, count in enumerate(buckets) if count), default=0)
+            for k in range(last + 1):
+                cumulative += buckets[k]
+                # Kova k'nın üst sınırı 2^k - 1 ns; sınır 2^k ns olarak yazılır
+                lines.append(f'{prefix}_call_duration_seconds_bucket{{op="{op}",le="{(1 << k) / 1e9:.9g}"}} '
+                             f"{cumulative}")
+            lines.append(f'{prefix}_call_duration_seconds_bucket{{op="{op}",le="+Inf"}} {calls}')
+            lines.append(f'{prefix}_call_duration_seconds_sum{{op="{op}"}} {total_ns / 1e9:.9g}')
+            lines.append(f'{prefix}_call_duration_seconds_count{{op="{op}"}} {calls}')
+        return "\n".join(lines) + "\n"
+
+
+# --- Etkinleştirme ---
+# Etkin ölçüm nesnesi ve değiştirilen asıl yöntemler
+_active = None
+_originals = {}
+
+
+def _timed(metrics, op, func):
+    @wraps(func)
+    def wrapper(self, *args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            metrics.observe_latency(op, perf_counter_ns() - start)
+    return wrapper
+
+
+def _counted_lookup(metrics, func):
+    @wraps(func)
+    def wrapper(self, received):
+        result = func(self, received)
+        metrics.observe_decode(self.d_bits, result[1][1], result[0])
+        return result
+    return wrapper
+
+
+def _counted_encode(metrics, func):
+    @wraps(func)
+    def wrapper(self, data):
+        code = func(self, data)
+        metrics.observe_encode(self.d_bits)
+        return code
+    return wrapper
+
+
+def enable(metrics=None):
+    # Ölçümü başlatır ve etkin CodecMetrics nesnesini döndürür; zaten açıksa mevcut nesneyi döndürür
+    global _active
+    if _active is not None:
+        return _active
+    metrics = metrics if metrics is not None else CodecMetrics()
+    for name in TIMED_METHODS + ("_lookup",):
+        _originals[name] = HammingSEC_DED.__dict__[name]
+    # encode, encode_int'i çağırdığı için kelime sayısı sadece encode_int'te artırılır
+    HammingSEC_DED._lookup = _counted_lookup(metrics, _originals["_lookup"])
+    for name in TIMED_METHODS:
+        func = _originals[name]
+        if name == "encode_int":
+            func = _counted_encode(metrics, func)
+        setattr(HammingSEC_DED, name, _timed(metrics, name, func))
+    try:
+        import hamming_batch
+    except ImportError:
+        pass
+    else:
+        hamming_batch._observer = metrics
+    _active = metrics
+    return metrics
+
+
+def disable():
+    # Asıl yöntemleri geri yükler; toplanan ölçümler nesnede kalır
+    global _active
+    if _active is None:
+        return None
+    for name, func in _originals.items():
+        setattr(HammingSEC_DED, name, func)
+    _originals.clear()
+    try:
+        import hamming_batch
+    except ImportError:
+        pass
+    else:
+        hamming_batch._observer = None
+    metrics, _active = _active, None
+    return metrics
+
+
+def active():
+    return _active
+
+
+def main(argv=None):
+    # Örnek iş yükü: rastgele kelimeleri kodlar, hata ekler, çözer ve ölçümleri yazdırır
+    parser = argparse.ArgumentParser(description="Hamming SEC-DED ölçüm katmanı örnek çalıştırması")
+    parser.add_argument("-d", "--data-bits", type=int, default=64)
+    parser.add_argument("-n", "--words", type=int, default=10000)
+    parser.add_argument("-e", "--error-rate", type=float, default=0.01, help="Bit başına hata olasılığı")
+    parser.add_argument("-f", "--format", choices=["json", "prometheus"], default="json")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    metrics = enable()
+    try:
+        codec = HammingSEC_DED(args.data_bits)
+        width = codec.total_bits + 1
+        for _ in range(args.words):
+            code = list(codec.encode(format(rng.getrandbits(args.data_bits), f"0{args.data_bits}b")))
+            for i in range(width):
+                if rng.random() < args.error_rate:
+                    code[i] = "1" if code[i] == "0" else "0"
+            codec.check_and_correct("".join(code))
+    finally:
+        disable()
+    print(metrics.to_json(indent=2) if args.format == "json" else metrics.to_prometheus().rstrip("\n"))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
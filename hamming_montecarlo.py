@@ -0,0 +1,262 @@
+# Hamming SEC-DED Monte Carlo Simülasyonu
+# HammingSEC_DED kodunu farklı kanal modelleri üzerinden çalıştırarak ham BER, kod çözme sonrası BER,
+# çerçeve hata oranı (FER) ve yanlış düzeltme oranını güven aralıklarıyla ölçer
+# Denemeler süreç havuzuna bölünür; her görev kendi tohumunu SeedSequence'tan alır, sonuçlar tekrarlanabilir
+
+import argparse
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from hamming_core import HammingSEC_DED, P0_CORRECTED, SINGLE_CORRECTED, DOUBLE_DETECTED
+from hamming_batch import encode_batch, decode_batch
+from hamming_interleave import deinterleave
+
+# Bir görevin (süreç havuzuna gönderilen iş) içerdiği deneme sayısı
+# Görev bölünmesi işçi sayısından bağımsız olduğu için aynı tohum her zaman aynı sonucu verir
+TASK_TRIALS = 1 << 18
+
+# Bir görev içinde tek seferde üretilen en fazla kanal biti (kelime sayısı x kelime genişliği)
+CHUNK_BITS = 1 << 22
+
+
+# --- Kanal Modelleri ---
+# Her kanal sample(rng, rows, width) ile hata desenlerini seyrek biçimde döndürür:
+# (hatalı satırların indeksleri, bu satırların width genişliğindeki 0/1 hata maskeleri)
+# Hatasız satırlar listelenmez; düşük hata olasılıklarında kod çözücü sadece hatalı kelimelerle çalışır
+
+def _scatter_errors(rng, counts, width):
+    # counts[i] adet farklı rastgele pozisyonu 1 olan satırlar oluşturur
+    errors = np.zeros((len(counts), width), dtype=np.uint8)
+    for weight in np.unique(counts):
+        rows = np.nonzero(counts == weight)[0]
+        if weight == 0:
+            continue
+        if weight >= width:
+            errors[rows] = 1
+            continue
+        positions = rng.random((len(rows), width)).argpartition(weight - 1, axis=1)[:, :weight]
+        block = errors[rows]
+        np.put_along_axis(block, positions, 1, axis=1)
+        errors[rows] = block
+    return errors
+
+
+class BinarySymmetricChannel:
+    # Her bit birbirinden bağımsız olarak p olasılığıyla ters çevrilir
+    def __init__(self, p):
+        if not 0 <= p <= 1:
+            raise ValueError("Hata olasılığı 0 ile 1 arasında olmalıdır.")
+        self.p = p
+
+    def sample(self, rng, rows, width):
+        # Kelime başına hata sayısı binom dağılımından çekilir, sonra pozisyonlar seçilir
+        counts = rng.binomial(width, self.p, rows)
+        hit = np.nonzero(counts)[0]
+        return hit, _scatter_errors(rng, counts[hit], width)
+
+    def __repr__(self):
+        return f"BinarySymmetricChannel(p={self.p})"
+
+
+class FixedWeightChannel:
+    # Her kelimede tam olarak weight adet farklı bit ters çevrilir
+    def __init__(self, weight):
+        if weight < 0:
+            raise ValueError("Hata sayısı negatif olamaz.")
+        self.weight = weight
+
+    def sample(self, rng, rows, width):
+        if self.weight == 0:
+            return np.zeros(0, dtype=np.intp), np.zeros((0, width), dtype=np.uint8)
+        counts = np.full(rows, min(self.weight, width))
+        return np.arange(rows), _scatter_errors(rng, counts, width)
+
+    def __repr__(self):
+        return f"FixedWeightChannel(weight={self.weight})"
+
+
+class BurstChannel:
+    # Her kelimede p olasılığıyla, rastgele bir başlangıçtan itibaren length ardışık bit ters çevrilir
+    def __init__(self, length, p=1.0):
+        if length < 1:
+            raise ValueError("Patlama uzunluğu en az 1 olmalıdır.")
+        if not 0 <= p <= 1:
+            raise ValueError("Patlama olasılığı 0 ile 1 arasında olmalıdır.")
+        self.length = length
+        self.p = p
+
+    def sample(self, rng, rows, width):
+        hit = np.nonzero(rng.random(rows) < self.p)[0] if self.p < 1 else np.arange(rows)
+        length = min(self.length, width)
+        starts = rng.integers(0, width - length + 1, len(hit))
+        offsets = np.arange(width)
+        errors = ((offsets >= starts[:, None]) & (offsets < starts[:, None] + length)).astype(np.uint8)
+        return hit, errors
+
+    def __repr__(self):
+        return f"BurstChannel(length={self.length}, p={self.p})"
+
+
+# Komut satırında -v verilmezse kullanılan kanal parametreleri
+DEFAULT_VALUES = {"bsc": "1e-3", "fixed": "2", "burst": "4"}
+
+
+def make_channel(name, value):
+    # Komut satırı ve tarama için isimden kanal oluşturur: "bsc" (p), "fixed" (hata sayısı), "burst" (uzunluk)
+    if name == "bsc":
+        return BinarySymmetricChannel(float(value))
+    if name == "fixed":
+        return FixedWeightChannel(int(value))
+    if name == "burst":
+        return BurstChannel(int(value))
+    raise ValueError(f"Bilinmeyen kanal modeli: {name}")
+
+
+# --- Simülasyon ---
+
+def _empty_counts():
+    return {"words": 0, "channel_bits": 0, "channel_errors": 0, "data_bits": 0, "data_errors": 0,
+            "frame_errors": 0, "corrected": 0, "detected": 0, "miscorrected": 0}
+
+
+def run_trials(d_bits, channel, trials, seed, random_data=False, depth=1):
+    # Tek bir süreçte trials adet kelimeyi kanaldan geçirir ve sayaçları döndürür
+    # Kod doğrusal olduğu için sonuçlar veriden bağımsızdır; varsayılan olarak sıfır kod kelimesi kullanılır
+    # depth > 1 ise kanal depth kelimelik serpiştirilmiş çerçevelere uygulanır (hamming_interleave);
+    # deneme sayısı tam çerçeve sayısına yukarı yuvarlanır
+    codec = HammingSEC_DED(d_bits)
+    width = codec.total_bits + 1
+    frame_width = depth * width
+    frames = -(-trials // depth)
+    trials = frames * depth
+    rng = np.random.default_rng(seed)
+    counts = _empty_counts()
+    counts["words"] = trials
+    counts["channel_bits"] = trials * width
+    counts["data_bits"] = trials * d_bits
+
+    # Geniş kelimelerde bellek kullanımını sınırlamak için denemeler parçalar halinde üretilir
+    step = max(1, CHUNK_BITS // frame_width)
+    for start in range(0, frames, step):
+        hit, errors = channel.sample(rng, min(step, frames - start), frame_width)
+        counts["channel_errors"] += int(errors.sum())
+        if len(hit) == 0:
+            continue
+        if depth > 1:
+            # Çerçevelerin kanal sırasındaki hatalarını kelimelere dağıt; hatasız kelimeler atlanır
+            errors = deinterleave(errors.reshape(-1, width), depth)
+            errors = errors[errors.any(axis=1)]
+
+        if random_data:
+            data = rng.integers(0, 2, (len(errors), d_bits), dtype=np.uint8)
+            received = encode_batch(codec, data) ^ errors
+        else:
+            data = np.zeros((len(errors), d_bits), dtype=np.uint8)
+            received = errors
+        result = decode_batch(codec, received)
+
+        bit_errors = (result["corrected_data"] != data).sum(axis=1)
+        wrong = bit_errors > 0
+        status = result["status"]
+        detected = status == DOUBLE_DETECTED
+        counts["data_errors"] += int(bit_errors.sum())
+        counts["frame_errors"] += int(wrong.sum())
+        counts["detected"] += int(detected.sum())
+        # Kod çözücü başarı bildirdiği halde verinin yanlış olduğu kelimeler (sessiz veri bozulması)
+        counts["miscorrected"] += int((wrong & ~detected).sum())
+        counts["corrected"] += int((~wrong & ((status == P0_CORRECTED) | (status == SINGLE_CORRECTED))).sum())
+    return counts
+
+
+def wilson_interval(successes, total, z=1.96):
+    # Bir oran için Wilson skor güven aralığı (varsayılan %95)
+    if total == 0:
+        return 0.0, 1.0
+    rate = successes / total
+    denom = 1 + z * z / total
+    center = (rate + z * z / (2 * total)) / denom
+    margin = z * math.sqrt(rate * (1 - rate) / total + z * z / (4 * total * total)) / denom
+    return max(0.0, center - margin), min(1.0, center + margin)
+
+
+def summarize(counts, z=1.96):
+    # Sayaçlardan oranları ve güven aralıklarını hesaplar
+    report = dict(counts)
+    for name, num, den in (("raw_ber", "channel_errors", "channel_bits"),
+                           ("post_ber", "data_errors", "data_bits"),
+                           ("fer", "frame_errors", "words"),
+                           ("miscorrection_rate", "miscorrected", "words"),
+                           ("detection_rate", "detected", "words")):
+        total = counts[den]
+        report[name] = counts[num] / total if total else 0.0
+        report[name + "_ci"] = wilson_interval(counts[num], total, z)
+    return report
+
+
+def run_simulation(d_bits, channel, trials, seed=0, workers=None, random_data=False, task_trials=TASK_TRIALS,
+                   depth=1):
+    # trials adet denemeyi görevlere bölerek süreç havuzunda çalıştırır ve özet raporu döndürür
+    # workers=1 ise havuz kurulmadan aynı süreçte çalışır
+    # Görevler tam çerçevelerden oluşur; sadece son görev yukarı yuvarlanabilir
+    task_trials = max(1, task_trials // depth) * depth
+    sizes = [task_trials] * (trials // task_trials)
+    if trials % task_trials:
+        sizes.append(trials % task_trials)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    jobs = [(d_bits, channel, size, task_seed, random_data, depth) for size, task_seed in zip(sizes, seeds)]
+
+    totals = _empty_counts()
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(jobs) <= 1:
+        for counts in (run_trials(*job) for job in jobs):
+            for key, value in counts.items():
+                totals[key] += value
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            for counts in pool.map(run_trials, *zip(*jobs)):
+                for key, value in counts.items():
+                    totals[key] += value
+    return summarize(totals)
+
+
+def format_report(report):
+    # Raporu okunabilir metne dönüştürür
+    lines = [f"Kelime: {report['words']}"]
+    for name, label in (("raw_ber", "Ham BER"), ("post_ber", "Çözme sonrası BER"), ("fer", "FER"),
+                        ("miscorrection_rate", "Yanlış düzeltme oranı"), ("detection_rate", "Çift hata tespit oranı")):
+        low, high = report[name + "_ci"]
+        lines.append(f"{label}: {report[name]:.3e} (%95 GA: {low:.3e} - {high:.3e})")
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hamming SEC-DED Monte Carlo BER/FER simülasyonu")
+    parser.add_argument("-d", "--data-bits", type=int, default=64)
+    parser.add_argument("-c", "--channel", choices=["bsc", "fixed", "burst"], default="bsc")
+    parser.add_argument("-v", "--value", default=None,
+                        help="bsc: hata olasılığı (varsayılan 1e-3), fixed: hata sayısı (2), burst: uzunluk (4)")
+    parser.add_argument("-n", "--trials", type=int, default=1_000_000)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    parser.add_argument("--random-data", action="store_true", help="Sıfır yerine rastgele veri kodla")
+    parser.add_argument("--depth", type=int, default=1,
+                        help="Serpiştirme derinliği; 1'den büyükse kanal modeli depth kelimelik çerçevelere uygulanır")
+    args = parser.parse_args(argv)
+    if args.depth < 1:
+        parser.error("Serpiştirme derinliği en az 1 olmalıdır.")
+    value = args.value if args.value is not None else DEFAULT_VALUES[args.channel]
+    try:
+        channel = make_channel(args.channel, value)
+    except ValueError as e:
+        parser.error(f"Geçersiz kanal değeri: {e}")
+    report = run_simulation(args.data_bits, channel, args.trials,
+                            seed=args.seed, workers=args.workers, random_data=args.random_data, depth=args.depth)
+    print(format_report(report))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,247 @@
+# Hamming SEC-DED TCP Kodlama Servisi
+# Yerel bir TCP soketi üzerinden çerçevelenmiş veriyi alır, HammingSEC_DED ile kodlar veya çözer ve sonucu
+# parçalar halinde geri gönderir; her parçadan sonra drain() beklenerek yavaş istemcilere karşı geri basınç uygulanır
+# İstemci, kodlama ile çözme arasına kanal hatası ekler ve uçtan uca verim ile gecikmeyi raporlar
+#
+# İstek çerçevesi:  işlem (1 bayt, b"E" kodla / b"D" çöz) | d_bits (2 bayt) | uzunluk (4 bayt) | veri
+# Yanıt çerçevesi:  durum (1 bayt, 0 başarılı / 1 hata) | düzeltilen (4 bayt) | düzeltilemeyen (4 bayt) | uzunluk (4 bayt) | veri
+# Kodlanmış veri hamming_stream akış biçimindedir (başlık, kod kelimeleri, bitiş kaydı)
+
+import argparse
+import asyncio
+import functools
+import io
+import math
+import random
+import struct
+import sys
+import time
+
+from hamming_core import HammingSEC_DED
+from hamming_stream import STREAM_MAGIC, encode_stream, decode_stream, read_stream_header, read_chunks
+
+REQUEST_HEADER = struct.Struct(">cHI")
+RESPONSE_HEADER = struct.Struct(">BIII")
+MAX_FRAME_SIZE = 64 << 20
+# Yanıtlar bu boyuttaki parçalar halinde yazılır; her parçadan sonra istemcinin okuması beklenir
+WRITE_CHUNK_SIZE = 1 << 16
+# İstemcinin isteyebileceği en büyük veri biti sayısı; tablolar ve matrisler boyutla birlikte büyür
+MAX_DATA_BITS = 4096
+# Boyuta özel önbelleklerde (tablolar, matrisler, üretilmiş çekirdekler) tutulan en fazla farklı boyut
+MAX_CACHED_SIZES = 16
+
+
+def _check_data_bits(d_bits, max_data_bits):
+    if d_bits <= 0 or d_bits > max_data_bits:
+        raise ValueError(f"Veri biti sayısı 1 ile {max_data_bits} arasında olmalıdır.")
+
+
+def _trim_caches(limit=MAX_CACHED_SIZES):
+    # Ağdan gelen her yeni boyut önbelleklere bir giriş ekler; en eski girişler atılarak bellek sınırlanır
+    # Yalnızca yüklenmiş modüllerin önbelleklerine bakılır; atılan girişi kullanan kodlayıcı kendi kopyasını tutar
+    caches = [HammingSEC_DED._table_cache]
+    for name, attr in (("hamming_batch", "_matrix_cache"), ("hamming_codegen", "_kernels")):
+        module = sys.modules.get(name)
+        if module is not None:
+            caches.append(getattr(module, attr))
+    for cache in caches:
+        for key in list(cache)[:-limit]:
+            cache.pop(key, None)
+
+
+def _encode_payload(d_bits, payload, max_data_bits=MAX_DATA_BITS):
+    _check_data_bits(d_bits, max_data_bits)
+    return b"".join(encode_stream(HammingSEC_DED(d_bits), [payload]))
+
+
+def _decode_payload(payload, max_data_bits=MAX_DATA_BITS):
+    # Başlıktaki boyut, kodlayıcı oluşturulmadan önce sınırlanır (iki başlık biçiminde de sihirli sözcükten sonra gelir)
+    if len(payload) >= len(STREAM_MAGIC) + 2:
+        _check_data_bits(int.from_bytes(payload[len(STREAM_MAGIC):len(STREAM_MAGIC) + 2], "big"), max_data_bits)
+    stream = io.BytesIO(payload)
+    stats = {}
+    codec, depth = read_stream_header(stream)
+    data = b"".join(decode_stream(codec, read_chunks(stream), stats, depth))
+    return data, stats
+
+
+async def _send_response(writer, status, payload, corrected=0, uncorrectable=0):
+    writer.write(RESPONSE_HEADER.pack(status, corrected, uncorrectable, len(payload)))
+    view = memoryview(payload)
+    for start in range(0, len(view), WRITE_CHUNK_SIZE):
+        writer.write(view[start:start + WRITE_CHUNK_SIZE])
+        await writer.drain()
+    await writer.drain()
+
+
+async def handle_client(reader, writer, max_data_bits=MAX_DATA_BITS):
+    # Bağlantı kapanana kadar çerçeveleri sırayla işler
+    # Kodlama işi olay döngüsünü bloklamaması için iş parçacığı havuzunda çalıştırılır
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            try:
+                header = await reader.readexactly(REQUEST_HEADER.size)
+            except asyncio.IncompleteReadError:
+                break
+            op, d_bits, length = REQUEST_HEADER.unpack(header)
+            if length > MAX_FRAME_SIZE:
+                await _send_response(writer, 1, "Çerçeve çok büyük.".encode("utf-8"))
+                break
+            payload = await reader.readexactly(length)
+            try:
+                if op == b"E":
+                    result = await loop.run_in_executor(None, _encode_payload, d_bits, payload, max_data_bits)
+                    await _send_response(writer, 0, result)
+                elif op == b"D":
+                    result, stats = await loop.run_in_executor(None, _decode_payload, payload, max_data_bits)
+                    await _send_response(writer, 0, result, stats["corrected"], stats["uncorrectable"])
+                else:
+                    await _send_response(writer, 1, "Bilinmeyen işlem.".encode("utf-8"))
+            except ValueError as e:
+                await _send_response(writer, 1, str(e).encode("utf-8"))
+            except MemoryError:
+                await _send_response(writer, 1, "İstek için yeterli bellek yok.".encode("utf-8"))
+            finally:
+                _trim_caches()
+    except (ConnectionError, asyncio.IncompleteReadError):
+        pass
+    finally:
+        writer.close()
+
+
+async def start_server(host="127.0.0.1", port=8765, max_data_bits=MAX_DATA_BITS):
+    return await asyncio.start_server(functools.partial(handle_client, max_data_bits=max_data_bits), host, port)
+
+
+# --- İstemci ---
+
+async def request(reader, writer, op, payload, d_bits=0):
+    # Bir istek gönderir ve (durum, düzeltilen, düzeltilemeyen, veri) döndürür
+    writer.write(REQUEST_HEADER.pack(op, d_bits, len(payload)))
+    writer.write(payload)
+    await writer.drain()
+    status, corrected, uncorrectable, length = RESPONSE_HEADER.unpack(await reader.readexactly(RESPONSE_HEADER.size))
+    return status, corrected, uncorrectable, await reader.readexactly(length)
+
+
+def inject_errors(encoded, error_rate, rng, skip=0):
+    # Kodlanmış akışın bitlerini error_rate olasılığıyla çevirir (ilk skip bayt, yani başlık, korunur)
+    # Hatalar arası mesafe geometrik dağılımdan çekilir; maliyet hata sayısıyla orantılıdır
+    data = bytearray(encoded)
+    flips = 0
+    if error_rate <= 0:
+        return bytes(data), flips
+    if error_rate >= 1:
+        raise ValueError("Hata olasılığı 1'den küçük olmalıdır.")
+    log_q = math.log1p(-error_rate)
+    bit = skip * 8 - 1
+    total = len(data) * 8
+    while True:
+        bit += 1 + int(math.log(1.0 - rng.random()) / log_q)
+        if bit >= total:
+            return bytes(data), flips
+        data[bit >> 3] ^= 0x80 >> (bit & 7)
+        flips += 1
+
+
+async def _client_worker(host, port, frames, frame_size, d_bits, error_rate, seed, stats):
+    rng = random.Random(seed)
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(frames):
+            payload = rng.randbytes(frame_size)
+            start = time.perf_counter()
+            status, _, _, encoded = await request(reader, writer, b"E", payload, d_bits)
+            if status:
+                raise RuntimeError(encoded.decode("utf-8"))
+            received, flips = inject_errors(encoded, error_rate, rng, skip=len(STREAM_MAGIC) + 2)
+            status, corrected, uncorrectable, decoded = await request(reader, writer, b"D", received)
+            stats["latencies"].append(time.perf_counter() - start)
+            stats["bytes"] += frame_size
+            stats["flips"] += flips
+            if status:
+                stats["failed"] += 1
+                continue
+            stats["corrected"] += corrected
+            stats["uncorrectable"] += uncorrectable
+            stats["mismatched"] += decoded != payload
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+
+async def run_client(host="127.0.0.1", port=8765, connections=8, frames=100, frame_size=1 << 16, d_bits=64,
+                     error_rate=1e-4, seed=0):
+    # connections adet eşzamanlı bağlantıyla yük testi yapar ve özet döndürür
+    stats = {"latencies": [], "bytes": 0, "flips": 0, "corrected": 0, "uncorrectable": 0, "mismatched": 0,
+             "failed": 0}
+    start = time.perf_counter()
+    await asyncio.gather(*(_client_worker(host, port, frames, frame_size, d_bits, error_rate, seed + i, stats)
+                           for i in range(connections)))
+    elapsed = time.perf_counter() - start
+    latencies = sorted(stats.pop("latencies"))
+    stats.update({
+        "elapsed": elapsed,
+        "frames": len(latencies),
+        "throughput_mb_s": stats["bytes"] / elapsed / 1e6,
+        "latency_p50_ms": latencies[len(latencies) // 2] * 1e3 if latencies else 0.0,
+        "latency_p99_ms": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1e3 if latencies else 0.0,
+    })
+    return stats
+
+
+async def _bench(args):
+    server = await start_server(args.host, args.port, args.max_data_bits) if args.local else None
+    try:
+        return await run_client(args.host, args.port, args.connections, args.frames, args.size, args.data_bits,
+                                args.error_rate, args.seed)
+    finally:
+        if server:
+            server.close()
+            await server.wait_closed()
+
+
+async def _serve(args):
+    server = await start_server(args.host, args.port, args.max_data_bits)
+    print(f"Dinleniyor: {args.host}:{args.port}", flush=True)
+    async with server:
+        await server.serve_forever()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hamming SEC-DED TCP kodlama servisi ve yük testi istemcisi")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    serve_parser = subparsers.add_parser("serve", help="Servisi başlat")
+    bench_parser = subparsers.add_parser("bench", help="Hata ekleyen istemciyle yük testi yap")
+    for sub in (serve_parser, bench_parser):
+        sub.add_argument("--host", default="127.0.0.1")
+        sub.add_argument("--port", type=int, default=8765)
+        sub.add_argument("--max-data-bits", type=int, default=MAX_DATA_BITS,
+                         help="Servisin kabul ettiği en büyük veri biti sayısı")
+    bench_parser.add_argument("-c", "--connections", type=int, default=8)
+    bench_parser.add_argument("-f", "--frames", type=int, default=100, help="Bağlantı başına çerçeve sayısı")
+    bench_parser.add_argument("-s", "--size", type=int, default=1 << 16, help="Çerçeve boyutu (bayt)")
+    bench_parser.add_argument("-d", "--data-bits", type=int, default=64)
+    bench_parser.add_argument("-e", "--error-rate", type=float, default=1e-4, help="Kanal bit hata olasılığı")
+    bench_parser.add_argument("--seed", type=int, default=0)
+    bench_parser.add_argument("--local", action="store_true", help="Servisi aynı süreçte başlat")
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        try:
+            asyncio.run(_serve(args))
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    stats = asyncio.run(_bench(args))
+    print(f"Çerçeve: {stats['frames']}, süre: {stats['elapsed']:.2f} s, verim: {stats['throughput_mb_s']:.2f} MB/s")
+    print(f"Gecikme (kodla + çöz): p50 {stats['latency_p50_ms']:.2f} ms, p99 {stats['latency_p99_ms']:.2f} ms")
+    print(f"Kanal hatası: {stats['flips']}, düzeltilen: {stats['corrected']}, "
+          f"düzeltilemeyen: {stats['uncorrectable']}, hatalı çerçeve: {stats['mismatched']}, başarısız: {stats['failed']}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
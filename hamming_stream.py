@@ -0,0 +1,199 @@
+# Hamming SEC-DED Akış Kodlayıcı
+# Dosya veya stdin akışını sabit bellekle, büyük parçalar halinde kodlar/çözer
+# Akış biçimi: başlık (STREAM_MAGIC + 2 bayt d_bits), kod kelimeleri; verinin sonuna sıfır dolgu ve bitiş kaydı
+# (END_MAGIC + 8 bayt toplam veri uzunluğu) eklenip kelimelere tamamlanır. Çözücü bitiş kaydını ve uzunluğu
+# doğrular; böylece kelime sınırında kesilmiş bir akış da her zaman tespit edilir
+# Her kod kelimesi ceil((n+1)/8) bayta yazılır; bitler P0'dan başlar, sondaki fazla bitler 0'dır (np.packbits ile aynı)
+# Blok fonksiyonları encode_int/decode_int ve encode_batch/decode_batch sunan her kodlayıcıyla çalışır (ör. HsiaoSEC_DED)
+# Veri biti sayısı hamming_batch.MAX_DATA_BITS üzerindeyse NumPy kurulu olsa da kelime kelime encode_int/decode_int kullanılır
+# Serpiştirilmiş akış (depth > 1, NumPy gerektirir): başlık INTERLEAVED_MAGIC + 2 bayt d_bits + 2 bayt derinlik;
+# akışın başından itibaren her depth kod kelimesi hamming_interleave ile serpiştirilir. Son çerçeve de tam olsun diye
+# sıfır dolgu, bitiş kaydı son çerçevenin sonuna denk gelecek şekilde uzatılır
+
+from hamming_core import HammingSEC_DED, P0_CORRECTED, SINGLE_CORRECTED, DOUBLE_DETECTED, status_code
+
+STREAM_MAGIC = b"HSD\x01"
+INTERLEAVED_MAGIC = b"HSD\x02"
+END_MAGIC = b"HSDE"
+TRAILER_SIZE = len(END_MAGIC) + 8
+MAX_DEPTH = (1 << 16) - 1
+STREAM_CHUNK_SIZE = 1 << 20
+
+
+def _batch_module(codec):
+    # NumPy kuruluysa ve kelime boyutu toplu matrislere uygunsa toplu kodlayıcıyı, değilse None döndürür
+    try:
+        import hamming_batch
+    except ImportError:
+        return None
+    if codec.d_bits > hamming_batch.MAX_DATA_BITS:
+        return None
+    return hamming_batch
+
+
+def _stream_layout(codec):
+    # (veri kelimesi bayt sayısı, kod kelimesi bayt sayısı, kod kelimesi sonundaki dolgu bit sayısı)
+    if codec.d_bits % 8:
+        raise ValueError("Akış kodlaması için veri biti sayısı 8'in katı olmalıdır.")
+    code_bytes = (codec.total_bits + 8) // 8
+    return codec.d_bits // 8, code_bytes, code_bytes * 8 - codec.total_bits - 1
+
+
+def read_chunks(stream, chunk_size=STREAM_CHUNK_SIZE):
+    # Akışı chunk_size baytlık parçalar halinde okur
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _check_depth(depth, word_bytes):
+    if word_bytes <= 0:
+        raise ValueError("Veri biti sayısı pozitif olmalıdır.")
+    if not 1 <= depth <= MAX_DEPTH:
+        raise ValueError(f"Serpiştirme derinliği 1 ile {MAX_DEPTH} arasında olmalıdır.")
+    if depth > 1:
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            raise ValueError("Serpiştirme için NumPy gereklidir.") from None
+
+
+def _encode_block(codec, block, batch, depth=1):
+    # Tam veri kelimelerinden oluşan bir bloğu kod kelimesi baytlarına dönüştürür
+    # block bayt benzeri herhangi bir nesne olabilir (bytes, bytearray, memoryview); NumPy yolunda kopyalanmaz
+    # depth > 1 ise blok çerçeve sınırında başlamalıdır
+    word_bytes, code_bytes, pad_bits = _stream_layout(codec)
+    if batch is not None:
+        import numpy as np
+        words = np.frombuffer(block, dtype=np.uint8).reshape(-1, word_bytes)
+        codewords = codec.encode_batch(words, packed=True)
+    else:
+        codewords = b"".join((codec.encode_int(int.from_bytes(block[i:i + word_bytes], "big")) << pad_bits)
+                             .to_bytes(code_bytes, "big") for i in range(0, len(block), word_bytes))
+        if depth == 1:
+            return codewords
+        import numpy as np
+        codewords = np.frombuffer(codewords, dtype=np.uint8).reshape(-1, code_bytes)
+    if depth > 1:
+        from hamming_interleave import interleave
+        codewords = interleave(codewords, depth, packed=True)
+    return codewords.tobytes()
+
+
+def _decode_block(codec, block, batch, stats, depth=1):
+    # Kod kelimesi baytlarından oluşan bir bloğu çözer, istatistikleri günceller ve veri baytlarını döndürür
+    word_bytes, code_bytes, pad_bits = _stream_layout(codec)
+    if depth > 1:
+        import numpy as np
+        from hamming_interleave import deinterleave
+        block = deinterleave(np.frombuffer(block, dtype=np.uint8).reshape(-1, code_bytes), depth, packed=True).tobytes()
+    if batch is not None:
+        import numpy as np
+        words = np.frombuffer(block, dtype=np.uint8).reshape(-1, code_bytes)
+        result = codec.decode_batch(words, packed=True)
+        counts = np.bincount(result["status"], minlength=4)
+        statuses = [int(c) for c in counts]
+        data = result["corrected_data"].tobytes()
+    else:
+        statuses = [0, 0, 0, 0]
+        parts = []
+        for i in range(0, len(block), code_bytes):
+            result = codec.decode_int(int.from_bytes(block[i:i + code_bytes], "big") >> pad_bits)
+            statuses[status_code(result["error_pos"])] += 1
+            parts.append(result["corrected_data"].to_bytes(word_bytes, "big"))
+        data = b"".join(parts)
+    stats["words"] += sum(statuses)
+    stats["corrected"] += statuses[P0_CORRECTED] + statuses[SINGLE_CORRECTED]
+    stats["uncorrectable"] += statuses[DOUBLE_DETECTED]
+    return data
+
+
+def encode_stream(codec, chunks, depth=1):
+    # Veri parçalarını alır, kodlanmış akışın parçalarını üretir
+    # depth > 1 ise kod kelimeleri depth kelimelik çerçevelerle serpiştirilir
+    word_bytes, _, _ = _stream_layout(codec)
+    batch = _batch_module(codec)
+    _check_depth(depth, word_bytes)
+    if depth > 1:
+        yield INTERLEAVED_MAGIC + codec.d_bits.to_bytes(2, "big") + depth.to_bytes(2, "big")
+    else:
+        yield STREAM_MAGIC + codec.d_bits.to_bytes(2, "big")
+    # Bloklar tam çerçevelerden oluşur, böylece her blok bir çerçeve sınırında başlar
+    frame_bytes = word_bytes * depth
+    buffer = bytearray()
+    length = 0
+    for chunk in chunks:
+        buffer += chunk
+        length += len(chunk)
+        full = len(buffer) - len(buffer) % frame_bytes
+        if full:
+            yield _encode_block(codec, buffer[:full], batch, depth)
+            del buffer[:full]
+    # Bitiş kaydı son çerçevenin sonuna gelecek şekilde araya sıfır dolgu eklenir
+    buffer += bytes(-(len(buffer) + TRAILER_SIZE) % frame_bytes)
+    buffer += END_MAGIC + length.to_bytes(8, "big")
+    yield _encode_block(codec, buffer, batch, depth)
+
+
+def _read_exact(stream, size):
+    data = b""
+    while len(data) < size:
+        part = stream.read(size - len(data))
+        if not part:
+            break
+        data += part
+    return data
+
+
+def read_stream_header(stream):
+    # Kodlanmış akışın başlığını okur; (kodlayıcı, serpiştirme derinliği) döndürür
+    header = _read_exact(stream, len(STREAM_MAGIC) + 2)
+    if len(header) != len(STREAM_MAGIC) + 2 or header[:len(STREAM_MAGIC)] not in (STREAM_MAGIC, INTERLEAVED_MAGIC):
+        raise ValueError("Geçersiz kodlanmış akış başlığı.")
+    depth = 1
+    if header.startswith(INTERLEAVED_MAGIC):
+        extra = _read_exact(stream, 2)
+        depth = int.from_bytes(extra, "big")
+        if len(extra) != 2 or depth < 1:
+            raise ValueError("Geçersiz kodlanmış akış başlığı.")
+    d_bits = int.from_bytes(header[len(STREAM_MAGIC):], "big")
+    if d_bits == 0 or d_bits % 8:
+        raise ValueError("Geçersiz kodlanmış akış başlığı.")
+    return HammingSEC_DED(d_bits), depth
+
+
+def decode_stream(codec, chunks, stats, depth=1):
+    # Kod kelimesi parçalarını alır, düzeltilmiş veri parçalarını üretir
+    # stats: "words", "corrected" ve "uncorrectable" sayaçları güncellenir
+    # depth, read_stream_header'ın döndürdüğü serpiştirme derinliğidir
+    word_bytes, code_bytes, _ = _stream_layout(codec)
+    batch = _batch_module(codec)
+    _check_depth(depth, word_bytes)
+    stats.setdefault("words", 0)
+    stats.setdefault("corrected", 0)
+    stats.setdefault("uncorrectable", 0)
+    # Dolgu (bir çerçeveden az) ve bitiş kaydını içerebilecek son kelimeler akış bitene kadar bekletilir;
+    # bloklar tam çerçevelerden oluşur
+    hold = depth + -(-TRAILER_SIZE // word_bytes)
+    buffer = bytearray()
+    emitted = 0
+    for chunk in chunks:
+        buffer += chunk
+        full = (len(buffer) // code_bytes - hold) // depth * depth * code_bytes
+        if full > 0:
+            data = _decode_block(codec, buffer[:full], batch, stats, depth)
+            emitted += len(data)
+            yield data
+            del buffer[:full]
+    if len(buffer) % code_bytes or not buffer:
+        raise ValueError("Kodlanmış akış eksik veya bozuk.")
+    data = _decode_block(codec, buffer, batch, stats, depth)
+    remaining = int.from_bytes(data[-8:], "big") - emitted
+    padding = len(data) - TRAILER_SIZE - remaining
+    if data[-TRAILER_SIZE:-8] != END_MAGIC or remaining < 0 or not 0 <= padding < word_bytes * depth:
+        raise ValueError("Kodlanmış akış eksik veya bozuk (bitiş kaydı geçersiz).")
+    # Sadece dolgu ve bitiş kaydı taşıyan kelimeler istatistiklere dahil edilmez
+    stats["words"] -= len(data) // word_bytes - -(-remaining // word_bytes)
+    yield data[:remaining]
@@ -0,0 +1,165 @@
+# Hamming SEC-DED Parametre Taraması
+# (d_bits, kanal modeli, kanal parametresi) ızgarasındaki her noktayı Monte Carlo simülasyonuyla çalıştırır
+# Biten her nokta, parametreleri ve kod sürümüyle anahtarlanarak yerel bir sonuç deposuna (JSON satırları) yazılır
+# Tarama tekrar çalıştırıldığında veya genişletildiğinde sadece eksik noktalar hesaplanır; yarıda kesilen tarama kaldığı yerden devam eder
+
+import argparse
+import hashlib
+import json
+import os
+
+import hamming_batch
+import hamming_codegen
+import hamming_core
+import hamming_interleave
+import hamming_montecarlo
+
+DEFAULT_STORE = "hamming_sweep_results.jsonl"
+# Her kanal modelinin kendi parametre listesi vardır: bsc hata olasılığı, fixed hata sayısı, burst uzunluk
+DEFAULT_VALUES = {"bsc": ["1e-4", "1e-3", "1e-2"], "fixed": ["1", "2", "3"], "burst": ["2", "4", "8"]}
+
+
+def code_version():
+    # Sonuçları etkileyen kodun (çekirdek kodlayıcı, üretilmiş çekirdekler, toplu işlem, serpiştirme ve simülasyon
+    # modülleri) özet değeri
+    # Bu kodlardan biri değişirse eski sonuçlar kullanılmaz
+    digest = hashlib.sha256()
+    for module in (hamming_core, hamming_codegen, hamming_batch, hamming_interleave, hamming_montecarlo):
+        with open(module.__file__, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+class ResultStore:
+    # Sonuçları satır başına bir JSON kaydı olarak tutar; her kayıt yazıldıktan hemen sonra diske aktarılır
+    def __init__(self, path=DEFAULT_STORE):
+        self.path = path
+        self.results = {}
+        self._partial_line = False
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    self._partial_line = not line.endswith("\n")
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        # Kesinti sırasında yarım kalmış son satır atlanır
+                        continue
+                    self.results[self.key_of(record["params"])] = record
+
+    @staticmethod
+    def key_of(params):
+        return json.dumps(params, sort_keys=True)
+
+    def get(self, params):
+        record = self.results.get(self.key_of(params))
+        return None if record is None else record["report"]
+
+    def put(self, params, report):
+        record = {"params": params, "report": report}
+        with open(self.path, "a", encoding="utf-8") as f:
+            # Yarım kalmış satır varsa yeni kayıt ona eklenmesin
+            f.write(("\n" if self._partial_line else "") + json.dumps(record) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._partial_line = False
+        self.results[self.key_of(params)] = record
+
+
+def normalize_value(channel, value):
+    # "1e-3" ile 0.001 aynı noktayı göstermeli; değer anahtara normalize edilerek yazılır
+    # Kanal için geçersiz değerlerde ValueError verir
+    value = float(value) if channel == "bsc" else int(value)
+    hamming_montecarlo.make_channel(channel, value)
+    return value
+
+
+def sweep_points(d_bits_list, channel_values):
+    # Izgaradaki tüm (d_bits, kanal, değer) üçlülerini sırayla üretir
+    # channel_values: kanal -> o kanalın parametre listesi
+    for d_bits in d_bits_list:
+        for channel, values in channel_values.items():
+            for value in values:
+                yield d_bits, channel, value
+
+
+def run_sweep(d_bits_list, channel_values, trials, seed=0, workers=None, random_data=False,
+              store=None, progress=None):
+    # Izgarayı çalıştırır; depoda bulunan noktalar yeniden hesaplanmaz
+    # progress: her nokta için (parametreler, rapor, depodan mı geldi) ile çağrılan isteğe bağlı fonksiyon
+    # Tüm değerler herhangi bir nokta çalışmadan önce doğrulanır
+    channel_values = {channel: [normalize_value(channel, value) for value in values]
+                      for channel, values in channel_values.items()}
+    store = store if store is not None else ResultStore()
+    version = code_version()
+    results = []
+    for d_bits, channel, value in sweep_points(d_bits_list, channel_values):
+        params = {"d_bits": d_bits, "channel": channel, "value": value, "trials": trials,
+                  "seed": seed, "random_data": random_data, "code_version": version}
+        report = store.get(params)
+        cached = report is not None
+        if not cached:
+            report = hamming_montecarlo.run_simulation(d_bits, hamming_montecarlo.make_channel(channel, value), trials,
+                                                       seed=seed, workers=workers, random_data=random_data)
+            store.put(params, report)
+        results.append((params, report))
+        if progress:
+            progress(params, report, cached)
+    return results
+
+
+def parse_values(channels, specs):
+    # -v girdilerini kanal -> değer listesi sözlüğüne çevirir
+    # "bsc=1e-4,1e-3" biçimi bir kanalın değerlerini verir; sadece değerler verilirse tek bir kanal seçili olmalıdır
+    # Değer verilmeyen kanallar DEFAULT_VALUES kullanır
+    values = {}
+    plain = []
+    for spec in specs or []:
+        if "=" in spec:
+            channel, _, items = spec.partition("=")
+            if channel not in channels:
+                raise ValueError(f"Seçilmeyen kanal için değer verildi: {channel}")
+            values.setdefault(channel, []).extend(item for item in items.split(",") if item)
+        else:
+            plain.append(spec)
+    if plain:
+        if len(channels) != 1:
+            raise ValueError("Birden fazla kanalda değerler kanal=değer1,değer2 biçiminde verilmelidir.")
+        values.setdefault(channels[0], []).extend(plain)
+    return {channel: values.get(channel) or DEFAULT_VALUES[channel] for channel in dict.fromkeys(channels)}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hamming SEC-DED parametre taraması (kaldığı yerden devam eder)")
+    parser.add_argument("-d", "--data-bits", type=int, nargs="+", default=[8, 16, 32, 64])
+    parser.add_argument("-c", "--channel", choices=["bsc", "fixed", "burst"], nargs="+", default=["bsc"])
+    parser.add_argument("-v", "--values", nargs="+", default=None,
+                        help="Kanal başına değerler, ör. bsc=1e-4,1e-3 burst=2,4 (tek kanalda sadece değerler "
+                             "verilebilir). bsc: hata olasılıkları, fixed: hata sayıları, burst: uzunluklar")
+    parser.add_argument("-n", "--trials", type=int, default=1_000_000)
+    parser.add_argument("-s", "--seed", type=int, default=0)
+    parser.add_argument("-w", "--workers", type=int, default=None)
+    parser.add_argument("--random-data", action="store_true")
+    parser.add_argument("--store", default=DEFAULT_STORE, help="Sonuç deposu dosyası")
+    args = parser.parse_args(argv)
+    try:
+        channel_values = parse_values(args.channel, args.values)
+        for channel, values in channel_values.items():
+            for value in values:
+                normalize_value(channel, value)
+    except ValueError as e:
+        parser.error(f"Geçersiz kanal değeri: {e}")
+
+    def progress(params, report, cached):
+        source = "önbellek" if cached else "hesaplandı"
+        print(f"d={params['d_bits']:<5} {params['channel']:<6} {params['value']:<8} "
+              f"FER={report['fer']:.3e} BER={report['post_ber']:.3e} "
+              f"yanlış düzeltme={report['miscorrection_rate']:.3e} ({source})", flush=True)
+
+    run_sweep(args.data_bits, channel_values, args.trials, seed=args.seed, workers=args.workers,
+              random_data=args.random_data, store=ResultStore(args.store), progress=progress)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,203 @@
+# Hamming SEC-DED Kapsamlı Hata Deseni Doğrulayıcı
+# Verilen d_bits için P0 dahil tüm pozisyonlardaki 1, 2 ve 3 bitlik hata desenlerini sayar:
+# her tek hatanın düzeltildiğini, her çift hatanın tespit edildiğini doğrular ve üçlü hataların
+# ne sıklıkla yanlış düzeltildiğini raporlar
+# Kod doğrusal olduğu için desenin sonucu sadece tablo indeksine bağlıdır; desenin indeksi, her hatalı bitin
+# tek başına verdiği indekslerin XOR'udur (Hamming: (pozisyon << 1) | 1, Hsiao: parity-kontrol sütunu)
+# Desenler NumPy üzerinde toplu olarak değerlendirilir ve kod çözücünün kendi sendrom tablosuna uygulanır
+# --code hsiao ile aynı doğrulama Hsiao kodu için yapılır
+
+import argparse
+import random
+
+import numpy as np
+
+from hamming_core import HammingSEC_DED, DOUBLE_DETECTED
+from hamming_hsiao import HsiaoSEC_DED
+
+CODES = {"hamming": HammingSEC_DED, "hsiao": HsiaoSEC_DED}
+
+
+def _columns(codec):
+    # String indeksi i'deki tek hatanın tablo indeksi
+    if isinstance(codec, HsiaoSEC_DED):
+        return np.array(codec.columns, dtype=np.int64)
+    return (np.arange(codec.total_bits + 1) << 1) | 1
+
+
+def _decoder_flips(codec):
+    # Kod çözücünün sendrom tablosunu diziye çevirir (Hamming'de indeks (sendrom << 1) | P0 uyuşmazlığı)
+    # Değer: çevrilen bitin string indeksi (0 = P0), çevirme yoksa -1; ikinci dizi çift hata tespitini gösterir
+    n = codec.total_bits
+    flips = np.full(len(codec._syndrome_actions), -1, dtype=np.int64)
+    detected = np.zeros(len(codec._syndrome_actions), dtype=bool)
+    for index, (_, error_pos, flip_mask) in enumerate(codec._syndrome_actions):
+        if flip_mask:
+            flips[index] = n - (flip_mask.bit_length() - 1)
+        detected[index] = error_pos == -2
+    return flips, detected
+
+
+def verify_singles(codec):
+    # Tüm tek hatalar: kod çözücü tam olarak hatalı biti çevirmeli
+    flips, _ = _decoder_flips(codec)
+    positions = np.arange(codec.total_bits + 1)
+    corrected = flips[_columns(codec)] == positions
+    return {"total": len(positions), "corrected": int(corrected.sum()),
+            "failures": positions[~corrected].tolist()[:10]}
+
+
+def verify_doubles(codec):
+    # Tüm çift hatalar (i < j): kod çözücü çift hata bildirmeli
+    flips, detected = _decoder_flips(codec)
+    width = codec.total_bits + 1
+    positions = np.arange(width)
+    columns = _columns(codec)
+    total = 0
+    ok = 0
+    failures = []
+    for i in range(width - 1):
+        j = positions[i + 1:]
+        hit = detected[columns[i] ^ columns[j]]
+        total += len(j)
+        ok += int(hit.sum())
+        if len(failures) < 10 and not hit.all():
+            failures.extend((i, int(x)) for x in j[~hit][:10 - len(failures)])
+    return {"total": total, "detected": ok, "failures": failures}
+
+
+def verify_triples(codec):
+    # Tüm üçlü hatalar (i < j < k)
+    # Kod çözücü tek hata sanıp geçerli bir biti (veya P0'ı) çevirirse yanlış düzeltme yapılmış olur
+    # Hamming'de sendrom kod uzunluğunu aşıyorsa hiçbir bit çevrilmez ama hata yine tek hata olarak bildirilir
+    # (geçersiz sendrom); Hsiao'da sütunlarla eşleşmeyen sendromlar düzeltilemez hata olarak tespit edilir
+    flips, detected = _decoder_flips(codec)
+    width = codec.total_bits + 1
+    columns = _columns(codec)
+    counts = {"total": 0, "miscorrected": 0, "invalid_syndrome": 0, "detected": 0}
+    for i in range(width - 2):
+        j = np.arange(i + 1, width - 1)[:, None]
+        k = np.arange(i + 2, width)[None, :]
+        mask = k > j
+        index = (columns[i] ^ columns[j] ^ columns[k])[mask]
+        flipped = flips[index]
+        hit = detected[index]
+        counts["total"] += len(flipped)
+        counts["detected"] += int(hit.sum())
+        counts["invalid_syndrome"] += int(((flipped < 0) & ~hit).sum())
+        counts["miscorrected"] += int((flipped >= 0).sum())
+    counts["miscorrection_rate"] = counts["miscorrected"] / counts["total"] if counts["total"] else 0.0
+    return counts
+
+
+def spot_check(codec, samples=200, seed=0):
+    # Sendrom tablosu sonuçlarını check_and_correct ile rastgele desenlerde karşılaştırır
+    # Tüm tek hatalar ve her ağırlık için samples adet rastgele desen denenir
+    rng = random.Random(seed)
+    width = codec.total_bits + 1
+    data = "".join(rng.choice("01") for _ in range(codec.d_bits))
+    codeword = codec.encode(data)
+    flips, _ = _decoder_flips(codec)
+    columns = _columns(codec).tolist()
+    patterns = [(i,) for i in range(width)]
+    for weight in (2, 3):
+        if width >= weight:
+            patterns += [tuple(rng.sample(range(width), weight)) for _ in range(samples)]
+    mismatches = 0
+    for pattern in patterns:
+        bits = list(codeword)
+        index = 0
+        for i in pattern:
+            bits[i] = "1" if bits[i] == "0" else "0"
+            index ^= columns[i]
+        result = codec.check_and_correct("".join(bits))
+        expected = list(bits)
+        flip = flips[index]
+        if flip >= 0:
+            expected[flip] = "1" if expected[flip] == "0" else "0"
+        # HammingSEC_DED düzeltilmiş kodu P0 olmadan döndürür
+        if result["corrected_code"] != "".join(expected)[-len(result["corrected_code"]):]:
+            mismatches += 1
+    return {"total": len(patterns), "mismatches": mismatches}
+
+
+def verify_engine(codec, decode, max_weight=2, seed=0):
+    # Toplu bir kod çözücüyü (decode(codec, kod dizisi) -> decode_batch sonucu) tüm tek ve çift
+    # hata desenlerinde çalıştırır; tek hatalarda veri, çift hatalarda durum beklenenle karşılaştırılır
+    # Desenler her seferinde bir satır (ilk hatalı bit i) için toplu olarak üretilir
+    rng = np.random.default_rng(seed)
+    width = codec.total_bits + 1
+    data = rng.integers(0, 2, (1, codec.d_bits), dtype=np.uint8)
+    codeword = codec.encode_batch(data)[0]
+
+    received = np.repeat(codeword[None, :], width, axis=0)
+    received[np.arange(width), np.arange(width)] ^= 1
+    result = decode(codec, received)
+    failures = int((result["corrected_data"] != data).any(axis=1).sum())
+    total = width
+
+    if max_weight >= 2:
+        for i in range(width - 1):
+            j = np.arange(i + 1, width)
+            received = np.repeat(codeword[None, :], len(j), axis=0)
+            received[:, i] ^= 1
+            received[np.arange(len(j)), j] ^= 1
+            result = decode(codec, received)
+            failures += int((result["status"] != DOUBLE_DETECTED).sum())
+            total += len(j)
+    return {"total": total, "failures": failures}
+
+
+def verify(d_bits, max_weight=3, engine=False, code="hamming"):
+    # Seçilen ağırlıklara kadar tüm desenleri doğrular ve raporu döndürür
+    codec = CODES[code](d_bits)
+    report = {"d_bits": d_bits, "code": code, "total_bits": codec.total_bits + 1,
+              "singles": verify_singles(codec), "spot_check": spot_check(codec)}
+    if max_weight >= 2:
+        report["doubles"] = verify_doubles(codec)
+    if max_weight >= 3:
+        report["triples"] = verify_triples(codec)
+    if engine:
+        report["batch_engine"] = verify_engine(codec, type(codec).decode_batch, min(max_weight, 2))
+        if code == "hamming":
+            from hamming_bitslice import decode_sliced
+            report["slice_engine"] = verify_engine(codec, decode_sliced, min(max_weight, 2))
+    report["ok"] = (report["singles"]["corrected"] == report["singles"]["total"]
+                    and report["spot_check"]["mismatches"] == 0
+                    and ("doubles" not in report or report["doubles"]["detected"] == report["doubles"]["total"])
+                    and all(report[key]["failures"] == 0 for key in ("batch_engine", "slice_engine") if key in report))
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Hamming SEC-DED 1/2/3 bitlik hata desenlerini kapsamlı doğrular")
+    parser.add_argument("-d", "--data-bits", type=int, nargs="+", default=[8, 16, 32, 64])
+    parser.add_argument("-w", "--max-weight", type=int, choices=[1, 2, 3], default=3)
+    parser.add_argument("--engine", action="store_true", help="Toplu ve bit dilimli (NumPy) kod çözücüleri de tüm desenlerde çalıştır")
+    parser.add_argument("--code", choices=list(CODES), default="hamming", help="Doğrulanacak kod türü")
+    args = parser.parse_args(argv)
+
+    all_ok = True
+    for d_bits in args.data_bits:
+        report = verify(d_bits, args.max_weight, args.engine, args.code)
+        all_ok &= report["ok"]
+        line = (f"d={d_bits:<6} n+1={report['total_bits']:<6} tek: {report['singles']['corrected']}/"
+                f"{report['singles']['total']} düzeltildi")
+        if "doubles" in report:
+            line += f", çift: {report['doubles']['detected']}/{report['doubles']['total']} tespit edildi"
+        if "triples" in report:
+            t = report["triples"]
+            line += (f", üçlü: {t['total']} desen, {t['miscorrected']} yanlış düzeltme "
+                     f"(%{100 * t['miscorrection_rate']:.1f}), {t['invalid_syndrome']} geçersiz sendrom")
+            if t["detected"]:
+                line += f", {t['detected']} tespit edildi"
+        if "batch_engine" in report:
+            line += f", toplu motor: {report['batch_engine']['failures']} hata"
+        if "slice_engine" in report:
+            line += f", bit dilimli motor: {report['slice_engine']['failures']} hata"
+        print(line + ("" if report["ok"] else "  <-- HATA"), flush=True)
+    return 0 if all_ok else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,6 @@
+# Modüller depo kökünde düz dosyalar olarak durur; testler onları doğrudan içe aktarır
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,82 @@
+# Kapsayıcı dosya: gidiş-dönüş, aralık okuma, doğrulama/tarama ve bozuk dosyalar
+
+import random
+
+import pytest
+
+from hamming_container import HEADER_SIZE, ContainerReader, write_container
+
+
+def _payload(size, seed=0):
+    return random.Random(seed).randbytes(size)
+
+
+def _write(path, data, **kwargs):
+    return write_container(str(path), [data[i:i + 1000] for i in range(0, len(data), 1000)], **kwargs)
+
+
+@pytest.mark.parametrize("code", ["hamming", "hsiao"])
+@pytest.mark.parametrize("d_bits", [16, 64])
+def test_round_trip_and_ranges(tmp_path, code, d_bits):
+    data = _payload(10000)
+    path = tmp_path / "data.hsc"
+    result = _write(path, data, d_bits=d_bits, code=code, block_words=64)
+    assert result["bytes"] == len(data)
+    with ContainerReader(str(path)) as reader:
+        assert len(reader) == len(data)
+        assert reader.read() == data
+        for start, stop in ((0, 1), (3, 4097), (9990, 20000), (5000, 5000)):
+            assert reader.read(start, stop) == data[start:stop]
+        report = reader.verify()
+    assert report["corrected"] == report["uncorrectable"] == 0
+    assert report["crc_errors"] == []
+
+
+def test_empty_container(tmp_path):
+    path = tmp_path / "empty.hsc"
+    _write(path, b"")
+    with ContainerReader(str(path)) as reader:
+        assert reader.read() == b""
+        assert reader.verify()["blocks"] == 0
+
+
+def test_single_error_corrected_and_scrubbed(tmp_path):
+    data = _payload(5000, seed=1)
+    path = tmp_path / "data.hsc"
+    _write(path, data, block_words=32)
+    raw = bytearray(path.read_bytes())
+    raw[HEADER_SIZE + 100] ^= 0x10
+    path.write_bytes(bytes(raw))
+    with ContainerReader(str(path)) as reader:
+        stats = {}
+        assert reader.read(stats=stats) == data
+        assert stats["corrected"] == 1
+    with ContainerReader(str(path), writable=True) as reader:
+        report = reader.verify(scrub=True)
+    assert report["corrected"] == 1
+    assert report["rewritten_blocks"] == 1
+    with ContainerReader(str(path)) as reader:
+        assert reader.verify()["corrected"] == 0
+
+
+def test_double_error_fails_crc(tmp_path):
+    path = tmp_path / "data.hsc"
+    _write(path, _payload(5000, seed=2), block_words=32)
+    raw = bytearray(path.read_bytes())
+    # Aynı kod kelimesinde (9 bayt) iki bit
+    raw[HEADER_SIZE] ^= 0x41
+    path.write_bytes(bytes(raw))
+    with ContainerReader(str(path)) as reader:
+        report = reader.verify()
+    assert report["uncorrectable"] == 1
+    assert report["crc_errors"] == [0]
+
+
+def test_truncated_and_corrupt_files_rejected(tmp_path):
+    path = tmp_path / "data.hsc"
+    _write(path, _payload(5000, seed=3), block_words=32)
+    raw = path.read_bytes()
+    for broken in (raw[:HEADER_SIZE - 1], raw[:-1], raw[:len(raw) // 2], b"XXXX" + raw[4:]):
+        path.write_bytes(broken)
+        with pytest.raises(ValueError):
+            ContainerReader(str(path))
@@ -0,0 +1,52 @@
+# Blok serpiştirici: tersinirlik ve patlama hatalarının tek hatalara dağıtılması
+
+import numpy as np
+import pytest
+
+from hamming_core import HammingSEC_DED, SINGLE_CORRECTED
+from hamming_batch import encode_batch, decode_batch
+from hamming_interleave import interleave, deinterleave
+
+
+@pytest.mark.parametrize("packed", [False, True])
+@pytest.mark.parametrize("depth", [1, 2, 5, 8])
+@pytest.mark.parametrize("rows", [1, 7, 40, 41])
+def test_round_trip(packed, depth, rows):
+    rng = np.random.default_rng(rows * depth)
+    width = 9 if packed else 72
+    words = rng.integers(0, 256 if packed else 2, (rows, width), dtype=np.uint8)
+    mixed = interleave(words, depth, packed)
+    assert mixed.shape == words.shape
+    assert (deinterleave(mixed, depth, packed) == words).all()
+
+
+def test_packed_matches_unpacked():
+    rng = np.random.default_rng(0)
+    bits = rng.integers(0, 2, (24, 72), dtype=np.uint8)
+    packed = interleave(np.packbits(bits, axis=1), 6, packed=True)
+    assert (np.unpackbits(packed, axis=1) == interleave(bits, 6)).all()
+
+
+def test_channel_order():
+    # Kanala önce tüm kelimelerin 0. biti gider
+    words = np.array([[1, 0, 0], [0, 0, 0]], dtype=np.uint8)
+    assert interleave(words, 2).ravel().tolist() == [1, 0, 0, 0, 0, 0]
+
+
+@pytest.mark.parametrize("depth", [4, 16])
+def test_burst_spread_to_single_errors(depth):
+    codec = HammingSEC_DED(32)
+    rng = np.random.default_rng(depth)
+    data = rng.integers(0, 2, (depth * 10, 32), dtype=np.uint8)
+    channel = interleave(encode_batch(codec, data), depth).ravel()
+    channel[100:100 + depth] ^= 1
+    result = decode_batch(codec, deinterleave(channel.reshape(-1, codec.total_bits + 1), depth))
+    assert (result["corrected_data"] == data).all()
+    assert int((result["status"] == SINGLE_CORRECTED).sum()) <= depth
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        interleave(np.zeros((4, 8), dtype=np.uint8), 0)
+    with pytest.raises(ValueError):
+        interleave(np.zeros(8, dtype=np.uint8), 2)
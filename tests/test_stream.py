@@ -0,0 +1,127 @@
+# Akış kodlayıcı: gidiş-dönüş, hata düzeltme, kesilme ve bozulma durumları
+
+import io
+import random
+
+import pytest
+
+import hamming_batch
+from hamming_core import HammingSEC_DED
+from hamming_stream import (STREAM_MAGIC, INTERLEAVED_MAGIC, encode_stream, decode_stream, read_stream_header,
+                            _stream_layout)
+
+
+def _payload(size, seed=0):
+    return random.Random(seed).randbytes(size)
+
+
+def _encode(d_bits, data, depth=1, chunk=7):
+    # Veriyi küçük parçalar halinde vererek parça sınırlarının da denenmesini sağlar
+    return b"".join(encode_stream(HammingSEC_DED(d_bits), [data[i:i + chunk] for i in range(0, len(data), chunk)],
+                                  depth))
+
+
+def _decode(encoded, chunk=5):
+    stream = io.BytesIO(encoded)
+    codec, depth = read_stream_header(stream)
+    body = stream.read()
+    stats = {}
+    data = b"".join(decode_stream(codec, [body[i:i + chunk] for i in range(0, len(body), chunk)], stats, depth))
+    return data, stats
+
+
+def _header_size(depth):
+    return len(STREAM_MAGIC) + 2 + (2 if depth > 1 else 0)
+
+
+def _flip(encoded, bit):
+    data = bytearray(encoded)
+    data[bit >> 3] ^= 0x80 >> (bit & 7)
+    return bytes(data)
+
+
+@pytest.mark.parametrize("d_bits", [8, 16, 64, 72, 1024])
+@pytest.mark.parametrize("depth", [1, 3])
+@pytest.mark.parametrize("size", [0, 1, 11, 12, 13, 1000])
+def test_round_trip(d_bits, depth, size):
+    data = _payload(size)
+    encoded = _encode(d_bits, data, depth)
+    assert encoded.startswith(INTERLEAVED_MAGIC if depth > 1 else STREAM_MAGIC)
+    decoded, stats = _decode(encoded)
+    assert decoded == data
+    assert stats["words"] == -(-size // (d_bits // 8))
+    assert stats["corrected"] == stats["uncorrectable"] == 0
+
+
+@pytest.mark.parametrize("depth", [1, 4])
+def test_scalar_path_matches_batch_path(monkeypatch, depth):
+    data = _payload(3000, seed=1)
+    batch = _encode(128, data, depth)
+    monkeypatch.setattr(hamming_batch, "MAX_DATA_BITS", 0)
+    assert _encode(128, data, depth) == batch
+    assert _decode(batch) == (data, {"words": 188, "corrected": 0, "uncorrectable": 0})
+
+
+@pytest.mark.parametrize("depth", [1, 4])
+def test_single_errors_corrected(depth):
+    data = _payload(2000, seed=2)
+    encoded = _encode(64, data, depth)
+    rng = random.Random(3)
+    _, code_bytes, _ = _stream_layout(HammingSEC_DED(64))
+    corrupted = encoded
+    # Her kod kelimesinde en fazla bir hata olsun diye her 4 kelimede bir bit çevrilir
+    start = _header_size(depth)
+    for word in range(0, (len(encoded) - start) // code_bytes, 4):
+        corrupted = _flip(corrupted, (start + word * code_bytes) * 8 + rng.randrange(72))
+    decoded, stats = _decode(corrupted)
+    assert decoded == data
+    assert stats["corrected"] > 0
+    assert stats["uncorrectable"] == 0
+
+
+def test_burst_corrected_with_interleaving():
+    data = _payload(4000, seed=4)
+    encoded = _encode(64, data, depth=8)
+    corrupted = encoded
+    # 8 derinlikte 8 bitlik patlama her kelimede tek bir hataya dönüşür
+    start = _header_size(8) * 8 + 9 * 8 * 72 + 5
+    for bit in range(start, start + 8):
+        corrupted = _flip(corrupted, bit)
+    decoded, stats = _decode(corrupted)
+    assert decoded == data
+    assert stats["corrected"] == 8
+
+
+def test_double_error_reported():
+    data = _payload(800, seed=5)
+    encoded = _encode(64, data)
+    start = _header_size(1) * 8
+    corrupted = _flip(_flip(encoded, start + 3), start + 40)
+    _, stats = _decode(corrupted)
+    assert stats["uncorrectable"] == 1
+
+
+@pytest.mark.parametrize("d_bits", [8, 64])
+@pytest.mark.parametrize("depth", [1, 2])
+@pytest.mark.parametrize("data", [bytes(300), _payload(300, seed=6)], ids=["zeros", "random"])
+def test_truncation_detected(d_bits, depth, data):
+    encoded = _encode(d_bits, data, depth)
+    _, code_bytes, _ = _stream_layout(HammingSEC_DED(d_bits))
+    # Kelime sınırlarında ve kelime ortasında kesilen her akış reddedilmelidir
+    for cut in list(range(code_bytes, len(encoded) - _header_size(depth), code_bytes)) + [1, code_bytes + 1]:
+        with pytest.raises(ValueError):
+            _decode(encoded[:len(encoded) - cut])
+
+
+def test_appended_words_detected():
+    encoded = _encode(64, _payload(100, seed=7))
+    _, code_bytes, _ = _stream_layout(HammingSEC_DED(64))
+    with pytest.raises(ValueError):
+        _decode(encoded + encoded[-code_bytes:])
+
+
+def test_invalid_headers_rejected():
+    encoded = _encode(64, _payload(100))
+    for header in (b"", b"HSD", b"XXXX\x00\x40", b"HSD\x01\x00\x00", b"HSD\x01\x00\x41", b"HSD\x02\x00\x40\x00\x00"):
+        with pytest.raises(ValueError):
+            _decode(header + encoded[_header_size(1):])
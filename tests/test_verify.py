@@ -0,0 +1,19 @@
+# Kapsamlı doğrulayıcı: küçük boyutlarda tüm 1 ve 2 bitlik desenler ve toplu motorlar
+
+import pytest
+
+from hamming_verify import verify
+
+
+@pytest.mark.parametrize("code", ["hamming", "hsiao"])
+@pytest.mark.parametrize("d_bits", [1, 4, 8, 16, 32])
+def test_exhaustive(code, d_bits):
+    report = verify(d_bits, max_weight=3, engine=True, code=code)
+    assert report["ok"]
+    assert report["singles"]["corrected"] == report["singles"]["total"] == report["total_bits"]
+    width = report["total_bits"]
+    assert report["doubles"]["total"] == width * (width - 1) // 2
+    assert report["triples"]["total"] == width * (width - 1) * (width - 2) // 6
+    assert report["batch_engine"]["failures"] == 0
+    if code == "hamming":
+        assert report["slice_engine"]["failures"] == 0